@@ -5,19 +5,50 @@ This package provides classes and utilities for reading and analyzing
 Git repository data including commits, branches, files, and contributors.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "GitDecomposer Team"
 
-from .analyzers import (
-    BranchAnalyzer,
-    CommitAnalyzer,
-    ContributorAnalyzer,
-    FileAnalyzer,
-    advanced_metrics,
-)
-from .core import GitRepository
-from .git_metrics import GitMetrics
-from .viz import VisualizationEngine
+if TYPE_CHECKING:
+    from .analyzers import (
+        BranchAnalyzer,
+        CommitAnalyzer,
+        ContributorAnalyzer,
+        FileAnalyzer,
+        advanced_metrics,
+    )
+    from .core import GitRepository
+    from .git_metrics import GitMetrics
+    from .viz import VisualizationEngine
+
+# Public names are resolved on first access so that entry points such as
+# ``gitdecomposer --help`` do not pay for importing pandas and plotly.
+_LAZY_IMPORTS = {
+    "GitRepository": ".core",
+    "CommitAnalyzer": ".analyzers",
+    "FileAnalyzer": ".analyzers",
+    "ContributorAnalyzer": ".analyzers",
+    "BranchAnalyzer": ".analyzers",
+    "GitMetrics": ".git_metrics",
+    "advanced_metrics": ".analyzers",
+    "VisualizationEngine": ".viz",
+}
+
+
+def __getattr__(name):
+    """Import public names lazily (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "GitRepository",
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..core.git_repository import GitRepository
@@ -27,6 +28,14 @@ from ..models.file import (
 
 logger = logging.getLogger(__name__)
 
+# (column, threshold, recommendation) rules applied to file hotspots
+_HOTSPOT_RECOMMENDATIONS = (
+    ("commit_count", 50, "Consider refactoring - high change frequency"),
+    ("total_lines_changed", 1000, "Large cumulative changes - review complexity"),
+    ("unique_authors", 5, "Many contributors - ensure good documentation"),
+    ("avg_lines_per_commit", 100, "Large commits - consider smaller changes"),
+)
+
 
 class FileAnalyzer:
     """
@@ -77,12 +86,12 @@ class FileAnalyzer:
         logger.info(f"Analyzed {len(df)} file extensions")
         return df
 
-    def get_most_changed_files(self, top_n: int = 20) -> pd.DataFrame:
+    def get_most_changed_files(self, top_n: Optional[int] = 20) -> pd.DataFrame:
         """
         Get files that have been modified most frequently.
 
         Args:
-            top_n (int): Number of top files to return
+            top_n (Optional[int]): Number of top files to return, or None for every changed file
 
         Returns:
             pd.DataFrame: DataFrame with file paths and modification counts
@@ -91,9 +100,7 @@ class FileAnalyzer:
         file_changes = Counter()
 
         for commit in commits:
-            changed_files = self.git_repo.get_changed_files(commit.hexsha)
-            for file_path in changed_files.keys():
-                file_changes[file_path] += 1
+            file_changes.update(self.git_repo.get_changed_files(commit.hexsha).keys())
 
         top_files = file_changes.most_common(top_n)
         df = pd.DataFrame(top_files, columns=["file_path", "change_count"])
@@ -353,18 +360,9 @@ class FileAnalyzer:
             pd.DataFrame: Detailed file change frequency analysis
         """
         commits = self.git_repo.get_all_commits()
-        file_metrics = defaultdict(
-            lambda: {
-                "commit_count": 0,
-                "total_lines_added": 0,
-                "total_lines_deleted": 0,
-                "total_lines_changed": 0,
-                "first_change": None,
-                "last_change": None,
-                "authors": set(),
-            }
-        )
 
+        # One (file, date, author, added, deleted) row per file touched by each commit
+        changes = []
         for commit in commits:
             commit_date = commit.committed_date
             changed_files = self.git_repo.get_changed_files(commit.hexsha)
@@ -372,79 +370,73 @@ class FileAnalyzer:
             # Get detailed stats for this commit
             try:
                 commit_stats = commit.stats
+                author = commit.author.name
                 for file_path in changed_files.keys():
-                    file_metrics[file_path]["commit_count"] += 1
-                    file_metrics[file_path]["authors"].add(commit.author.name)
-
-                    # Update date range
-                    if (
-                        file_metrics[file_path]["first_change"] is None
-                        or commit_date < file_metrics[file_path]["first_change"]
-                    ):
-                        file_metrics[file_path]["first_change"] = commit_date
-
-                    if (
-                        file_metrics[file_path]["last_change"] is None
-                        or commit_date > file_metrics[file_path]["last_change"]
-                    ):
-                        file_metrics[file_path]["last_change"] = commit_date
+                    added = deleted = 0
 
                     # Get line changes for this specific file
                     if file_path in commit_stats.files:
                         file_stat = commit_stats.files[file_path]
                         # Ensure file_stat is a dictionary and has the expected keys
                         if isinstance(file_stat, dict) and "insertions" in file_stat and "deletions" in file_stat:
-                            file_metrics[file_path]["total_lines_added"] += file_stat["insertions"]
-                            file_metrics[file_path]["total_lines_deleted"] += file_stat["deletions"]
-                            file_metrics[file_path]["total_lines_changed"] += (
-                                file_stat["insertions"] + file_stat["deletions"]
-                            )
+                            added = file_stat["insertions"]
+                            deleted = file_stat["deletions"]
                         else:
                             logger.debug(f"Unexpected file_stat format for {file_path}: {type(file_stat)}")
 
+                    changes.append((file_path, commit_date, author, added, deleted))
+
             except Exception as e:
                 logger.warning(f"Error processing commit {commit.hexsha}: {e}")
                 continue
 
-        # Convert to DataFrame
-        data = []
-        for file_path, metrics in file_metrics.items():
-            if metrics["commit_count"] == 0:
-                continue
-
-            # Calculate frequency metrics
-            if metrics["first_change"] and metrics["last_change"]:
-                days_active = (metrics["last_change"] - metrics["first_change"]) / 86400  # Convert to days
-                commit_frequency = metrics["commit_count"] / max(days_active, 1)
-                line_frequency = metrics["total_lines_changed"] / max(days_active, 1)
-            else:
-                commit_frequency = 0
-                line_frequency = 0
+        if not changes:
+            logger.info("Analyzed change frequency for 0 files")
+            return pd.DataFrame()
 
-            data.append(
-                {
-                    "file_path": file_path,
-                    "extension": Path(file_path).suffix.lower() or "<no extension>",
-                    "commit_count": metrics["commit_count"],
-                    "total_lines_added": metrics["total_lines_added"],
-                    "total_lines_deleted": metrics["total_lines_deleted"],
-                    "total_lines_changed": metrics["total_lines_changed"],
-                    "unique_authors": len(metrics["authors"]),
-                    "days_active": (days_active if metrics["first_change"] and metrics["last_change"] else 0),
-                    "commits_per_day": commit_frequency,
-                    "lines_changed_per_day": line_frequency,
-                    "avg_lines_per_commit": (
-                        metrics["total_lines_changed"] / metrics["commit_count"] if metrics["commit_count"] > 0 else 0
-                    ),
-                    "change_intensity": metrics["total_lines_changed"] * metrics["commit_count"],  # Combined metric
-                    "first_change_date": metrics["first_change"],
-                    "last_change_date": metrics["last_change"],
-                }
+        # Aggregate every file in a single groupby pass
+        df = (
+            pd.DataFrame.from_records(changes, columns=["file_path", "date", "author", "added", "deleted"])
+            .groupby("file_path", sort=False)
+            .agg(
+                commit_count=("date", "size"),
+                total_lines_added=("added", "sum"),
+                total_lines_deleted=("deleted", "sum"),
+                unique_authors=("author", "nunique"),
+                first_change_date=("date", "min"),
+                last_change_date=("date", "max"),
             )
+            .reset_index()
+        )
 
-        df = pd.DataFrame(data)
-        if not df.empty:
-            df = df.sort_values("change_intensity", ascending=False)
+        # Calculate frequency metrics
+        df["extension"] = df["file_path"].map(lambda x: Path(x).suffix.lower() or "<no extension>")
+        df["total_lines_changed"] = df["total_lines_added"] + df["total_lines_deleted"]
+        df["days_active"] = (df["last_change_date"] - df["first_change_date"]) / 86400  # Convert to days
+        active_days = df["days_active"].clip(lower=1)
+        df["commits_per_day"] = df["commit_count"] / active_days
+        df["lines_changed_per_day"] = df["total_lines_changed"] / active_days
+        df["avg_lines_per_commit"] = df["total_lines_changed"] / df["commit_count"]
+        df["change_intensity"] = df["total_lines_changed"] * df["commit_count"]  # Combined metric
+
+        df = df[
+            [
+                "file_path",
+                "extension",
+                "commit_count",
+                "total_lines_added",
+                "total_lines_deleted",
+                "total_lines_changed",
+                "unique_authors",
+                "days_active",
+                "commits_per_day",
+                "lines_changed_per_day",
+                "avg_lines_per_commit",
+                "change_intensity",
+                "first_change_date",
+                "last_change_date",
+            ]
+        ].sort_values("change_intensity", ascending=False)
 
         logger.info(f"Analyzed change frequency for {len(df)} files")
         return df
@@ -552,54 +544,31 @@ class FileAnalyzer:
         if frequency_data.empty:
             return pd.DataFrame()
 
-        # Calculate hotspot score based on multiple factors
-        def calculate_hotspot_score(row):
-            # Normalize metrics (0-1 scale)
-            max_commits = frequency_data["commit_count"].max()
-            max_lines = frequency_data["total_lines_changed"].max()
-            max_authors = frequency_data["unique_authors"].max()
+        # Calculate hotspot score based on multiple factors, normalizing each metric to a 0-1 scale
+        def normalized(column):
+            peak = frequency_data[column].max()
+            return frequency_data[column] / peak if peak > 0 else 0
 
-            commit_score = row["commit_count"] / max_commits if max_commits > 0 else 0
-            lines_score = row["total_lines_changed"] / max_lines if max_lines > 0 else 0
-            author_score = row["unique_authors"] / max_authors if max_authors > 0 else 0
-
-            # Weighted combination
-            hotspot_score = (commit_score * 0.4 + lines_score * 0.4 + author_score * 0.2) * 100
-            return hotspot_score
-
-        frequency_data["hotspot_score"] = frequency_data.apply(calculate_hotspot_score, axis=1)
+        # Weighted combination, computed for all files at once
+        frequency_data["hotspot_score"] = (
+            normalized("commit_count") * 0.4
+            + normalized("total_lines_changed") * 0.4
+            + normalized("unique_authors") * 0.2
+        ) * 100
 
         # Risk assessment
-        def assess_risk(row):
-            score = row["hotspot_score"]
-            if score >= 80:
-                return "Critical"
-            elif score >= 60:
-                return "High"
-            elif score >= 40:
-                return "Medium"
-            elif score >= 20:
-                return "Low"
-            else:
-                return "Minimal"
-
-        frequency_data["risk_level"] = frequency_data.apply(assess_risk, axis=1)
-
-        # Add recommendations
-        def generate_recommendation(row):
-            recommendations = []
-            if row["commit_count"] > 50:
-                recommendations.append("Consider refactoring - high change frequency")
-            if row["total_lines_changed"] > 1000:
-                recommendations.append("Large cumulative changes - review complexity")
-            if row["unique_authors"] > 5:
-                recommendations.append("Many contributors - ensure good documentation")
-            if row["avg_lines_per_commit"] > 100:
-                recommendations.append("Large commits - consider smaller changes")
-
-            return "; ".join(recommendations) if recommendations else "File appears stable"
+        score = frequency_data["hotspot_score"]
+        frequency_data["risk_level"] = np.select(
+            [score >= 80, score >= 60, score >= 40, score >= 20],
+            ["Critical", "High", "Medium", "Low"],
+            default="Minimal",
+        )
 
-        frequency_data["recommendations"] = frequency_data.apply(generate_recommendation, axis=1)
+        # Add recommendations, one column comparison per rule
+        recommendations = pd.Series("", index=frequency_data.index)
+        for column, limit, recommendation in _HOTSPOT_RECOMMENDATIONS:
+            recommendations += np.where(frequency_data[column] > limit, recommendation + "; ", "")
+        frequency_data["recommendations"] = recommendations.str[:-2].where(recommendations != "", "File appears stable")
 
         # Sort by hotspot score
         hotspots = frequency_data.sort_values("hotspot_score", ascending=False)
@@ -174,17 +174,16 @@ class AdvancedMetrics:
 
             # Calculate overall metrics
             if not file_maintainability.empty:
-                overall_score = file_maintainability["maintainability_score"].mean()
+                scores = file_maintainability["maintainability_score"]
+                overall_score = scores.mean()
 
                 # Maintainability factors
                 factors = {
                     "avg_commits_per_file": file_maintainability["commit_count"].mean(),
                     "avg_authors_per_file": file_maintainability["author_count"].mean(),
                     "avg_complexity": file_maintainability["complexity_score"].mean(),
-                    "files_needing_attention": len(
-                        file_maintainability[file_maintainability["maintainability_score"] < 40]
-                    ),
-                    "excellent_files": len(file_maintainability[file_maintainability["maintainability_score"] >= 80]),
+                    "files_needing_attention": int((scores < 40).sum()),
+                    "excellent_files": int((scores >= 80).sum()),
                     "total_files_analyzed": len(file_maintainability),
                 }
 
@@ -24,8 +24,6 @@ from rich.traceback import install as rich_traceback_install
 # Install rich traceback handler
 rich_traceback_install()
 
-from gitdecomposer import GitMetrics, GitRepository
-
 
 class CLI:
     """A class to encapsulate the command-line interface logic."""
@@ -53,6 +51,8 @@ class CLI:
             self.console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
             sys.exit(1)
         finally:
+            if self.metrics:
+                self.metrics.close()
             if self.git_repo:
                 self.git_repo.close()
 
@@ -77,9 +77,12 @@ class CLI:
         if self.args.verbose:
             self.console.print(f"Initializing repository: {self.repo_path}")
 
+        # Deferred so that argument parsing and --help do not load pandas/plotly
+        from gitdecomposer import GitMetrics, GitRepository
+
         with self.console.status("[bold green]Analyzing repository...[/bold green]") as status:
             self.git_repo = GitRepository(str(self.repo_path))
-            self.metrics = GitMetrics(self.git_repo)
+            self.metrics = GitMetrics(self.git_repo, cache_dir=self.args.cache_dir)
 
             status.update("Generating repository summary...")
             summary = self.metrics.generate_repository_summary()
@@ -208,16 +211,28 @@ class CLI:
             transient=True,
         ) as progress:
             task = progress.add_task("Creating visualizations...", total=len(visualizations_to_create))
+            created = []
             for name, (func, filename) in visualizations_to_create.items():
                 progress.update(task, description=f"Creating {name}...")
                 try:
                     path = html_dir / filename
                     func(str(path))
-                    self.console.print(f"  ✓ Created: [link=file://{path.resolve()}]{path}[/link]")
+                    created.append((name, path))
                 except Exception as e:
                     self.console.print(f"  ✗ Failed to create {name}: [red]{e}[/red]")
                 progress.update(task, advance=1)
 
+        # Advanced reports are written in the background; wait for them before listing any
+        try:
+            self.metrics.report_generator.advanced_report_generator.flush()
+        except Exception as e:
+            self.console.print(f"  ✗ Failed to write advanced reports: [red]{e}[/red]")
+        for name, path in created:
+            if path.exists():
+                self.console.print(f"  ✓ Created: [link=file://{path.resolve()}]{path}[/link]")
+            else:
+                self.console.print(f"  ✗ Failed to create {name}: [red]report was not written[/red]")
+
         # Generate the index page that links to all reports
         try:
             self.metrics.create_index_page_only(str(self.output_dir))
@@ -272,6 +287,11 @@ Examples:
         help="Skip creating visualization files (faster analysis)",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse advanced reports saved here by earlier runs while no branch has moved (e.g. ~/.gitdecomposer/cache)",
+    )
+
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
 
     args = parser.parse_args()
@@ -2,10 +2,11 @@
 GitRepository module for handling Git repository operations.
 """
 
+import inspect
 import logging
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 # Try to import GitPython, but don't hard-fail at import time so tests can patch Repo
 try:  # pragma: no cover - environment dependent
@@ -66,6 +67,10 @@ class GitRepository:
         except InvalidGitRepositoryError as e:
             raise InvalidGitRepositoryError(f"Invalid Git repository at {self.repo_path}: {e}")
 
+        # Commit lists shared by every analyzer, valid while the refs they were walked from stay put
+        self._commits_cache: Dict[tuple, List[Commit]] = {}
+        self._commits_cache_refs: Optional[str] = None
+
         logger.info(f"Initialized GitRepository for: {self.repo_path}")
 
     @property
@@ -100,7 +105,20 @@ class GitRepository:
 
         Returns:
             List[Commit]: List of commit objects
+
+        The history is walked once per set of refs; later calls with the same
+        arguments return a copy of the cached list until a ref moves.
         """
+        refs = self.refs_fingerprint()
+        if refs is None or refs != self._commits_cache_refs:
+            self._commits_cache.clear()
+            self._commits_cache_refs = refs
+
+        key = (branch, max_count)
+        cached = self._commits_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         try:
             if branch:
                 commits = list(self.repo.iter_commits(branch, max_count=max_count))
@@ -108,11 +126,25 @@ class GitRepository:
                 commits = list(self.repo.iter_commits("--all", max_count=max_count))
 
             logger.info(f"Retrieved {len(commits)} commits")
-            return commits
         except Exception as e:
             logger.error(f"Error retrieving commits: {e}")
             return []
 
+        if refs is not None:
+            self._commits_cache[key] = commits
+        return list(commits)
+
+    def refs_fingerprint(self) -> Optional[str]:
+        """Return the SHAs HEAD and all refs point at, or None if they cannot be resolved.
+
+        The value changes whenever any branch, tag or HEAD moves, so it identifies
+        the history that ``get_all_commits`` walks.
+        """
+        try:
+            return self.repo.git.rev_parse("HEAD", "--all")
+        except Exception:
+            return None
+
     def get_branches(self, remote: bool = False) -> List[str]:
         """
         Get all branch names.
@@ -266,7 +298,8 @@ class GitRepository:
             # Get basic info with error handling for each component
             total_commits = 0
             try:
-                total_commits = len(list(self.repo.iter_commits("--all")))
+                # Let git count the commits instead of building a Commit object for each one
+                total_commits = int(self.repo.git.rev_list("--all", "--count"))
             except Exception as e:
                 logger.warning(f"Could not count commits: {e}")
 
@@ -328,8 +361,46 @@ class GitRepository:
             logger.error(f"Error getting repository stats: {e}")
             return {}
 
+    def reopen(self) -> "GitRepository":
+        """
+        Open a second, independent handle on this repository.
+
+        A GitPython ``Repo`` keeps persistent ``git cat-file`` pipes, so one handle
+        must not be used from several threads at once.
+
+        Returns:
+            GitRepository: New handle; close it when done
+        """
+        return GitRepository(str(self.repo_path))
+
     def close(self):
         """Close the repository connection."""
         if hasattr(self, "repo"):
             self.repo.close()
             logger.info("Repository connection closed")
+
+
+def is_analyzer_method(fn: Callable[..., Any], git_repo: GitRepository) -> bool:
+    """Return True if ``fn`` is a method of an analyzer bound to ``git_repo``."""
+    return inspect.ismethod(fn) and getattr(fn.__self__, "git_repo", None) is git_repo
+
+
+def call_on_new_handle(method: Callable[..., Any], *args: Any) -> Any:
+    """
+    Call an analyzer method on a fresh analyzer with its own repository handle.
+
+    Concurrent workers use this instead of calling ``method`` directly, so no two
+    threads share a ``Repo``. ``method`` must satisfy :func:`is_analyzer_method`.
+
+    Args:
+        method: Bound analyzer method, e.g. ``file_analyzer.get_most_changed_files``
+        *args: Arguments passed to the method
+
+    Returns:
+        Any: The method's result
+    """
+    handle = method.__self__.git_repo.reopen()
+    try:
+        return getattr(type(method.__self__)(handle), method.__name__)(*args)
+    finally:
+        handle.close()
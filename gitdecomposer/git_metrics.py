@@ -28,19 +28,21 @@ class GitMetrics:
     a unified interface for repository insights and visualizations.
     """
 
-    def __init__(self, git_repo: GitRepository):
+    def __init__(self, git_repo: GitRepository, cache_dir: Optional[str] = None):
         """
         Initialize GitMetrics with all service components.
 
         Args:
             git_repo (GitRepository): GitRepository instance
+            cache_dir (Optional[str]): Directory for reusing saved advanced reports
+                across runs while no ref has moved; disabled when None
         """
         self.git_repo = git_repo
 
         # Initialize core services
         self.data_aggregator = DataAggregator(git_repo)
         self.dashboard_generator = DashboardGenerator(git_repo)
-        self.report_generator = ReportGenerator(git_repo)
+        self.report_generator = ReportGenerator(git_repo, cache_dir=cache_dir)
         self.export_service = ExportService(git_repo)
         self.advanced_analytics = AdvancedAnalytics(git_repo)
 
@@ -51,6 +53,10 @@ class GitMetrics:
         self.branch_analyzer = self.data_aggregator.branch_analyzer
         # Advanced metrics can be accessed via advanced_analytics.advanced_metrics module
 
+    def close(self):
+        """Wait for report writes still in progress and release the services' background threads."""
+        self.report_generator.close()
+
     # Data Aggregation Methods (delegate to DataAggregator)
 
     def get_enhanced_repository_summary(self) -> Dict[str, Any]:
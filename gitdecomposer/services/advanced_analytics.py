@@ -6,9 +6,18 @@ including technical debt, repository health, and predictive analytics.
 """
 
 import logging
-from typing import Dict, Optional
-
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
 from plotly.subplots import make_subplots
 
 from ..analyzers import (
@@ -23,6 +32,119 @@ from ..core import GitRepository
 logger = logging.getLogger(__name__)
 
 
+# Subplot grids shared by every dashboard call. make_subplots fills in the default keys of
+# each spec in place, so the specs are passed as fresh copies made by _fresh_specs.
+_TECHNICAL_DEBT_TITLES = (
+    "Technical Debt Trend",
+    "Maintainability Score",
+    "Test Coverage",
+    "Code Churn Analysis",
+    "Debt Distribution",
+    "Risk Assessment",
+)
+_TECHNICAL_DEBT_SPECS = (
+    ({"secondary_y": False}, {"type": "indicator"}),
+    ({"type": "pie"}, {"secondary_y": False}),
+    ({"secondary_y": False}, {"type": "indicator"}),
+)
+_REPOSITORY_HEALTH_TITLES = (
+    "Commit Velocity",
+    "Bug Fix Ratio",
+    "Test Coverage",
+    "Documentation Ratio",
+    "Maintainability Trend",
+    "Overall Health Score",
+)
+_REPOSITORY_HEALTH_SPECS = (
+    ({"secondary_y": False}, {"type": "indicator"}, {"type": "indicator"}),
+    ({"type": "indicator"}, {"secondary_y": False}, {"type": "indicator"}),
+)
+_PREDICTIVE_MAINTENANCE_TITLES = (
+    "Velocity Forecast",
+    "Debt Accumulation Prediction",
+    "High-Risk Files",
+    "Maintenance Recommendations",
+)
+_VELOCITY_FORECASTING_TITLES = ("Velocity Trend", "Velocity Distribution", "Team Productivity", "Forecasting")
+_VELOCITY_FORECASTING_SPECS = (
+    ({"secondary_y": False}, {"type": "histogram"}),
+    ({"type": "indicator"}, {"secondary_y": False}),
+)
+# Distinct error messages whose figures each instance keeps for reuse
+_MAX_ERROR_FIGURES = 16
+# File name plotly expects for the bundle shared by reports in one directory
+_PLOTLYJS_BUNDLE = "plotly.min.js"
+
+# Serializes the check-then-write of the shared bundle between report threads
+_bundle_lock = threading.Lock()
+
+
+def _fresh_specs(specs: Tuple[Tuple[Dict[str, Any], ...], ...]) -> List[List[Dict[str, Any]]]:
+    """Return a copy of a specs constant for make_subplots, which fills in default keys in place."""
+    return [[dict(spec) for spec in row] for row in specs]
+
+
+def _write_plotlyjs_bundle(directory: str) -> None:
+    """Write ``plotly.min.js`` into a directory unless it is already there.
+
+    The bundle is written to a temporary file and moved into place, so a report
+    written alongside it never sees a partial copy.
+    """
+    bundle_path = os.path.join(directory, _PLOTLYJS_BUNDLE)
+    with _bundle_lock:
+        if os.path.exists(bundle_path):
+            return
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(get_plotlyjs())
+            os.replace(temp_path, bundle_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def _write_html(fig: go.Figure, path: str) -> None:
+    """Save a figure as HTML that loads ``plotly.min.js`` from its own directory.
+
+    The advanced reports are written side by side, so they share one copy of the
+    plotly.js bundle instead of each embedding several megabytes of it. The bundle
+    is put in place first, so plotly finds it and does not write its own copy.
+    """
+    _write_plotlyjs_bundle(os.path.dirname(path) or ".")
+    fig.write_html(path, include_plotlyjs="directory")
+
+
+def _gauge(
+    value: float,
+    title: str,
+    bar_color: str,
+    steps: List[Tuple[float, float, str]],
+    axis_range: Tuple[Optional[float], float] = (0, 100),
+    threshold: Optional[float] = None,
+) -> go.Indicator:
+    """Build a gauge indicator whose background ``steps`` are ``(low, high, color)`` bands."""
+    gauge = {
+        "axis": {"range": list(axis_range)},
+        "bar": {"color": bar_color},
+        "steps": [{"range": [low, high], "color": color} for low, high, color in steps],
+    }
+    if threshold is not None:
+        gauge["threshold"] = {"line": {"color": "red", "width": 4}, "thickness": 0.75, "value": threshold}
+    return go.Indicator(
+        mode="gauge+number",
+        value=value,
+        domain={"x": [0, 1], "y": [0, 1]},
+        title={"text": title},
+        gauge=gauge,
+    )
+
+
+def _column(data: pd.DataFrame, name: str, fallback: Any) -> Any:
+    """Return column ``name`` of ``data`` as a numpy array, or ``fallback`` if the frame has no such column."""
+    return data[name].to_numpy() if name in data.columns else fallback
+
+
 class AdvancedAnalytics:
     """
     Service for advanced analytics and predictive metrics.
@@ -31,22 +153,84 @@ class AdvancedAnalytics:
     by GitMetrics, providing clean separation of concerns.
     """
 
-    def __init__(self, git_repo: GitRepository):
+    def __init__(self, git_repo: GitRepository, parallel_reports: bool = False):
         """
-        Initialize AdvancedAnalytics with analyzer instances.
+        Initialize AdvancedAnalytics.
+
+        Analyzers are created on first access, so a caller that renders a single
+        dashboard only pays for what it uses.
 
         Args:
             git_repo (GitRepository): GitRepository instance
+            parallel_reports (bool): Build and write the reports of
+                ``generate_all_advanced_reports`` concurrently. Analyzer calls are
+                still made one at a time, so the repository is never shared
+                between threads.
         """
         self.git_repo = git_repo
-        self.commit_analyzer = CommitAnalyzer(git_repo)
-        self.file_analyzer = FileAnalyzer(git_repo)
-        self.contributor_analyzer = ContributorAnalyzer(git_repo)
-        self.branch_analyzer = BranchAnalyzer(git_repo)
-        self.advanced_metrics = legacy_advanced_metrics.AdvancedMetrics(git_repo)
-        # Advanced metrics can be accessed via advanced_metrics.create_metric_analyzer()
+        self.parallel_reports = parallel_reports
+        # Analyzer results shared between dashboards, keyed by (name, args), for the HEAD in _cache_head
+        self._cache: Dict[Tuple[str, Tuple[Any, ...]], Any] = {}
+        self._cache_head: Optional[str] = None
+        self._cache_lock = threading.Lock()
+        # Error figures built by this instance, keyed by message
+        self._error_figures = lru_cache(maxsize=_MAX_ERROR_FIGURES)(self._build_error_figure)
+
+        logger.info("AdvancedAnalytics initialized")
+
+    @cached_property
+    def commit_analyzer(self) -> CommitAnalyzer:
+        """Commit analyzer, created on first use."""
+        return CommitAnalyzer(self.git_repo)
+
+    @cached_property
+    def file_analyzer(self) -> FileAnalyzer:
+        """File analyzer, created on first use."""
+        return FileAnalyzer(self.git_repo)
+
+    @cached_property
+    def contributor_analyzer(self) -> ContributorAnalyzer:
+        """Contributor analyzer, created on first use."""
+        return ContributorAnalyzer(self.git_repo)
+
+    @cached_property
+    def branch_analyzer(self) -> BranchAnalyzer:
+        """Branch analyzer, created on first use."""
+        return BranchAnalyzer(self.git_repo)
+
+    @cached_property
+    def advanced_metrics(self) -> legacy_advanced_metrics.AdvancedMetrics:
+        """Legacy advanced metrics calculator, created on first use."""
+        return legacy_advanced_metrics.AdvancedMetrics(self.git_repo)
+
+    def _head_sha(self) -> Optional[str]:
+        """Return the sha of the repository HEAD, or None if it cannot be resolved."""
+        try:
+            head_sha = self.git_repo.repo.head.commit.hexsha
+        except Exception:
+            return None
+        return head_sha if isinstance(head_sha, str) else None
 
-        logger.info("AdvancedAnalytics initialized with all analyzers")
+    def _cached(self, key: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Return an analyzer result, computing it only the first time it is requested.
+
+        Cached results are dropped automatically when HEAD moves to a new commit.
+        HEAD is resolved under the lock too, since it reads from the shared ``Repo``.
+        """
+        cache_key = (key, args)
+        with self._cache_lock:
+            head_sha = self._head_sha()
+            if head_sha != self._cache_head:
+                self._cache.clear()
+                self._cache_head = head_sha
+            if cache_key not in self._cache:
+                self._cache[cache_key] = fn(*args)
+            return self._cache[cache_key]
+
+    def clear_cache(self) -> None:
+        """Drop cached analyzer results, e.g. after the repository has changed."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def create_technical_debt_dashboard(self, save_path: Optional[str] = None) -> go.Figure:
         """
@@ -60,29 +244,18 @@ class AdvancedAnalytics:
         """
         try:
             # Get technical debt data
-            debt_analysis = self.advanced_metrics.calculate_technical_debt_accumulation()
-            maintainability = self.advanced_metrics.calculate_maintainability_index()
-            test_ratio = self.advanced_metrics.calculate_test_to_code_ratio()
+            debt_analysis = self._cached("technical_debt", self.advanced_metrics.calculate_technical_debt_accumulation)
+            maintainability = self._cached("maintainability", self.advanced_metrics.calculate_maintainability_index)
+            test_ratio = self._cached("test_to_code_ratio", self.advanced_metrics.calculate_test_to_code_ratio)
 
-            churn_analysis = self.file_analyzer.get_code_churn_analysis()
+            churn_analysis = self._cached("code_churn", self.file_analyzer.get_code_churn_analysis)
 
             # Create subplots for technical debt dashboard
             fig = make_subplots(
                 rows=3,
                 cols=2,
-                subplot_titles=[
-                    "Technical Debt Trend",
-                    "Maintainability Score",
-                    "Test Coverage",
-                    "Code Churn Analysis",
-                    "Debt Distribution",
-                    "Risk Assessment",
-                ],
-                specs=[
-                    [{"secondary_y": False}, {"type": "indicator"}],
-                    [{"type": "pie"}, {"secondary_y": False}],
-                    [{"secondary_y": False}, {"type": "indicator"}],
-                ],
+                subplot_titles=_TECHNICAL_DEBT_TITLES,
+                specs=_fresh_specs(_TECHNICAL_DEBT_SPECS),
             )
 
             # Technical debt trend
@@ -90,8 +263,8 @@ class AdvancedAnalytics:
                 debt_trend = debt_analysis["debt_trend"]
                 fig.add_trace(
                     go.Scatter(
-                        x=debt_trend["date"] if "date" in debt_trend.columns else list(range(len(debt_trend))),
-                        y=debt_trend["debt_score"] if "debt_score" in debt_trend.columns else [0] * len(debt_trend),
+                        x=_column(debt_trend, "date", np.arange(len(debt_trend))),
+                        y=_column(debt_trend, "debt_score", np.zeros(len(debt_trend))),
                         mode="lines+markers",
                         name="Debt Trend",
                         line=dict(color="red", width=3),
@@ -103,24 +276,13 @@ class AdvancedAnalytics:
             # Maintainability indicator
             overall_maintainability = maintainability.get("overall_maintainability_score", 0)
             fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=overall_maintainability,
-                    domain={"x": [0, 1], "y": [0, 1]},
-                    title={"text": "Maintainability"},
-                    gauge={
-                        "axis": {"range": [None, 100]},
-                        "bar": {"color": "darkblue"},
-                        "steps": [
-                            {"range": [0, 50], "color": "lightgray"},
-                            {"range": [50, 80], "color": "gray"},
-                        ],
-                        "threshold": {
-                            "line": {"color": "red", "width": 4},
-                            "thickness": 0.75,
-                            "value": 90,
-                        },
-                    },
+                _gauge(
+                    overall_maintainability,
+                    "Maintainability",
+                    "darkblue",
+                    [(0, 50, "lightgray"), (50, 80, "gray")],
+                    axis_range=(None, 100),
+                    threshold=90,
                 ),
                 row=1,
                 col=2,
@@ -142,11 +304,12 @@ class AdvancedAnalytics:
 
             # Code churn analysis
             if "file_churn_rates" in churn_analysis and not churn_analysis["file_churn_rates"].empty:
-                churn_data = churn_analysis["file_churn_rates"]
+                # Churn rates come in commit order, so pick the ten highest explicitly
+                churn_data = churn_analysis["file_churn_rates"].nlargest(10, "churn_rate")
                 fig.add_trace(
                     go.Bar(
-                        x=churn_data["file_path"][:10],
-                        y=churn_data["churn_rate"][:10],
+                        x=churn_data["file_path"].to_numpy(),
+                        y=churn_data["churn_rate"].to_numpy(),
                         name="Churn Rate",
                         marker_color="orange",
                     ),
@@ -172,20 +335,12 @@ class AdvancedAnalytics:
             debt_rate = debt_analysis.get("debt_accumulation_rate", 0)
             risk_score = min(100, debt_rate * 5)  # Convert to 0-100 scale
             fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=risk_score,
-                    domain={"x": [0, 1], "y": [0, 1]},
-                    title={"text": "Risk Level"},
-                    gauge={
-                        "axis": {"range": [None, 100]},
-                        "bar": {"color": "red"},
-                        "steps": [
-                            {"range": [0, 30], "color": "green"},
-                            {"range": [30, 70], "color": "yellow"},
-                            {"range": [70, 100], "color": "red"},
-                        ],
-                    },
+                _gauge(
+                    risk_score,
+                    "Risk Level",
+                    "red",
+                    [(0, 30, "green"), (30, 70, "yellow"), (70, 100, "red")],
+                    axis_range=(None, 100),
                 ),
                 row=3,
                 col=2,
@@ -200,7 +355,7 @@ class AdvancedAnalytics:
             )
 
             if save_path:
-                fig.write_html(save_path)
+                _write_html(fig, save_path)
                 logger.info(f"Technical debt dashboard saved to {save_path}")
 
             return fig
@@ -221,28 +376,20 @@ class AdvancedAnalytics:
         """
         try:
             # Get health metrics
-            velocity_analysis = self.commit_analyzer.get_commit_velocity_analysis()
-            bug_fix_analysis = self.commit_analyzer.get_bug_fix_ratio_analysis()
-            maintainability = self.advanced_metrics.calculate_maintainability_index()
-            test_ratio = self.advanced_metrics.calculate_test_to_code_ratio()
-            doc_coverage = self.file_analyzer.get_documentation_coverage_analysis()
+            velocity_analysis = self._cached("commit_velocity", self.commit_analyzer.get_commit_velocity_analysis, 12)
+            bug_fix_analysis = self._cached("bug_fix_ratio", self.commit_analyzer.get_bug_fix_ratio_analysis)
+            maintainability = self._cached("maintainability", self.advanced_metrics.calculate_maintainability_index)
+            test_ratio = self._cached("test_to_code_ratio", self.advanced_metrics.calculate_test_to_code_ratio)
+            doc_coverage = self._cached(
+                "documentation_coverage", self.file_analyzer.get_documentation_coverage_analysis
+            )
 
             # Create health dashboard
             fig = make_subplots(
                 rows=2,
                 cols=3,
-                subplot_titles=[
-                    "Commit Velocity",
-                    "Bug Fix Ratio",
-                    "Test Coverage",
-                    "Documentation Ratio",
-                    "Maintainability Trend",
-                    "Overall Health Score",
-                ],
-                specs=[
-                    [{"secondary_y": False}, {"type": "indicator"}, {"type": "indicator"}],
-                    [{"type": "indicator"}, {"secondary_y": False}, {"type": "indicator"}],
-                ],
+                subplot_titles=_REPOSITORY_HEALTH_TITLES,
+                specs=_fresh_specs(_REPOSITORY_HEALTH_SPECS),
             )
 
             # Commit velocity trend
@@ -250,8 +397,8 @@ class AdvancedAnalytics:
                 velocity_data = velocity_analysis["weekly_velocity"]
                 fig.add_trace(
                     go.Scatter(
-                        x=velocity_data["week"] if "week" in velocity_data.columns else list(range(len(velocity_data))),
-                        y=velocity_data["commits"] if "commits" in velocity_data.columns else [0] * len(velocity_data),
+                        x=_column(velocity_data, "week", np.arange(len(velocity_data))),
+                        y=_column(velocity_data, "commits", np.zeros(len(velocity_data))),
                         mode="lines+markers",
                         name="Velocity",
                         line=dict(color="blue"),
@@ -263,20 +410,12 @@ class AdvancedAnalytics:
             # Bug fix ratio indicator
             bug_ratio = bug_fix_analysis.get("bug_fix_ratio", 0)
             fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=bug_ratio,
-                    domain={"x": [0, 1], "y": [0, 1]},
-                    title={"text": "Bug Fix %"},
-                    gauge={
-                        "axis": {"range": [0, 50]},
-                        "bar": {"color": "orange"},
-                        "steps": [
-                            {"range": [0, 10], "color": "green"},
-                            {"range": [10, 25], "color": "yellow"},
-                            {"range": [25, 50], "color": "red"},
-                        ],
-                    },
+                _gauge(
+                    bug_ratio,
+                    "Bug Fix %",
+                    "orange",
+                    [(0, 10, "green"), (10, 25, "yellow"), (25, 50, "red")],
+                    axis_range=(0, 50),
                 ),
                 row=1,
                 col=2,
@@ -285,20 +424,8 @@ class AdvancedAnalytics:
             # Test coverage indicator
             test_coverage = test_ratio.get("test_coverage_percentage", 0)
             fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=test_coverage,
-                    domain={"x": [0, 1], "y": [0, 1]},
-                    title={"text": "Test Coverage %"},
-                    gauge={
-                        "axis": {"range": [0, 100]},
-                        "bar": {"color": "green"},
-                        "steps": [
-                            {"range": [0, 50], "color": "red"},
-                            {"range": [50, 80], "color": "yellow"},
-                            {"range": [80, 100], "color": "green"},
-                        ],
-                    },
+                _gauge(
+                    test_coverage, "Test Coverage %", "green", [(0, 50, "red"), (50, 80, "yellow"), (80, 100, "green")]
                 ),
                 row=1,
                 col=3,
@@ -307,20 +434,8 @@ class AdvancedAnalytics:
             # Documentation ratio indicator
             doc_ratio = doc_coverage.get("documentation_ratio", 0)
             fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=doc_ratio,
-                    domain={"x": [0, 1], "y": [0, 1]},
-                    title={"text": "Documentation %"},
-                    gauge={
-                        "axis": {"range": [0, 100]},
-                        "bar": {"color": "purple"},
-                        "steps": [
-                            {"range": [0, 20], "color": "red"},
-                            {"range": [20, 50], "color": "yellow"},
-                            {"range": [50, 100], "color": "green"},
-                        ],
-                    },
+                _gauge(
+                    doc_ratio, "Documentation %", "purple", [(0, 20, "red"), (20, 50, "yellow"), (50, 100, "green")]
                 ),
                 row=2,
                 col=1,
@@ -349,20 +464,8 @@ class AdvancedAnalytics:
             overall_health = sum(health_factors.values()) / len(health_factors) * 100
 
             fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=overall_health,
-                    domain={"x": [0, 1], "y": [0, 1]},
-                    title={"text": "Health Score"},
-                    gauge={
-                        "axis": {"range": [0, 100]},
-                        "bar": {"color": "darkblue"},
-                        "steps": [
-                            {"range": [0, 40], "color": "red"},
-                            {"range": [40, 70], "color": "yellow"},
-                            {"range": [70, 100], "color": "green"},
-                        ],
-                    },
+                _gauge(
+                    overall_health, "Health Score", "darkblue", [(0, 40, "red"), (40, 70, "yellow"), (70, 100, "green")]
                 ),
                 row=2,
                 col=3,
@@ -377,7 +480,7 @@ class AdvancedAnalytics:
             )
 
             if save_path:
-                fig.write_html(save_path)
+                _write_html(fig, save_path)
                 logger.info(f"Repository health dashboard saved to {save_path}")
 
             return fig
@@ -398,20 +501,15 @@ class AdvancedAnalytics:
         """
         try:
             # Get predictive data
-            velocity_analysis = self.commit_analyzer.get_commit_velocity_analysis()
-            churn_analysis = self.file_analyzer.get_code_churn_analysis()
-            debt_analysis = self.advanced_metrics.calculate_technical_debt_accumulation()
+            velocity_analysis = self._cached("commit_velocity", self.commit_analyzer.get_commit_velocity_analysis, 12)
+            churn_analysis = self._cached("code_churn", self.file_analyzer.get_code_churn_analysis)
+            debt_analysis = self._cached("technical_debt", self.advanced_metrics.calculate_technical_debt_accumulation)
 
             # Create predictive dashboard
             fig = make_subplots(
                 rows=2,
                 cols=2,
-                subplot_titles=[
-                    "Velocity Forecast",
-                    "Debt Accumulation Prediction",
-                    "High-Risk Files",
-                    "Maintenance Recommendations",
-                ],
+                subplot_titles=_PREDICTIVE_MAINTENANCE_TITLES,
             )
 
             # Velocity forecast (simplified)
@@ -427,16 +525,8 @@ class AdvancedAnalytics:
                     # Historical data
                     fig.add_trace(
                         go.Scatter(
-                            x=(
-                                velocity_data["week_start"]
-                                if "week_start" in velocity_data.columns
-                                else list(range(len(velocity_data)))
-                            ),
-                            y=(
-                                velocity_data["commit_count"]
-                                if "commit_count" in velocity_data.columns
-                                else [0] * len(velocity_data)
-                            ),
+                            x=_column(velocity_data, "week_start", np.arange(len(velocity_data))),
+                            y=_column(velocity_data, "commit_count", np.zeros(len(velocity_data))),
                             mode="lines+markers",
                             name="Historical Velocity",
                             line=dict(color="blue"),
@@ -478,11 +568,16 @@ class AdvancedAnalytics:
 
             # High-risk files
             if "file_churn_rates" in churn_analysis and not churn_analysis["file_churn_rates"].empty:
-                high_risk_files = churn_analysis["file_churn_rates"].head(10)
+                churn_rates = churn_analysis["file_churn_rates"]
+                high_risk_files = (
+                    churn_rates.nlargest(10, "churn_rate")
+                    if "churn_rate" in churn_rates.columns
+                    else churn_rates.head(10)
+                )
                 fig.add_trace(
                     go.Bar(
-                        x=high_risk_files["file_path"] if "file_path" in high_risk_files.columns else [],
-                        y=high_risk_files["churn_rate"] if "churn_rate" in high_risk_files.columns else [],
+                        x=_column(high_risk_files, "file_path", []),
+                        y=_column(high_risk_files, "churn_rate", []),
                         name="Risk Score",
                         marker_color="red",
                     ),
@@ -516,7 +611,7 @@ class AdvancedAnalytics:
             )
 
             if save_path:
-                fig.write_html(save_path)
+                _write_html(fig, save_path)
                 logger.info(f"Predictive maintenance report saved to {save_path}")
 
             return fig
@@ -535,77 +630,44 @@ class AdvancedAnalytics:
         Returns:
             Dict[str, str]: Mapping of report names to file paths
         """
-        import os
-
         os.makedirs(output_dir, exist_ok=True)
         generated_files = {}
 
-        try:
-            # Get predictive data for all available weeks
-            velocity_analysis = self.commit_analyzer.get_commit_velocity_analysis(weeks_back=52)
-            churn_analysis = self.file_analyzer.get_code_churn_analysis()
-            debt_analysis = self.advanced_metrics.calculate_technical_debt_accumulation()
-
-            # Create predictive dashboard
-            fig = make_subplots(
-                rows=2,
-                cols=2,
-                subplot_titles=[
-                    "Velocity Forecast",
-                    "Debt Accumulation Prediction",
-                    "High-Risk Files",
-                    "Maintenance Recommendations",
-                ],
-            )
-
-            # Velocity forecast (show all available weeks)
-            if "weekly_velocity" in velocity_analysis and not velocity_analysis["weekly_velocity"].empty:
-                velocity_data = velocity_analysis["weekly_velocity"]
-                # Use last 4 weeks for forecast
-                recent_weeks = velocity_data.tail(4)
-                if not recent_weeks.empty:
-                    avg_velocity = recent_weeks["commit_count"].mean() if "commit_count" in recent_weeks.columns else 0
-                    forecast_weeks = list(range(len(velocity_data), len(velocity_data) + 4))
-                    forecast_values = [avg_velocity] * 4
-
-                # Historical data (all weeks)
-                fig.add_trace(
-                    go.Scatter(
-                        x=(
-                            velocity_data["week_start"]
-                            if "week_start" in velocity_data.columns
-                            else list(range(len(velocity_data)))
-                        ),
-                        y=(
-                            velocity_data["commit_count"]
-                            if "commit_count" in velocity_data.columns
-                            else [0] * len(velocity_data)
-                        ),
-                        mode="lines+markers",
-                        name="Historical Velocity",
-                        line=dict(color="blue"),
-                    ),
-                    row=1,
-                    col=1,
-                )
-
-                # Forecast (if available)
-                if not recent_weeks.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=forecast_weeks,
-                            y=forecast_values,
-                            mode="lines+markers",
-                            name="Forecast",
-                            line=dict(color="red", dash="dash"),
-                        ),
-                        row=1,
-                        col=1,
-                    )
-
-        except Exception as e:
-            logger.error(f"Error creating predictive maintenance dashboard: {e}")
-            return self._create_error_figure("Error creating predictive maintenance dashboard")
+        reports = [
+            ("technical_debt", "technical_debt.html", self.create_technical_debt_dashboard),
+            ("repository_health", "repository_health.html", self.create_repository_health_dashboard),
+            ("predictive_maintenance", "predictive_maintenance.html", self.create_predictive_maintenance_report),
+            ("velocity_forecasting", "velocity_forecasting.html", self.create_velocity_forecasting_dashboard),
+        ]
+
+        file_paths = [os.path.join(output_dir, filename) for _, filename, _ in reports]
+        # Success is judged by what this run writes, so clear reports left by an earlier one
+        for file_path in file_paths:
+            with suppress(FileNotFoundError):
+                os.remove(file_path)
+        if self.parallel_reports:
+            # Every report links the same bundle, so write it before the workers start
+            _write_plotlyjs_bundle(output_dir)
+            with ThreadPoolExecutor(max_workers=len(reports)) as executor:
+                futures = [
+                    executor.submit(create_report, file_path)
+                    for (_, _, create_report), file_path in zip(reports, file_paths)
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for (_, _, create_report), file_path in zip(reports, file_paths):
+                create_report(file_path)
+
+        for (report_name, _, _), file_path in zip(reports, file_paths):
+            # The dashboards return an error figure instead of raising, so check what was written
+            if os.path.exists(file_path):
+                generated_files[report_name] = file_path
+            else:
+                logger.warning(f"Advanced report {report_name} was not generated")
+
+        logger.info(f"Generated {len(generated_files)} advanced reports in {output_dir}")
+        return generated_files
 
     def _generate_maintenance_recommendations(
         self, velocity_analysis: dict, debt_analysis: dict, churn_analysis: dict
@@ -666,17 +728,14 @@ class AdvancedAnalytics:
         """
         try:
             # Get velocity data
-            velocity_analysis = self.commit_analyzer.get_commit_velocity_analysis(weeks_back=12)
+            velocity_analysis = self._cached("commit_velocity", self.commit_analyzer.get_commit_velocity_analysis, 12)
 
             # Create forecasting dashboard
             fig = make_subplots(
                 rows=2,
                 cols=2,
-                subplot_titles=["Velocity Trend", "Velocity Distribution", "Team Productivity", "Forecasting"],
-                specs=[
-                    [{"secondary_y": False}, {"type": "histogram"}],
-                    [{"type": "indicator"}, {"secondary_y": False}],
-                ],
+                subplot_titles=_VELOCITY_FORECASTING_TITLES,
+                specs=_fresh_specs(_VELOCITY_FORECASTING_SPECS),
             )
 
             # Velocity trend over time
@@ -725,20 +784,12 @@ class AdvancedAnalytics:
             productivity_score = min(100, avg_velocity * 20)  # Convert to 0-100 scale
 
             fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=productivity_score,
-                    domain={"x": [0, 1], "y": [0, 1]},
-                    title={"text": "Productivity Score"},
-                    gauge={
-                        "axis": {"range": [None, 100]},
-                        "bar": {"color": "green"},
-                        "steps": [
-                            {"range": [0, 50], "color": "red"},
-                            {"range": [50, 80], "color": "yellow"},
-                            {"range": [80, 100], "color": "green"},
-                        ],
-                    },
+                _gauge(
+                    productivity_score,
+                    "Productivity Score",
+                    "green",
+                    [(0, 50, "red"), (50, 80, "yellow"), (80, 100, "green")],
+                    axis_range=(None, 100),
                 ),
                 row=2,
                 col=1,
@@ -775,7 +826,7 @@ class AdvancedAnalytics:
             )
 
             if save_path:
-                fig.write_html(save_path)
+                _write_html(fig, save_path)
                 logger.info(f"Velocity forecasting dashboard saved to {save_path}")
 
             return fig
@@ -785,7 +836,16 @@ class AdvancedAnalytics:
             return self._create_error_figure("Error creating velocity forecasting dashboard")
 
     def _create_error_figure(self, error_message: str) -> go.Figure:
-        """Create a simple error figure when visualization fails."""
+        """Create a simple error figure when visualization fails.
+
+        Figures for the most recent messages are kept and copied on later calls, so callers
+        may still modify the returned figure freely.
+        """
+        return go.Figure(self._error_figures(error_message))
+
+    @staticmethod
+    def _build_error_figure(error_message: str) -> go.Figure:
+        """Build the annotated error figure for a message."""
         fig = go.Figure()
         fig.add_annotation(
             text=error_message,
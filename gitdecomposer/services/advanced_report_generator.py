@@ -3,187 +3,338 @@ Advanced Report Generator Service for GitDecomposer.
 This service handles generating HTML reports for advanced metrics.
 """
 
+import hashlib
+import heapq
 import logging
 import os
-from typing import Dict, Optional
-
-import pandas as pd
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache, wraps
+from operator import itemgetter
+from typing import List, Optional, Tuple
+
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 
-from ..analyzers.advanced_metrics import create_metric_analyzer
+from .. import __version__
+from ..analyzers.advanced_metrics import METRIC_ANALYZERS, get_available_metrics
 from ..core import GitRepository
 
 logger = logging.getLogger(__name__)
 
+# Distinct error messages whose figures each generator keeps for reuse
+_MAX_ERROR_FIGURES = 16
+
+
+@lru_cache(maxsize=None)
+def _metric_analyzer_class(metric_name: str):
+    """Resolve a metric name to its analyzer class, memoized per name."""
+    if metric_name not in METRIC_ANALYZERS:
+        available = ", ".join(get_available_metrics())
+        raise ValueError(f"Unknown metric '{metric_name}'. Available metrics: {available}")
+    return METRIC_ANALYZERS[metric_name]
+
+
+def _saved_report(description: str):
+    """
+    Turn a figure-building method into a ``create_*_report(save_path=None)`` method.
+
+    The figure is rendered to HTML before the method returns, and the file is
+    written by the generator's I/O thread while the caller builds the next report.
+    Any file already at ``save_path`` is removed first and the new one is moved into
+    place once complete, so after ``flush()`` the file exists only if this call
+    wrote it; ``flush()`` raises any write error. If building the figure fails,
+    the error is logged and an error figure is returned without saving anything.
+
+    With a ``cache_dir``, saved reports are also served from an on-disk cache
+    while no ref of the repository has moved. Reports depend only on committed
+    history, so the HTML and figure JSON are stored under a key derived from the
+    SHAs of HEAD and all refs and the report name.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, save_path: Optional[str] = None) -> go.Figure:
+            cache_key = self._report_cache_key(method.__name__) if save_path else None
+            if cache_key is not None:
+                html_path = os.path.join(self.cache_dir, f"{cache_key}.html")
+                json_path = os.path.join(self.cache_dir, f"{cache_key}.json")
+                if os.path.exists(html_path) and os.path.exists(json_path):
+                    logger.info(f"Using cached {method.__name__} output for current refs")
+                    with open(json_path, "r", encoding="utf-8") as f:
+                        fig = pio.from_json(f.read())
+                    # Queued like any other write, so it cannot be overtaken by an earlier one
+                    self._queue_write(save_path, self._copy_report, html_path, save_path)
+                    return fig
+
+            try:
+                fig = method(self)
+            except Exception as e:
+                logger.error(f"Error creating {description}: {e}")
+                return self._create_error_figure(f"Error creating {description}")
+
+            if save_path:
+                # Serialized here, so the caller may keep changing the figure while it is written
+                page = fig.to_html(include_plotlyjs="cdn")
+                cache_entry = (html_path, json_path, fig.to_json()) if cache_key is not None else None
+                self._queue_write(save_path, self._write_report, page, save_path, cache_entry)
+            return fig
+
+        return wrapper
+
+    return decorator
+
 
 class AdvancedReportGenerator:
     """
     Service for generating advanced HTML reports.
     """
 
-    def __init__(self, git_repo: GitRepository, advanced_analytics=None):
+    __slots__ = ("git_repo", "advanced_analytics", "cache_dir", "_error_figures", "_io_pool", "_pending")
+
+    def __init__(self, git_repo: GitRepository, advanced_analytics=None, cache_dir: Optional[str] = None):
+        """
+        Initialize AdvancedReportGenerator.
+
+        Args:
+            git_repo (GitRepository): GitRepository instance
+            advanced_analytics: Optional advanced analytics provider
+            cache_dir (Optional[str]): Directory for reusing saved reports across runs
+                while no ref has moved (e.g. ``~/.gitdecomposer/cache``); disabled when None
+        """
         self.git_repo = git_repo
         self.advanced_analytics = advanced_analytics
-
-    def create_knowledge_distribution_report(self, save_path: Optional[str] = None) -> go.Figure:
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        # Error figures built by this generator, keyed by message
+        self._error_figures = lru_cache(maxsize=_MAX_ERROR_FIGURES)(self._build_error_figure)
+        # One I/O thread writes saved reports in order while the next report is built
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-io")
+        self._pending: List[Tuple[str, Future]] = []
+
+    def _queue_write(self, save_path: str, write, *args) -> None:
+        """Remove any earlier file at save_path and queue the write that replaces it."""
+        with suppress(FileNotFoundError):
+            os.remove(save_path)
+        self._pending.append((save_path, self._io_pool.submit(write, *args)))
+
+    def flush(self) -> None:
+        """
+        Wait for every queued report write.
+
+        Raises:
+            OSError: The first error raised while writing a report, once all queued
+                writes have finished. Every failure is logged with its path.
+        """
+        pending, self._pending = self._pending, []
+        errors = []
+        for save_path, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error writing report {save_path}: {e}")
+                errors.append(e)
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """Wait for queued report writes, then stop the I/O thread."""
+        try:
+            self.flush()
+        finally:
+            self._io_pool.shutdown()
+
+    def _report_cache_key(self, report_name: str) -> Optional[str]:
+        """Build the cache key for a report at the current refs, or None if caching is unavailable."""
+        if not self.cache_dir:
+            return None
+        # The analyzers walk every branch, so any moved ref must invalidate the report
+        refs = self.git_repo.refs_fingerprint()
+        if not isinstance(refs, str):
+            logger.debug("Report cache disabled, cannot resolve the repository refs")
+            return None
+        key = f"{__version__}:{refs}:{report_name}".encode()
+        return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _copy_report(source_path: str, save_path: str) -> None:
+        """Copy a cached report to save_path, moving it into place once complete."""
+        tmp_path = f"{save_path}.tmp"
+        shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, save_path)
+
+    def _write_report(self, page: str, save_path: str, cache_entry: Optional[Tuple[str, str, str]]) -> None:
+        """Write a rendered report to save_path, then store it in the cache if cache_entry is given."""
+        tmp_path = f"{save_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(page)
+        os.replace(tmp_path, save_path)
+        if cache_entry is not None:
+            self._store_cached_report(save_path, *cache_entry)
+
+    def _store_cached_report(self, save_path: str, html_path: str, json_path: str, figure_json: str) -> None:
+        """Copy a freshly written report into the cache."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        shutil.copyfile(save_path, html_path)
+        # The JSON marks the entry complete, so write it last and atomically
+        tmp_path = f"{json_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(figure_json)
+        os.replace(tmp_path, json_path)
+
+    @_saved_report("knowledge distribution report")
+    def create_knowledge_distribution_report(self) -> go.Figure:
         """Create knowledge distribution report."""
         logger.info("Creating knowledge distribution report")
-        try:
-            analyzer = create_metric_analyzer("knowledge_distribution", self.git_repo)
-            data = analyzer.calculate()
-
-            fig = go.Figure()
-
-            if not data or "knowledge_distribution" not in data or data["knowledge_distribution"].empty:
-                fig.add_annotation(
-                    text="Insufficient data for Knowledge Distribution report.",
-                    xref="paper",
-                    yref="paper",
-                    x=0.5,
-                    y=0.5,
-                    showarrow=False,
-                    font=dict(size=16, color="orange"),
-                )
-                fig.update_layout(title="Knowledge Distribution Analysis")
-                if save_path:
-                    fig.write_html(save_path)
-                return fig
+        analyzer = _metric_analyzer_class("knowledge_distribution")(self.git_repo)
+        data = analyzer.calculate()
 
-            gini_coefficient = data.get("gini_coefficient", 0)
-            distribution_df = data.get("knowledge_distribution")
+        if not data or "knowledge_distribution" not in data or data["knowledge_distribution"].empty:
+            return self._create_placeholder_figure(
+                "Insufficient data for Knowledge Distribution report.", "Knowledge Distribution Analysis"
+            )
 
-            # Main Gauge for Gini Coefficient
-            fig.add_trace(
-                go.Indicator(
-                    mode="gauge+number",
-                    value=gini_coefficient,
-                    title={"text": "Knowledge Gini Coefficient"},
-                    domain={"x": [0.1, 0.9], "y": [0.6, 0.95]},
-                    gauge={
-                        "axis": {"range": [0, 1], "tickwidth": 1, "tickcolor": "darkblue"},
-                        "bar": {"color": "darkblue"},
-                        "bgcolor": "white",
-                        "borderwidth": 2,
-                        "bordercolor": "gray",
-                        "steps": [
-                            {"range": [0, 0.3], "color": "rgba(44, 160, 44, 0.5)"},  # green
-                            {"range": [0.3, 0.6], "color": "rgba(255, 127, 14, 0.5)"},  # orange
-                            {"range": [0.6, 1], "color": "rgba(214, 39, 40, 0.5)"},  # red
-                        ],
-                        "threshold": {"line": {"color": "red", "width": 4}, "thickness": 0.75, "value": 0.6},
-                    },
-                )
+        fig = go.Figure()
+
+        gini_coefficient = data.get("gini_coefficient", 0)
+        distribution_df = data.get("knowledge_distribution")
+
+        # Main Gauge for Gini Coefficient
+        fig.add_trace(
+            go.Indicator(
+                mode="gauge+number",
+                value=gini_coefficient,
+                title={"text": "Knowledge Gini Coefficient"},
+                domain={"x": [0.1, 0.9], "y": [0.6, 0.95]},
+                gauge={
+                    "axis": {"range": [0, 1], "tickwidth": 1, "tickcolor": "darkblue"},
+                    "bar": {"color": "darkblue"},
+                    "bgcolor": "white",
+                    "borderwidth": 2,
+                    "bordercolor": "gray",
+                    "steps": [
+                        {"range": [0, 0.3], "color": "rgba(44, 160, 44, 0.5)"},  # green
+                        {"range": [0.3, 0.6], "color": "rgba(255, 127, 14, 0.5)"},  # orange
+                        {"range": [0.6, 1], "color": "rgba(214, 39, 40, 0.5)"},  # red
+                    ],
+                    "threshold": {"line": {"color": "red", "width": 4}, "thickness": 0.75, "value": 0.6},
+                },
             )
+        )
 
-            # Bar chart for distribution
-            if distribution_df is not None and not distribution_df.empty:
-                distribution_df = distribution_df.sort_values(by="knowledge_percentage", ascending=False).head(15)
-                fig.add_trace(
-                    go.Bar(
-                        x=distribution_df["author"],
-                        y=distribution_df["knowledge_percentage"],
-                        name="Knowledge Distribution",
-                        marker_color="rgba(31, 119, 180, 0.8)",
-                    )
+        # Bar chart for distribution
+        if distribution_df is not None and not distribution_df.empty:
+            distribution_df = distribution_df.sort_values(by="knowledge_percentage", ascending=False).head(15)
+            fig.add_trace(
+                go.Bar(
+                    x=distribution_df["author"],
+                    y=distribution_df["knowledge_percentage"],
+                    name="Knowledge Distribution",
+                    marker_color="rgba(31, 119, 180, 0.8)",
                 )
-
-            fig.update_layout(
-                title_text="Knowledge Distribution Analysis",
-                template="plotly_white",
-                height=700,
-                showlegend=False,
-                xaxis_title="Contributor",
-                yaxis_title="Knowledge Percentage (%)",
-                bargap=0.2,
             )
 
-            if save_path:
-                fig.write_html(save_path)
-            return fig
-        except Exception as e:
-            logger.error(f"Error creating knowledge distribution report: {e}")
-            return self._create_error_figure("Error creating knowledge distribution report")
+        fig.update_layout(
+            title_text="Knowledge Distribution Analysis",
+            template="plotly_white",
+            height=700,
+            showlegend=False,
+            xaxis_title="Contributor",
+            yaxis_title="Knowledge Percentage (%)",
+            bargap=0.2,
+        )
+
+        return fig
 
-    def create_bus_factor_report(self, save_path: Optional[str] = None) -> go.Figure:
+    @_saved_report("bus factor report")
+    def create_bus_factor_report(self) -> go.Figure:
         """Create bus factor analysis report."""
         logger.info("Creating bus factor report")
-        try:
-            analyzer = create_metric_analyzer("bus_factor", self.git_repo)
-            data = analyzer.calculate()
-
-            fig = go.Figure()
-
-            if not data or "bus_factor" not in data:
-                fig.add_annotation(
-                    text="Insufficient data for Bus Factor report.",
-                    xref="paper",
-                    yref="paper",
-                    x=0.5,
-                    y=0.5,
-                    showarrow=False,
-                    font=dict(size=16, color="orange"),
-                )
-                fig.update_layout(title="Bus Factor Analysis")
-                if save_path:
-                    fig.write_html(save_path)
-                return fig
+        analyzer = _metric_analyzer_class("bus_factor")(self.git_repo)
+        data = analyzer.calculate()
+
+        if not data or "bus_factor" not in data:
+            return self._create_placeholder_figure("Insufficient data for Bus Factor report.", "Bus Factor Analysis")
+
+        fig = go.Figure()
+
+        bus_factor = data.get("bus_factor", 0)
+        risk_level = data.get("risk_level", "Unknown")
+        key_contributors = data.get("key_contributors", [])
+
+        fig.add_trace(
+            go.Indicator(
+                mode="number+gauge",
+                value=bus_factor,
+                title={"text": f"Bus Factor (Risk: {risk_level})"},
+                domain={"x": [0.1, 0.9], "y": [0.6, 0.95]},
+                gauge={
+                    "shape": "angular",
+                    "axis": {"range": [0, 10]},
+                    "bar": {"color": "darkblue"},
+                    "steps": [
+                        {"range": [0, 1], "color": "rgba(214, 39, 40, 0.5)"},  # red
+                        {"range": [1, 3], "color": "rgba(255, 127, 14, 0.5)"},  # orange
+                        {"range": [3, 5], "color": "rgba(255, 255, 0, 0.5)"},  # yellow
+                        {"range": [5, 10], "color": "rgba(44, 160, 44, 0.5)"},  # green
+                    ],
+                },
+            )
+        )
 
-            bus_factor = data.get("bus_factor", 0)
-            risk_level = data.get("risk_level", "Unknown")
-            key_contributors = data.get("key_contributors", [])
+        if key_contributors:
+            # The list is small, so sort it directly rather than going through a DataFrame
+            ranked = sorted(key_contributors, key=itemgetter("knowledge_percentage"), reverse=True)
+            authors, percentages = zip(*((c["author"], c["knowledge_percentage"]) for c in ranked))
 
             fig.add_trace(
-                go.Indicator(
-                    mode="number+gauge",
-                    value=bus_factor,
-                    title={"text": f"Bus Factor (Risk: {risk_level})"},
-                    domain={"x": [0.1, 0.9], "y": [0.6, 0.95]},
-                    gauge={
-                        "shape": "angular",
-                        "axis": {"range": [0, 10]},
-                        "bar": {"color": "darkblue"},
-                        "steps": [
-                            {"range": [0, 1], "color": "rgba(214, 39, 40, 0.5)"},  # red
-                            {"range": [1, 3], "color": "rgba(255, 127, 14, 0.5)"},  # orange
-                            {"range": [3, 5], "color": "rgba(255, 255, 0, 0.5)"},  # yellow
-                            {"range": [5, 10], "color": "rgba(44, 160, 44, 0.5)"},  # green
-                        ],
-                    },
+                go.Bar(
+                    x=authors,
+                    y=percentages,
+                    name="Key Contributors",
+                    marker_color="rgba(31, 119, 180, 0.8)",
                 )
             )
 
-            if key_contributors:
-                contributors_df = pd.DataFrame(key_contributors)
-                contributors_df = contributors_df.sort_values(by="knowledge_percentage", ascending=False)
-
-                fig.add_trace(
-                    go.Bar(
-                        x=contributors_df["author"],
-                        y=contributors_df["knowledge_percentage"],
-                        name="Key Contributors",
-                        marker_color="rgba(31, 119, 180, 0.8)",
-                    )
-                )
+        fig.update_layout(
+            title_text="Bus Factor Analysis",
+            template="plotly_white",
+            height=700,
+            showlegend=False,
+            xaxis_title="Key Contributors",
+            yaxis_title="Knowledge Percentage (%)",
+            bargap=0.2,
+        )
 
-            fig.update_layout(
-                title_text="Bus Factor Analysis",
-                template="plotly_white",
-                height=700,
-                showlegend=False,
-                xaxis_title="Key Contributors",
-                yaxis_title="Knowledge Percentage (%)",
-                bargap=0.2,
-            )
+        return fig
 
-            if save_path:
-                fig.write_html(save_path)
-            return fig
-        except Exception as e:
-            logger.error(f"Error creating bus factor report: {e}")
-            return self._create_error_figure("Error creating bus factor report")
+    def _create_placeholder_figure(self, message: str, title: str, color: str = "orange") -> go.Figure:
+        """Create a figure explaining why a report has no data."""
+        fig = go.Figure()
+        fig.add_annotation(
+            text=message,
+            xref="paper",
+            yref="paper",
+            x=0.5,
+            y=0.5,
+            showarrow=False,
+            font=dict(size=16, color=color),
+        )
+        fig.update_layout(title=title)
+        return fig
 
     def _create_error_figure(self, error_message: str) -> go.Figure:
-        """Create a simple error figure when visualization fails."""
+        """Create a simple error figure when visualization fails.
+
+        Figures for the most recent messages are kept and copied on later calls, so callers
+        may still modify the returned figure freely.
+        """
+        return go.Figure(self._error_figures(error_message))
+
+    @staticmethod
+    def _build_error_figure(error_message: str) -> go.Figure:
+        """Build the annotated error figure for a message."""
         fig = go.Figure()
         fig.add_annotation(
             text=error_message,
@@ -200,175 +351,140 @@ class AdvancedReportGenerator:
         )
         return fig
 
-    def create_critical_files_report(self, save_path: Optional[str] = None) -> go.Figure:
+    @_saved_report("critical files report")
+    def create_critical_files_report(self) -> go.Figure:
         """Create critical files analysis report."""
         logger.info("Creating critical files report")
-        try:
-            analyzer = create_metric_analyzer("critical_files", self.git_repo)
-            data = analyzer.calculate()
-
-            fig = go.Figure()
-
-            if not data or "critical_files" not in data or not data["critical_files"]:
-                fig.add_annotation(
-                    text="No critical files identified or insufficient data.",
-                    xref="paper",
-                    yref="paper",
-                    x=0.5,
-                    y=0.5,
-                    showarrow=False,
-                    font=dict(size=16, color="orange"),
-                )
-                fig.update_layout(title="Critical Files Analysis")
-                if save_path:
-                    fig.write_html(save_path)
-                return fig
+        analyzer = _metric_analyzer_class("critical_files")(self.git_repo)
+        data = analyzer.calculate()
 
-            critical_files = data["critical_files"][:10]  # Top 10 most critical
+        if not data or "critical_files" not in data or not data["critical_files"]:
+            return self._create_placeholder_figure(
+                "No critical files identified or insufficient data.", "Critical Files Analysis"
+            )
 
-            # Create bar chart for critical files
-            file_names = [file_path.split("/")[-1] for file_path, metrics in critical_files]
-            risk_scores = [metrics["criticality_score"] for file_path, metrics in critical_files]
+        # Top 10 most critical; selected here rather than trusting the analyzer's ordering
+        critical_files = heapq.nlargest(10, data["critical_files"], key=lambda item: item[1]["criticality_score"])
+
+        # Create bar chart for critical files, building names, scores and labels in one pass
+        file_names, risk_scores, labels = [], [], []
+        for file_path, metrics in critical_files:
+            score = metrics["criticality_score"]
+            file_names.append(file_path.rsplit("/", 1)[-1])
+            risk_scores.append(score)
+            labels.append(
+                f"Risk: {score:.1f}<br>Changes: {metrics['change_frequency']}<br>Complexity: {metrics['complexity']:.1f}"
+            )
 
-            fig.add_trace(
+        # Build the figure in one step so the trace and layout are validated once
+        fig = go.Figure(
+            data=[
                 go.Bar(
                     x=file_names,
                     y=risk_scores,
                     name="Risk Score",
                     marker_color="red",
-                    text=[
-                        f"Risk: {score:.1f}<br>Changes: {metrics['change_frequency']}<br>Complexity: {metrics['complexity']:.1f}"
-                        for (file_path, metrics), score in zip(critical_files, risk_scores)
-                    ],
+                    text=labels,
                     textposition="auto",
                 )
-            )
-
-            fig.update_layout(
+            ],
+            layout=dict(
                 title="Critical Files Analysis - Top Risk Files",
                 xaxis_title="Files",
                 yaxis_title="Risk Score",
                 template="plotly_white",
                 height=600,
                 xaxis_tickangle=-45,
-            )
-
-            if save_path:
-                fig.write_html(save_path)
-            return fig
+            ),
+        )
 
-        except Exception as e:
-            logger.error(f"Error creating critical files report: {e}")
-            return self._create_error_figure(f"Error generating Critical Files report: {str(e)}")
+        return fig
 
-    def create_velocity_trend_report(self, save_path: Optional[str] = None) -> go.Figure:
+    @_saved_report("velocity trend report")
+    def create_velocity_trend_report(self) -> go.Figure:
         """Create velocity trend analysis report."""
         logger.info("Creating velocity trend report")
-        try:
-            analyzer = create_metric_analyzer("velocity_trend", self.git_repo)
-            data = analyzer.calculate()
-
-            fig = go.Figure()
-
-            if not data or "weekly_data" not in data or not data["weekly_data"]:
-                fig.add_annotation(
-                    text="Insufficient data for velocity trend analysis.",
-                    xref="paper",
-                    yref="paper",
-                    x=0.5,
-                    y=0.5,
-                    showarrow=False,
-                    font=dict(size=16, color="orange"),
-                )
-                fig.update_layout(title="Velocity Trend Analysis")
-                if save_path:
-                    fig.write_html(save_path)
-                return fig
-
-            weekly_data = data["weekly_data"]
-            weeks = []
-            for w in weekly_data:
-                if isinstance(w["week_start"], str):
-                    weeks.append(w["week_start"])
-                elif hasattr(w["week_start"], "strftime"):
-                    weeks.append(w["week_start"].strftime("%Y-%m-%d"))
-                else:
-                    weeks.append(str(w["week_start"]))
-
-            commits = [w["commit_count"] for w in weekly_data]
-            lines_changed = [w["total_lines_changed"] for w in weekly_data]
-
-            # Create velocity trend chart
-            fig.add_trace(
-                go.Scatter(
-                    x=weeks,
-                    y=commits,
-                    mode="lines+markers",
-                    name="Commits per Week",
-                    line=dict(color="blue", width=2),
-                    yaxis="y1",
-                )
+        analyzer = _metric_analyzer_class("velocity_trend")(self.git_repo)
+        data = analyzer.calculate()
+
+        if not data or "weekly_data" not in data or not data["weekly_data"]:
+            return self._create_placeholder_figure(
+                "Insufficient data for velocity trend analysis.", "Velocity Trend Analysis"
             )
 
-            fig.add_trace(
-                go.Scatter(
-                    x=weeks,
-                    y=lines_changed,
-                    mode="lines+markers",
-                    name="Lines Changed per Week",
-                    line=dict(color="red", width=2),
-                    yaxis="y2",
-                )
+        fig = go.Figure()
+
+        weekly_data = data["weekly_data"]
+        week_starts = list(map(itemgetter("week_start"), weekly_data))
+
+        # All weeks of one analysis share a type, so pick the conversion once
+        first_week = week_starts[0]
+        if isinstance(first_week, str):
+            weeks = week_starts
+        elif hasattr(first_week, "strftime"):
+            weeks = [week.strftime("%Y-%m-%d") for week in week_starts]
+        else:
+            weeks = list(map(str, week_starts))
+
+        # NumPy arrays take Plotly's typed-array path instead of per-element serialization
+        week_count = len(weekly_data)
+        commits = np.fromiter(map(itemgetter("commit_count"), weekly_data), dtype=np.int64, count=week_count)
+        lines_changed = np.fromiter(
+            map(itemgetter("total_lines_changed"), weekly_data), dtype=np.int64, count=week_count
+        )
+
+        # Create velocity trend chart
+        fig.add_trace(
+            go.Scatter(
+                x=weeks,
+                y=commits,
+                mode="lines+markers",
+                name="Commits per Week",
+                line=dict(color="blue", width=2),
+                yaxis="y1",
             )
+        )
 
-            fig.update_layout(
-                title="Development Velocity Trends",
-                xaxis_title="Week",
-                yaxis=dict(title="Commits", side="left"),
-                yaxis2=dict(title="Lines Changed", side="right", overlaying="y"),
-                template="plotly_white",
-                height=600,
-                legend=dict(x=0.02, y=0.98),
+        fig.add_trace(
+            go.Scatter(
+                x=weeks,
+                y=lines_changed,
+                mode="lines+markers",
+                name="Lines Changed per Week",
+                line=dict(color="red", width=2),
+                yaxis="y2",
             )
+        )
 
-            if save_path:
-                fig.write_html(save_path)
-            return fig
+        fig.update_layout(
+            title="Development Velocity Trends",
+            xaxis_title="Week",
+            yaxis=dict(title="Commits", side="left"),
+            yaxis2=dict(title="Lines Changed", side="right", overlaying="y"),
+            template="plotly_white",
+            height=600,
+            legend=dict(x=0.02, y=0.98),
+        )
 
-        except Exception as e:
-            logger.error(f"Error creating velocity trend report: {e}")
-            return self._create_error_figure(f"Error generating Velocity Trend report: {str(e)}")
+        return fig
 
-    def create_cycle_time_report(self, save_path: Optional[str] = None) -> go.Figure:
+    @_saved_report("cycle time report")
+    def create_cycle_time_report(self) -> go.Figure:
         """Create cycle time analysis report."""
         logger.info("Creating cycle time report")
-        try:
-            analyzer = create_metric_analyzer("cycle_time", self.git_repo)
-            data = analyzer.calculate()
-
-            fig = go.Figure()
-
-            if not data or "statistics" not in data or not data["statistics"]:
-                fig.add_annotation(
-                    text="Insufficient data for cycle time analysis.",
-                    xref="paper",
-                    yref="paper",
-                    x=0.5,
-                    y=0.5,
-                    showarrow=False,
-                    font=dict(size=16, color="orange"),
-                )
-                fig.update_layout(title="Cycle Time Analysis")
-                if save_path:
-                    fig.write_html(save_path)
-                return fig
+        analyzer = _metric_analyzer_class("cycle_time")(self.git_repo)
+        data = analyzer.calculate()
 
-            metrics = data["statistics"]
+        if not data or "statistics" not in data or not data["statistics"]:
+            return self._create_placeholder_figure("Insufficient data for cycle time analysis.", "Cycle Time Analysis")
 
-            # Create gauge for average cycle time
-            avg_cycle_time = metrics.get("average_cycle_time_hours", 0) if isinstance(metrics, dict) else 0
+        metrics = data["statistics"]
 
-            fig.add_trace(
+        # Create gauge for average cycle time
+        avg_cycle_time = metrics.get("average_cycle_time_hours", 0) if isinstance(metrics, dict) else 0
+
+        fig = go.Figure(
+            data=[
                 go.Indicator(
                     mode="gauge+number+delta",
                     value=avg_cycle_time,
@@ -385,49 +501,35 @@ class AdvancedReportGenerator:
                         "threshold": {"line": {"color": "red", "width": 4}, "thickness": 0.75, "value": 120},
                     },
                 )
-            )
-
-            fig.update_layout(title="Development Cycle Time Analysis", template="plotly_white", height=600)
-
-            if save_path:
-                fig.write_html(save_path)
-            return fig
+            ],
+            layout=dict(title="Development Cycle Time Analysis", template="plotly_white", height=600),
+        )
 
-        except Exception as e:
-            logger.error(f"Error creating cycle time report: {e}")
-            return self._create_error_figure(f"Error generating Cycle Time report: {str(e)}")
+        return fig
 
-    def create_single_point_failure_report(self, save_path: Optional[str] = None) -> go.Figure:
+    @_saved_report("single point failure report")
+    def create_single_point_failure_report(self) -> go.Figure:
         """Create single point of failure analysis report."""
         logger.info("Creating single point failure report")
-        try:
-            analyzer = create_metric_analyzer("single_point_failure", self.git_repo)
-            data = analyzer.calculate()
-
-            fig = go.Figure()
-
-            if not data or "spof_files" not in data or not data["spof_files"]:
-                fig.add_annotation(
-                    text="No single point of failure files identified.",
-                    xref="paper",
-                    yref="paper",
-                    x=0.5,
-                    y=0.5,
-                    showarrow=False,
-                    font=dict(size=16, color="green"),
-                )
-                fig.update_layout(title="Single Point of Failure Analysis")
-                if save_path:
-                    fig.write_html(save_path)
-                return fig
+        analyzer = _metric_analyzer_class("single_point_failure")(self.git_repo)
+        data = analyzer.calculate()
+
+        if not data or "spof_files" not in data or not data["spof_files"]:
+            return self._create_placeholder_figure(
+                "No single point of failure files identified.",
+                "Single Point of Failure Analysis",
+                color="green",
+            )
 
-            spof_files = data["spof_files"][:10]  # Top 10 SPOF files
+        # Top 10 SPOF files by dominance
+        spof_files = heapq.nlargest(10, data["spof_files"], key=itemgetter("dominance_ratio"))
 
-            # Create bar chart for SPOF files
-            file_names = [f["file"].split("/")[-1] for f in spof_files]
-            dominance_scores = [f["dominance_ratio"] * 100 for f in spof_files]  # Convert to percentage
+        # Create bar chart for SPOF files
+        file_names = [f["file"].split("/")[-1] for f in spof_files]
+        dominance_scores = [f["dominance_ratio"] * 100 for f in spof_files]  # Convert to percentage
 
-            fig.add_trace(
+        fig = go.Figure(
+            data=[
                 go.Bar(
                     x=file_names,
                     y=dominance_scores,
@@ -439,21 +541,15 @@ class AdvancedReportGenerator:
                     ],
                     textposition="auto",
                 )
-            )
-
-            fig.update_layout(
+            ],
+            layout=dict(
                 title="Single Point of Failure Files - High Risk Areas",
                 xaxis_title="Files",
                 yaxis_title="Dominance Percentage",
                 template="plotly_white",
                 height=600,
                 xaxis_tickangle=-45,
-            )
-
-            if save_path:
-                fig.write_html(save_path)
-            return fig
+            ),
+        )
 
-        except Exception as e:
-            logger.error(f"Error creating single point failure report: {e}")
-            return self._create_error_figure(f"Error generating Single Point Failure report: {str(e)}")
+        return fig
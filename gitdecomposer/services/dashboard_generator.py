@@ -5,10 +5,22 @@ This service handles creating interactive dashboard visualizations
 for repository analysis data.
 """
 
+import base64
+import gzip
+import html
 import logging
-from typing import Optional
-
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache, wraps
+from string import Template
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
+from plotly.basedatatypes import BaseTraceType
+from plotly.offline import get_plotlyjs_version
 from plotly.subplots import make_subplots
 
 from ..analyzers import (
@@ -19,11 +31,239 @@ from ..analyzers import (
     advanced_metrics,
 )
 from ..core import GitRepository
+from ..core.git_repository import call_on_new_handle, is_analyzer_method
 from ..viz import VisualizationEngine
 
 logger = logging.getLogger(__name__)
 
 
+# Subplot titles and specs of the dashboard grids (see _SUBPLOT_GRIDS)
+_FILE_ANALYSIS_TITLES = (
+    "File Extensions Distribution",
+    "Most Changed Files",
+    "Directory Activity",
+    "File Change Patterns",
+)
+_FILE_ANALYSIS_SPECS = (
+    ({"type": "pie"}, {"secondary_y": False}),
+    ({"secondary_y": False}, {"secondary_y": False}),
+)
+_ENHANCED_FILE_ANALYSIS_TITLES = (
+    "File Hotspots",
+    "Code Churn Rate",
+    "Commit Size Distribution",
+    "Documentation Coverage",
+    "File Change Frequency",
+    "Directory Health",
+)
+_ENHANCED_FILE_ANALYSIS_SPECS = (
+    ({"secondary_y": False}, {"secondary_y": False}),
+    ({"secondary_y": False}, {"type": "indicator"}),
+    ({"secondary_y": False}, {"secondary_y": False}),
+)
+_BRANCH_ANALYSIS_TITLES = (
+    "Branch Activity",
+    "Branch Age Distribution",
+    "Commits per Branch",
+    "Branch Status",
+)
+
+# Page for dashboards saved as a static PNG snapshot instead of an interactive chart
+_STATIC_IMAGE_PAGE = Template("""<html>
+<head><meta charset="utf-8" /><title>$title</title></head>
+<body>
+<img src="data:image/png;base64,$image" alt="$title" style="max-width: 100%;">
+</body>
+</html>""")
+# Interactive page that builds its chart on first view; the figure JSON stays unparsed until then,
+# and opening the file locally works because nothing is fetched but plotly.js itself
+_LAZY_CHART_PAGE = Template("""<html>
+<head><meta charset="utf-8" /><title>$title</title></head>
+<body>
+<div id="chart" style="width: 100%; height: 800px;"></div>
+<script type="application/json" id="chart-data">$figure</script>
+<script>
+(function () {
+    var target = document.getElementById("chart");
+    function render() {
+        var script = document.createElement("script");
+        script.src = "$plotly_src";
+        script.onload = function () {
+            var figure = JSON.parse(document.getElementById("chart-data").textContent);
+            Plotly.newPlot(target, figure.data, figure.layout, {responsive: true});
+        };
+        document.head.appendChild(script);
+    }
+    if (!("IntersectionObserver" in window)) {
+        render();
+        return;
+    }
+    var observer = new IntersectionObserver(function (entries) {
+        if (entries.some(function (entry) { return entry.isIntersecting; })) {
+            observer.disconnect();
+            render();
+        }
+    });
+    observer.observe(target);
+})();
+</script>
+</body>
+</html>""")
+_PLOTLY_CDN_URL = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+# Width in pixels of static snapshots; the two-column dashboards are cramped at plotly's default of 700
+_STATIC_IMAGE_WIDTH = 1400
+
+# Pie charts show at most this many categories plus an "Other" slice
+_MAX_PIE_SLICES = 15
+# Ranked bar charts show at most this many bars plus an "Other" bar
+_MAX_BARS = 10
+# Distinct error messages whose figures each generator keeps for reuse
+_MAX_ERROR_FIGURES = 16
+
+# Layout settings shared by the dashboards; only the title differs per figure. Every panel
+# has its own subplot title, so a figure-level legend would only repeat them. Hovering picks
+# the closest point and spike lines are not searched for, which keeps large scatters responsive.
+_DASHBOARD_LAYOUT = dict(showlegend=False, height=800, template="plotly_white", hovermode="closest", spikedistance=0)
+_ENHANCED_DASHBOARD_LAYOUT = dict(_DASHBOARD_LAYOUT, height=1200)
+
+# make_subplots arguments for each dashboard's grid
+_SUBPLOT_GRIDS: Dict[str, Dict[str, Any]] = {
+    "file_analysis": dict(rows=2, cols=2, subplot_titles=_FILE_ANALYSIS_TITLES, specs=_FILE_ANALYSIS_SPECS),
+    "enhanced_file_analysis": dict(
+        rows=3, cols=2, subplot_titles=_ENHANCED_FILE_ANALYSIS_TITLES, specs=_ENHANCED_FILE_ANALYSIS_SPECS
+    ),
+    "branch_analysis": dict(rows=2, cols=2, subplot_titles=_BRANCH_ANALYSIS_TITLES),
+}
+
+
+def _marker_sizes(counts: pd.Series) -> np.ndarray:
+    """Scale counts to marker diameters between 8 and 30 pixels."""
+    return np.clip(counts.to_numpy(dtype="float64") / 10.0, 8, 30)
+
+
+def _top_slices(data: pd.DataFrame, label_column: str, value_column: str) -> Tuple[List[Any], List[int]]:
+    """Return pie labels and values for the largest categories, folding the rest into "Other"."""
+    top = data.nlargest(_MAX_PIE_SLICES, value_column)
+    labels = top[label_column].tolist()
+    values = top[value_column].tolist()
+    other = int(data[value_column].sum() - top[value_column].sum())
+    if other:
+        labels.append("Other")
+        values.append(other)
+    return labels, values
+
+
+def _top_bars(data: pd.DataFrame, label_column: str, value_column: str, noun: str) -> Tuple[List[Any], List[int]]:
+    """Return bar labels and values for the first rows of a sorted frame plus one "Other" bar for the rest."""
+    top = data.head(_MAX_BARS)
+    labels = top[label_column].tolist()
+    values = top[value_column].tolist()
+    remaining = len(data) - len(top)
+    if remaining:
+        labels.append(f"Other ({remaining} {noun})")
+        values.append(int(data[value_column].iloc[_MAX_BARS:].sum()))
+    return labels, values
+
+
+def _common_directory(paths: List[str]) -> str:
+    """Return the directory shared by all repository-relative paths, or "" if there is none."""
+    if not paths:
+        return ""
+    return posixpath.commonpath([posixpath.dirname(path) for path in paths])
+
+
+def _open_output(path: str) -> IO[str]:
+    """Open an output file for text writing, gzip-compressing it when the path ends in ``.gz``."""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+    return open(path, "w", encoding="utf-8")
+
+
+def _write_html(fig: go.Figure, path: str, static_image: bool = False, lazy: bool = False) -> None:
+    """Save a figure as HTML, e.g. ``dashboard.html`` or ``dashboard.html.gz``.
+
+    plotly.js is loaded from its version-pinned CDN URL rather than embedded in every file.
+    With ``static_image`` the page shows a PNG snapshot rendered by Kaleido instead, which
+    large dashboards display without any browser-side plotting; if Kaleido is not
+    installed or fails to render, the interactive page is written. With ``lazy`` the figure is stored as inert
+    JSON and plotly.js is only fetched and run once the chart scrolls into view.
+    """
+    if static_image:
+        try:
+            png = fig.to_image(format="png", engine="kaleido", width=_STATIC_IMAGE_WIDTH)
+        except Exception as e:
+            # Kaleido may also fail at runtime, e.g. when its renderer process cannot start
+            logger.warning("Static image export unavailable, saving an interactive chart instead: %s", e)
+        else:
+            title = html.escape(fig.layout.title.text or "")
+            with _open_output(path) as f:
+                f.write(_STATIC_IMAGE_PAGE.substitute(title=title, image=base64.b64encode(png).decode("ascii")))
+            return
+    if lazy:
+        title = html.escape(fig.layout.title.text or "")
+        # "</" would end the JSON script element early; "<\/" is the same string to JSON.parse
+        figure = fig.to_json().replace("</", "<\\/")
+        with _open_output(path) as f:
+            f.write(_LAZY_CHART_PAGE.substitute(title=title, figure=figure, plotly_src=_PLOTLY_CDN_URL))
+        return
+    with _open_output(path) as f:
+        fig.write_html(f, include_plotlyjs="cdn")
+
+
+def _float_values(series: pd.Series, decimals: int = 3) -> np.ndarray:
+    """Return a numeric series as float64 values rounded to keep the serialized figure small.
+
+    The rounding is done in float64, as float32 values are widened again when plotly's
+    stdlib JSON engine prints them (``1.235`` becomes ``1.2350000143051147``).
+    """
+    return series.astype("float64").round(decimals).to_numpy()
+
+
+def _count_values(series: pd.Series) -> np.ndarray:
+    """Return a count series as int64 values, treating missing counts as zero."""
+    return series.fillna(0).astype("int64").to_numpy()
+
+
+def _fresh_specs(specs: Tuple[Tuple[Dict[str, Any], ...], ...]) -> List[List[Dict[str, Any]]]:
+    """Return a copy of a specs constant for make_subplots, which fills in default keys in place."""
+    return [[dict(spec) for spec in row] for row in specs]
+
+
+@lru_cache(maxsize=None)
+def _empty_subplot_grid(name: str) -> go.Figure:
+    """Build a dashboard's empty subplot grid; only ever copied, never modified."""
+    grid = dict(_SUBPLOT_GRIDS[name])
+    if "specs" in grid:
+        grid["specs"] = _fresh_specs(grid["specs"])
+    return make_subplots(**grid)
+
+
+def _subplot_grid(name: str) -> go.Figure:
+    """Return a new figure with a dashboard's subplot grid, copied from the one built by make_subplots."""
+    return go.Figure(_empty_subplot_grid(name))
+
+
+def _error_figure_on_failure(description: str) -> Callable[[Callable[..., go.Figure]], Callable[..., go.Figure]]:
+    """Log any exception raised while creating a dashboard and return an error figure instead.
+
+    Args:
+        description (str): What the method creates, e.g. ``"branch analysis dashboard"``
+    """
+
+    def decorator(method: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+        @wraps(method)
+        def wrapper(self: "DashboardGenerator", save_path: Optional[str] = None) -> go.Figure:
+            try:
+                return method(self, save_path)
+            except Exception as e:
+                logger.error("Error creating %s: %s", description, e)
+                return self._create_error_figure(f"Error creating {description}")
+
+        return wrapper
+
+    return decorator
+
+
 class DashboardGenerator:
     """
     Service for generating interactive dashboard visualizations.
@@ -32,25 +272,162 @@ class DashboardGenerator:
     by GitMetrics, providing clean separation of concerns.
     """
 
-    def __init__(self, git_repo: GitRepository):
+    def __init__(
+        self,
+        git_repo: GitRepository,
+        parallel_analysis: bool = False,
+        static_images: bool = False,
+        lazy_charts: bool = False,
+    ):
         """
-        Initialize DashboardGenerator with analyzer and visualization instances.
+        Initialize DashboardGenerator.
+
+        Analyzers and the visualization engine are created on first access, so a
+        caller that renders a single dashboard only pays for what it uses.
 
         Args:
             git_repo (GitRepository): GitRepository instance
+            parallel_analysis (bool): Run independent analyzer queries concurrently,
+                each on its own handle to the repository.
+            static_images (bool): Save dashboards as PNG snapshots (requires the
+                ``kaleido`` package) instead of interactive plotly.js charts.
+            lazy_charts (bool): Save interactive dashboards that load plotly.js and
+                draw their chart only once it scrolls into view, so the page paints
+                before the figure is parsed.
         """
         self.git_repo = git_repo
-        self.commit_analyzer = CommitAnalyzer(git_repo)
-        self.file_analyzer = FileAnalyzer(git_repo)
-        self.contributor_analyzer = ContributorAnalyzer(git_repo)
-        self.branch_analyzer = BranchAnalyzer(git_repo)
+        self.parallel_analysis = parallel_analysis
+        self.static_images = static_images
+        self.lazy_charts = lazy_charts
         # Advanced metrics module for creating metric analyzers
         self.advanced_metrics = advanced_metrics
-        # Initialize visualization engine with self as metrics coordinator
-        self.visualization = VisualizationEngine(git_repo, self)
+        # Analyzer results shared between dashboards, keyed by (name, args), for the HEAD in _cache_head
+        self._cache: Dict[Tuple[str, Tuple[Any, ...]], Any] = {}
+        self._cache_head: Optional[str] = None
+        self._cache_lock = threading.Lock()
+        # Error figures built by this generator, keyed by message
+        self._error_figures = lru_cache(maxsize=_MAX_ERROR_FIGURES)(self._build_error_figure)
+
+        logger.info("DashboardGenerator initialized")
+
+    @cached_property
+    def commit_analyzer(self) -> CommitAnalyzer:
+        """Commit analyzer, created on first use."""
+        return CommitAnalyzer(self.git_repo)
+
+    @cached_property
+    def file_analyzer(self) -> FileAnalyzer:
+        """File analyzer, created on first use."""
+        return FileAnalyzer(self.git_repo)
+
+    @cached_property
+    def contributor_analyzer(self) -> ContributorAnalyzer:
+        """Contributor analyzer, created on first use."""
+        return ContributorAnalyzer(self.git_repo)
+
+    @cached_property
+    def branch_analyzer(self) -> BranchAnalyzer:
+        """Branch analyzer, created on first use."""
+        return BranchAnalyzer(self.git_repo)
+
+    @cached_property
+    def visualization(self) -> VisualizationEngine:
+        """Visualization engine using this generator as its metrics coordinator."""
+        return VisualizationEngine(self.git_repo, self)
+
+    def _head_sha(self) -> Optional[str]:
+        """Return the sha of the repository HEAD, or None if it cannot be resolved."""
+        try:
+            head_sha = self.git_repo.repo.head.commit.hexsha
+        except Exception:
+            return None
+        return head_sha if isinstance(head_sha, str) else None
+
+    def _sync_cache_head(self) -> None:
+        """Drop cached results if HEAD has moved; the caller holds ``_cache_lock``."""
+        head_sha = self._head_sha()
+        if head_sha != self._cache_head:
+            self._cache.clear()
+            self._cache_head = head_sha
+
+    def _cached(self, key: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Return an analyzer result, computing it only the first time it is requested.
+
+        Cached results are dropped automatically when HEAD moves to a new commit.
+        The result is computed without holding the lock, so other lookups are not held
+        up by a slow analyzer; it is only stored if HEAD has not moved in the meantime.
+        """
+        cache_key = (key, args)
+        with self._cache_lock:
+            self._sync_cache_head()
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+            head_sha = self._cache_head
+        result = fn(*args)
+        with self._cache_lock:
+            if self._cache_head != head_sha:
+                return result
+            # Keep the first result if another thread computed the same query meanwhile
+            return self._cache.setdefault(cache_key, result)
+
+    def _query(self, key: str, fn: Callable[..., Any], default: Any, *args: Any) -> Any:
+        """Return a cached analyzer result, or ``default`` if the analyzer fails.
+
+        Failures are logged and not cached, so one failing analyzer only empties
+        its own panel instead of the whole dashboard.
+        """
+        try:
+            return self._cached(key, fn, *args)
+        except Exception as e:
+            logger.warning("Could not compute %s: %s", key, e)
+            return default
 
-        logger.info("DashboardGenerator initialized with all analyzers and visualization engine")
+    def _query_many(self, queries: List[Tuple[Any, ...]]) -> List[Any]:
+        """Resolve several independent ``(key, fn, default, *args)`` queries like ``_query``.
 
+        With ``parallel_analysis``, uncached analyzer methods run concurrently, each on a
+        fresh analyzer with its own repository handle. Other callables run one at a time
+        on the calling thread.
+        """
+        if not self.parallel_analysis:
+            return [self._query(*query) for query in queries]
+
+        with self._cache_lock:
+            self._sync_cache_head()
+            head_sha = self._cache_head
+            isolated = [
+                index
+                for index, (key, fn, _, *args) in enumerate(queries)
+                if (key, tuple(args)) not in self._cache and is_analyzer_method(fn, self.git_repo)
+            ]
+
+        results: Dict[int, Any] = {}
+        if isolated:
+            with ThreadPoolExecutor(max_workers=len(isolated)) as executor:
+                futures = {}
+                for index in isolated:
+                    _, fn, _, *args = queries[index]
+                    futures[index] = executor.submit(call_on_new_handle, fn, *args)
+            computed = {}
+            for index, future in futures.items():
+                key, _, default, *args = queries[index]
+                try:
+                    computed[(key, tuple(args))] = results[index] = future.result()
+                except Exception as e:
+                    logger.warning("Could not compute %s: %s", key, e)
+                    results[index] = default
+            with self._cache_lock:
+                if self._cache_head == head_sha:
+                    self._cache.update(computed)
+
+        return [results[index] if index in results else self._query(*query) for index, query in enumerate(queries)]
+
+    def clear_cache(self) -> None:
+        """Drop cached analyzer results, e.g. after the repository has changed."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @_error_figure_on_failure("commit activity dashboard")
     def create_commit_activity_dashboard(self, save_path: Optional[str] = None) -> go.Figure:
         """
         Create an interactive dashboard showing commit activity patterns.
@@ -61,12 +438,9 @@ class DashboardGenerator:
         Returns:
             plotly.graph_objects.Figure: Interactive dashboard
         """
-        try:
-            return self.visualization.create_commit_activity_dashboard(save_path)
-        except Exception as e:
-            logger.error(f"Error creating commit activity dashboard: {e}")
-            return self._create_error_figure("Error creating commit activity dashboard")
+        return self.visualization.create_commit_activity_dashboard(save_path)
 
+    @_error_figure_on_failure("contributor analysis charts")
     def create_contributor_analysis_charts(self, save_path: Optional[str] = None) -> go.Figure:
         """
         Create charts analyzing contributor patterns.
@@ -77,12 +451,9 @@ class DashboardGenerator:
         Returns:
             plotly.graph_objects.Figure: Contributor analysis charts
         """
-        try:
-            return self.visualization.create_contributor_analysis_charts(save_path)
-        except Exception as e:
-            logger.error(f"Error creating contributor analysis charts: {e}")
-            return self._create_error_figure("Error creating contributor analysis charts")
+        return self.visualization.create_contributor_analysis_charts(save_path)
 
+    @_error_figure_on_failure("file analysis visualization")
     def create_file_analysis_visualization(self, save_path: Optional[str] = None) -> go.Figure:
         """
         Create visualizations for file analysis.
@@ -93,111 +464,118 @@ class DashboardGenerator:
         Returns:
             plotly.graph_objects.Figure: File analysis visualizations
         """
-        try:
-            # Get data
-            extensions_dist = self.file_analyzer.get_file_extensions_distribution()
-            most_changed = self.file_analyzer.get_most_changed_files(15)
-            directory_analysis = self.file_analyzer.get_directory_analysis()
-
-            # Create subplots
-            fig = make_subplots(
-                rows=2,
-                cols=2,
-                subplot_titles=[
-                    "File Extensions Distribution",
-                    "Most Changed Files",
-                    "Directory Activity",
-                    "File Change Patterns",
-                ],
-                specs=[
-                    [{"type": "pie"}, {"secondary_y": False}],
-                    [{"secondary_y": False}, {"secondary_y": False}],
-                ],
-            )
+        # Get data
+        extensions_dist, most_changed, directory_analysis, file_timeline = self._query_many(
+            [
+                (
+                    "file_extensions_distribution",
+                    self.file_analyzer.get_file_extensions_distribution,
+                    pd.DataFrame(),
+                ),
+                ("most_changed_files", self.file_analyzer.get_most_changed_files, pd.DataFrame(), None),
+                ("directory_analysis", self.file_analyzer.get_directory_analysis, pd.DataFrame()),
+                ("file_change_frequency", self.file_analyzer.get_file_change_frequency_analysis, pd.DataFrame()),
+            ]
+        )
 
-            # File extensions pie chart
-            if not extensions_dist.empty:
-                fig.add_trace(
+        # Nothing to plot: skip building and saving a dashboard of empty panels
+        if all(df.empty for df in (extensions_dist, most_changed, directory_analysis, file_timeline)):
+            logger.warning("No file data available; file analysis visualization not created")
+            return self._create_error_figure("No file data available for file analysis")
+
+        # Create subplots
+        fig = _subplot_grid("file_analysis")
+        # (trace, row, col) for each panel, added to the figure in one batch
+        panels: List[Tuple[BaseTraceType, int, int]] = []
+
+        # File extensions pie chart
+        if not extensions_dist.empty:
+            labels, values = _top_slices(extensions_dist, "extension", "count")
+            panels.append(
+                (
                     go.Pie(
-                        labels=extensions_dist["extension"],
-                        values=extensions_dist["count"],
-                        name="File Extensions",
+                        labels=labels,
+                        values=values,
                     ),
-                    row=1,
-                    col=1,
+                    1,
+                    1,
                 )
+            )
 
-            # Most changed files bar chart
-            if not most_changed.empty:
-                fig.add_trace(
+        # Most changed files bar chart
+        if not most_changed.empty:
+            files, changes = _top_bars(most_changed, "file_path", "change_count", "files")
+            # Show the directory shared by every plotted file once, in the panel title
+            prefix = _common_directory(files[:_MAX_BARS])
+            if prefix:
+                cut = len(prefix) + 1
+                files = [path[cut:] for path in files[:_MAX_BARS]] + files[_MAX_BARS:]
+                fig.layout.annotations[1].text = f"Most Changed Files (under {prefix}/)"
+            panels.append(
+                (
                     go.Bar(
-                        x=most_changed["file_path"][:10],  # Top 10
-                        y=most_changed["change_count"],
+                        x=files,
+                        y=changes,
                         name="Changes",
                         marker_color="lightblue",
                     ),
-                    row=1,
-                    col=2,
+                    1,
+                    2,
                 )
+            )
 
-            # Directory activity
-            if not directory_analysis.empty:
-                dir_stats = directory_analysis
-                fig.add_trace(
+        # Directory activity
+        if not directory_analysis.empty:
+            dir_stats = directory_analysis.head(10)
+            panels.append(
+                (
                     go.Bar(
-                        x=dir_stats["directory"][:10],
-                        y=dir_stats["unique_files"][:10],
+                        x=dir_stats["directory"].to_numpy(),
+                        y=_count_values(dir_stats["unique_files"]),
                         name="File Count",
                         marker_color="lightgreen",
                     ),
-                    row=2,
-                    col=1,
+                    2,
+                    1,
                 )
+            )
 
-            # File change patterns (timeline)
-            try:
-                file_timeline = self.file_analyzer.get_file_change_frequency_analysis()
-                if not file_timeline.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=(
-                                file_timeline["file_path"][:10]
-                                if "file_path" in file_timeline.columns
-                                else file_timeline.index[:10]
-                            ),
-                            y=(
-                                file_timeline["change_intensity"][:10]
-                                if "change_intensity" in file_timeline.columns
-                                else file_timeline["commit_count"][:10]
-                            ),
-                            mode="lines+markers",
-                            name="Files Changed",
-                            line=dict(color="orange"),
+        # File change patterns (timeline)
+        if not file_timeline.empty:
+            top_timeline = file_timeline.head(10)
+            y_column = "change_intensity" if "change_intensity" in top_timeline.columns else "commit_count"
+            panels.append(
+                (
+                    go.Scattergl(
+                        x=(
+                            top_timeline["file_path"].to_numpy()
+                            if "file_path" in top_timeline.columns
+                            else top_timeline.index
                         ),
-                        row=2,
-                        col=2,
-                    )
-            except Exception as e:
-                logger.warning(f"Could not add file change timeline: {e}")
-
-            # Update layout
-            fig.update_layout(
-                title="File Analysis Dashboard",
-                showlegend=True,
-                height=800,
-                template="plotly_white",
+                        y=_float_values(top_timeline[y_column]),
+                        mode="lines+markers",
+                        name="Files Changed",
+                        line=dict(color="orange"),
+                    ),
+                    2,
+                    2,
+                )
             )
 
-            if save_path:
-                fig.write_html(save_path)
-                logger.info(f"File analysis visualization saved to {save_path}")
+        if panels:
+            traces, rows, cols = zip(*panels)
+            fig.add_traces(list(traces), rows=list(rows), cols=list(cols))
 
-            return fig
+        # Update layout
+        fig.update_layout(title="File Analysis Dashboard", **_DASHBOARD_LAYOUT)
 
-        except Exception as e:
-            logger.error(f"Error creating file analysis visualization: {e}")
-            return self._create_error_figure("Error creating file analysis visualization")
+        if save_path:
+            _write_html(fig, save_path, self.static_images, self.lazy_charts)
+            logger.info("File analysis visualization saved to %s", save_path)
 
+        return fig
+
+    @_error_figure_on_failure("enhanced file analysis dashboard")
     def create_enhanced_file_analysis_dashboard(self, save_path: Optional[str] = None) -> go.Figure:
         """
         Create an enhanced file analysis dashboard with advanced metrics.
@@ -208,161 +586,160 @@ class DashboardGenerator:
         Returns:
             plotly.graph_objects.Figure: Enhanced file analysis dashboard
         """
-        try:
-            # Get enhanced data
-            hotspots = self.file_analyzer.get_file_hotspots_analysis()
-            churn_analysis = self.file_analyzer.get_code_churn_analysis()
-            size_analysis = self.file_analyzer.get_commit_size_distribution_analysis()
-            doc_coverage = self.file_analyzer.get_documentation_coverage_analysis()
-
-            # Create subplots
-            fig = make_subplots(
-                rows=3,
-                cols=2,
-                subplot_titles=[
-                    "File Hotspots",
-                    "Code Churn Rate",
-                    "Commit Size Distribution",
-                    "Documentation Coverage",
-                    "File Change Frequency",
-                    "Directory Health",
-                ],
-                specs=[
-                    [{"secondary_y": False}, {"secondary_y": False}],
-                    [{"type": "histogram"}, {"type": "pie"}],
-                    [{"secondary_y": False}, {"secondary_y": False}],
-                ],
-            )
+        # Get enhanced data
+        hotspots, churn_analysis, size_analysis, doc_coverage, freq_analysis, dir_analysis = self._query_many(
+            [
+                ("file_hotspots", self.file_analyzer.get_file_hotspots_analysis, pd.DataFrame()),
+                ("code_churn", self.file_analyzer.get_code_churn_analysis, {}),
+                ("commit_size_distribution", self.file_analyzer.get_commit_size_distribution_analysis, {}),
+                ("documentation_coverage", self.file_analyzer.get_documentation_coverage_analysis, {}),
+                ("file_change_frequency", self.file_analyzer.get_file_change_frequency_analysis, pd.DataFrame()),
+                ("directory_analysis", self.file_analyzer.get_directory_analysis, pd.DataFrame()),
+            ]
+        )
 
-            # File hotspots
-            if not hotspots.empty:
-                fig.add_trace(
-                    go.Scatter(
-                        x=(
-                            hotspots["total_lines_changed"][:15]
-                            if "total_lines_changed" in hotspots.columns
-                            else range(len(hotspots[:15]))
-                        ),
-                        y=(
-                            hotspots["hotspot_score"][:15]
-                            if "hotspot_score" in hotspots.columns
-                            else hotspots.index[:15]
-                        ),
+        # Nothing to plot: skip building and saving a dashboard of empty panels
+        if (
+            hotspots.empty
+            and churn_analysis.get("file_churn_rates", pd.DataFrame()).empty
+            and "size_distribution" not in size_analysis
+            and not doc_coverage
+            and freq_analysis.empty
+            and dir_analysis.empty
+        ):
+            logger.warning("No file data available; enhanced file analysis dashboard not created")
+            return self._create_error_figure("No file data available for enhanced file analysis")
+
+        # Create subplots
+        fig = _subplot_grid("enhanced_file_analysis")
+        # (trace, row, col) for each panel, added to the figure in one batch
+        panels: List[Tuple[BaseTraceType, int, int]] = []
+
+        # File hotspots
+        if not hotspots.empty:
+            top = hotspots.head(15)
+            positions = top.index.to_numpy()
+            lines_changed = (
+                _count_values(top["total_lines_changed"])
+                if "total_lines_changed" in top.columns
+                else np.arange(len(top))
+            )
+            panels.append(
+                (
+                    go.Scattergl(
+                        x=lines_changed,
+                        y=_float_values(top["hotspot_score"]) if "hotspot_score" in top.columns else positions,
                         mode="markers",
                         marker=dict(
-                            size=hotspots["commit_count"][:15] if "commit_count" in hotspots.columns else 10,
-                            color=(
-                                hotspots["total_lines_changed"][:15]
-                                if "total_lines_changed" in hotspots.columns
-                                else range(len(hotspots[:15]))
-                            ),
+                            size=_marker_sizes(top["commit_count"]) if "commit_count" in top.columns else 10,
+                            color=lines_changed,
                             colorscale="Reds",
                             showscale=True,
                         ),
-                        text=hotspots.index[:15],  # Use index as file names
+                        text=positions,  # Use index as file names
                         name="Hotspots",
                     ),
-                    row=1,
-                    col=1,
+                    1,
+                    1,
                 )
+            )
 
-            # Code churn rate
-            if "file_churn_rates" in churn_analysis and not churn_analysis["file_churn_rates"].empty:
-                churn_data = churn_analysis["file_churn_rates"]
-                fig.add_trace(
+        # Code churn rate
+        if "file_churn_rates" in churn_analysis and not churn_analysis["file_churn_rates"].empty:
+            # Churn rates come in commit order, so pick the ten highest explicitly
+            churn_data = churn_analysis["file_churn_rates"].nlargest(10, "churn_rate")
+            panels.append(
+                (
                     go.Bar(
-                        x=churn_data["file_path"][:10],
-                        y=churn_data["churn_rate"],
+                        x=churn_data["file_path"].to_numpy(),
+                        y=_float_values(churn_data["churn_rate"]),
                         name="Churn Rate",
                         marker_color="coral",
                     ),
-                    row=1,
-                    col=2,
+                    1,
+                    2,
                 )
+            )
 
-            # Commit size distribution
-            if "size_distribution" in size_analysis:
-                sizes = list(size_analysis["size_distribution"].keys())
-                counts = list(size_analysis["size_distribution"].values())
-                fig.add_trace(
-                    go.Histogram(
-                        x=sizes,
-                        y=counts,
+        # Commit size distribution
+        if "size_distribution" in size_analysis:
+            size_distribution = size_analysis["size_distribution"]
+            panels.append(
+                (
+                    # Already counted per size bucket; a histogram would count the buckets again
+                    go.Bar(
+                        x=tuple(size_distribution),
+                        y=tuple(size_distribution.values()),
                         name="Size Distribution",
                         marker_color="lightblue",
                     ),
-                    row=2,
-                    col=1,
+                    2,
+                    1,
                 )
+            )
 
-            # Documentation coverage
-            doc_ratio = doc_coverage.get("documentation_ratio", 0)
-            code_ratio = 100 - doc_ratio
-            fig.add_trace(
-                go.Pie(
-                    labels=["Documentation", "Code"],
-                    values=[doc_ratio, code_ratio],
-                    name="Doc Coverage",
+        # Documentation coverage; a gauge is lighter than a two-slice pie
+        panels.append(
+            (
+                go.Indicator(
+                    mode="gauge+number",
+                    value=doc_coverage.get("documentation_ratio", 0),
+                    number={"suffix": "%"},
+                    gauge={"axis": {"range": [0, 100]}},
                 ),
-                row=2,
-                col=2,
+                2,
+                2,
             )
+        )
 
-            # File change frequency
-            try:
-                freq_analysis = self.file_analyzer.get_file_change_frequency_analysis()
-                if not freq_analysis.empty:
-                    fig.add_trace(
-                        go.Bar(
-                            x=freq_analysis["file_path"][:10],
-                            y=freq_analysis["change_intensity"][:10],
-                            name="Change Frequency",
-                            marker_color="purple",
-                        ),
-                        row=3,
-                        col=1,
-                    )
-            except Exception as e:
-                logger.warning(f"Could not add file change frequency: {e}")
+        # File change frequency
+        if not freq_analysis.empty:
+            top_frequency = freq_analysis.head(10)
+            panels.append(
+                (
+                    go.Bar(
+                        x=top_frequency["file_path"].to_numpy(),
+                        y=_float_values(top_frequency["change_intensity"]),
+                        name="Change Frequency",
+                        marker_color="purple",
+                    ),
+                    3,
+                    1,
+                )
+            )
 
-            # Directory health metrics
-            try:
-                dir_analysis = self.file_analyzer.get_directory_analysis()
-                if not dir_analysis.empty:
-                    dir_stats = dir_analysis
-                    fig.add_trace(
-                        go.Scatter(
-                            x=dir_stats["unique_files"][:10],
-                            y=dir_stats["avg_changes_per_file"][:10],
-                            mode="markers",
-                            marker=dict(size=12, color="green"),
-                            text=dir_stats["directory"][:10],
-                            name="Directory Health",
-                        ),
-                        row=3,
-                        col=2,
-                    )
-            except Exception as e:
-                logger.warning(f"Could not add directory health: {e}")
-
-            # Update layout
-            fig.update_layout(
-                title="Enhanced File Analysis Dashboard",
-                showlegend=True,
-                height=1200,
-                template="plotly_white",
+        # Directory health metrics
+        if not dir_analysis.empty:
+            dir_stats = dir_analysis.head(10)
+            panels.append(
+                (
+                    go.Scattergl(
+                        x=_count_values(dir_stats["unique_files"]),
+                        y=_float_values(dir_stats["avg_changes_per_file"]),
+                        mode="markers",
+                        marker=dict(size=12, color="green"),
+                        text=dir_stats["directory"].to_numpy(),
+                        name="Directory Health",
+                    ),
+                    3,
+                    2,
+                )
             )
 
-            if save_path:
-                fig.write_html(save_path)
-                logger.info(f"Enhanced file analysis dashboard saved to {save_path}")
+        if panels:
+            traces, rows, cols = zip(*panels)
+            fig.add_traces(list(traces), rows=list(rows), cols=list(cols))
 
-            return fig
+        # Update layout
+        fig.update_layout(title="Enhanced File Analysis Dashboard", **_ENHANCED_DASHBOARD_LAYOUT)
 
-        except Exception as e:
-            logger.error(f"Error creating enhanced file analysis dashboard: {e}")
-            return self._create_error_figure("Error creating enhanced file analysis dashboard")
+        if save_path:
+            _write_html(fig, save_path, self.static_images, self.lazy_charts)
+            logger.info("Enhanced file analysis dashboard saved to %s", save_path)
+
+        return fig
 
+    @_error_figure_on_failure("branch analysis dashboard")
     def create_branch_analysis_dashboard(self, save_path: Optional[str] = None) -> go.Figure:
         """
         Create a dashboard for branch analysis.
@@ -373,55 +750,47 @@ class DashboardGenerator:
         Returns:
             plotly.graph_objects.Figure: Branch analysis dashboard
         """
-        try:
-            # Get branch data
-            branch_stats = self.branch_analyzer.get_branch_statistics()
-            active_branches = self.branch_analyzer.get_branch_statistics()
-
-            # Create basic branch visualization
-            fig = make_subplots(
-                rows=2,
-                cols=2,
-                subplot_titles=[
-                    "Branch Activity",
-                    "Branch Age Distribution",
-                    "Commits per Branch",
-                    "Branch Status",
-                ],
-            )
+        # Get branch data
+        branch_stats = self._query("branch_statistics", self.branch_analyzer.get_branch_statistics, pd.DataFrame())
+        if branch_stats.empty:
+            logger.warning("No branch data available; branch analysis dashboard not created")
+            return self._create_error_figure("No branch data available for branch analysis")
+
+        # Create basic branch visualization
+        fig = _subplot_grid("branch_analysis")
+
+        # Branch activity over time
+        top_branches = branch_stats.head(10)
+        fig.add_trace(
+            go.Bar(
+                x=top_branches["branch_name"].to_numpy(),
+                y=_count_values(top_branches["total_commits"]),
+                name="Commits",
+                marker_color="skyblue",
+            ),
+            row=1,
+            col=1,
+        )
 
-            if not branch_stats.empty:
-                # Branch activity over time
-                fig.add_trace(
-                    go.Bar(
-                        x=branch_stats["branch"][:10],
-                        y=branch_stats["commits"],
-                        name="Commits",
-                        marker_color="skyblue",
-                    ),
-                    row=1,
-                    col=1,
-                )
+        fig.update_layout(title="Branch Analysis Dashboard", **_DASHBOARD_LAYOUT)
 
-            fig.update_layout(
-                title="Branch Analysis Dashboard",
-                showlegend=True,
-                height=800,
-                template="plotly_white",
-            )
+        if save_path:
+            _write_html(fig, save_path, self.static_images, self.lazy_charts)
+            logger.info("Branch analysis dashboard saved to %s", save_path)
 
-            if save_path:
-                fig.write_html(save_path)
-                logger.info(f"Branch analysis dashboard saved to {save_path}")
+        return fig
 
-            return fig
+    def _create_error_figure(self, error_message: str) -> go.Figure:
+        """Create a simple error figure when visualization fails.
 
-        except Exception as e:
-            logger.error(f"Error creating branch analysis dashboard: {e}")
-            return self._create_error_figure("Error creating branch analysis dashboard")
+        Figures for the most recent messages are kept and copied on later calls, so callers
+        may still modify the returned figure freely.
+        """
+        return go.Figure(self._error_figures(error_message))
 
-    def _create_error_figure(self, error_message: str) -> go.Figure:
-        """Create a simple error figure when visualization fails."""
+    @staticmethod
+    def _build_error_figure(error_message: str) -> go.Figure:
+        """Build the annotated error figure for a message."""
         fig = go.Figure()
         fig.add_annotation(
             text=error_message,
@@ -6,7 +6,10 @@ providing comprehensive repository summaries and metrics.
 """
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..analyzers import (
     BranchAnalyzer,
@@ -16,6 +19,7 @@ from ..analyzers import (
     advanced_metrics,
 )
 from ..core import GitRepository
+from ..core.git_repository import call_on_new_handle, is_analyzer_method
 from ..models.analysis import AnalysisConfig, AnalysisResults, AnalysisType
 from ..models.repository import AdvancedRepositorySummary, RepositoryInfo, RepositorySummary
 
@@ -30,21 +34,122 @@ class DataAggregator:
     by GitMetrics, providing clean separation of concerns.
     """
 
-    def __init__(self, git_repo: GitRepository):
+    def __init__(self, git_repo: GitRepository, parallel_analysis: bool = False):
         """
-        Initialize DataAggregator with analyzer instances.
+        Initialize DataAggregator.
+
+        Analyzers are created on first access, so a summary that only needs
+        some of them does not pay for the rest.
 
         Args:
             git_repo (GitRepository): GitRepository instance
+            parallel_analysis (bool): Run independent analyzer queries concurrently,
+                each on its own handle to the repository.
         """
         self.git_repo = git_repo
-        self.commit_analyzer = CommitAnalyzer(git_repo)
-        self.file_analyzer = FileAnalyzer(git_repo)
-        self.contributor_analyzer = ContributorAnalyzer(git_repo)
-        self.branch_analyzer = BranchAnalyzer(git_repo)
+        self.parallel_analysis = parallel_analysis
         # Advanced metrics can be accessed via advanced_metrics.create_metric_analyzer()
-
-        logger.info("DataAggregator initialized with all analyzers")
+        # Analyzer results shared between summaries, keyed by (name, args), for the HEAD in _cache_head
+        self._cache: Dict[Tuple[str, Tuple[Any, ...]], Any] = {}
+        self._cache_head: Optional[str] = None
+        self._cache_lock = threading.Lock()
+
+        logger.info("DataAggregator initialized")
+
+    @cached_property
+    def commit_analyzer(self) -> CommitAnalyzer:
+        """Commit analyzer, created on first use."""
+        return CommitAnalyzer(self.git_repo)
+
+    @cached_property
+    def file_analyzer(self) -> FileAnalyzer:
+        """File analyzer, created on first use."""
+        return FileAnalyzer(self.git_repo)
+
+    @cached_property
+    def contributor_analyzer(self) -> ContributorAnalyzer:
+        """Contributor analyzer, created on first use."""
+        return ContributorAnalyzer(self.git_repo)
+
+    @cached_property
+    def branch_analyzer(self) -> BranchAnalyzer:
+        """Branch analyzer, created on first use."""
+        return BranchAnalyzer(self.git_repo)
+
+    def _head_sha(self) -> Optional[str]:
+        """Return the sha of the repository HEAD, or None if it cannot be resolved."""
+        try:
+            head_sha = self.git_repo.repo.head.commit.hexsha
+        except Exception:
+            return None
+        return head_sha if isinstance(head_sha, str) else None
+
+    def _sync_cache_head(self) -> None:
+        """Drop cached results if HEAD has moved; the caller holds ``_cache_lock``."""
+        head_sha = self._head_sha()
+        if head_sha != self._cache_head:
+            self._cache.clear()
+            self._cache_head = head_sha
+
+    def _cached(self, key: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Return an analyzer result, computing it only the first time it is requested.
+
+        Cached results are dropped automatically when HEAD moves to a new commit.
+        The result is computed without holding the lock, so other lookups are not held
+        up by a slow analyzer; it is only stored if HEAD has not moved in the meantime.
+        """
+        cache_key = (key, args)
+        with self._cache_lock:
+            self._sync_cache_head()
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+            head_sha = self._cache_head
+        result = fn(*args)
+        with self._cache_lock:
+            if self._cache_head != head_sha:
+                return result
+            # Keep the first result if another thread computed the same query meanwhile
+            return self._cache.setdefault(cache_key, result)
+
+    def _cached_many(self, queries: List[Tuple[Any, ...]]) -> List[Any]:
+        """Resolve several independent ``(key, fn, *args)`` queries like ``_cached``.
+
+        With ``parallel_analysis``, uncached analyzer methods run concurrently, each on a
+        fresh analyzer with its own repository handle. Other callables run one at a time
+        on the calling thread. The first failing query's exception is raised.
+        """
+        if not self.parallel_analysis:
+            return [self._cached(*query) for query in queries]
+
+        with self._cache_lock:
+            self._sync_cache_head()
+            head_sha = self._cache_head
+            isolated = [
+                index
+                for index, (key, fn, *args) in enumerate(queries)
+                if (key, tuple(args)) not in self._cache and is_analyzer_method(fn, self.git_repo)
+            ]
+
+        results: Dict[int, Any] = {}
+        if isolated:
+            with ThreadPoolExecutor(max_workers=len(isolated)) as executor:
+                futures = {}
+                for index in isolated:
+                    _, fn, *args = queries[index]
+                    futures[index] = executor.submit(call_on_new_handle, fn, *args)
+            results = {index: future.result() for index, future in futures.items()}
+            with self._cache_lock:
+                if self._cache_head == head_sha:
+                    self._cache.update(
+                        {(queries[index][0], tuple(queries[index][2:])): result for index, result in results.items()}
+                    )
+
+        return [results[index] if index in results else self._cached(*query) for index, query in enumerate(queries)]
+
+    def clear_cache(self) -> None:
+        """Drop cached analyzer results, e.g. after the repository has changed."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def get_enhanced_repository_summary(self) -> Dict[str, Any]:
         """
@@ -58,10 +163,14 @@ class DataAggregator:
             basic_summary = self.generate_repository_summary()
 
             # Add new analytical capabilities
-            velocity_analysis = self.commit_analyzer.get_commit_velocity_analysis()
-            bug_fix_analysis = self.commit_analyzer.get_bug_fix_ratio_analysis()
-            churn_analysis = self.file_analyzer.get_code_churn_analysis()
-            doc_coverage = self.file_analyzer.get_documentation_coverage_analysis()
+            velocity_analysis, bug_fix_analysis, churn_analysis, doc_coverage = self._cached_many(
+                [
+                    ("commit_velocity", self.commit_analyzer.get_commit_velocity_analysis),
+                    ("bug_fix_ratio", self.commit_analyzer.get_bug_fix_ratio_analysis),
+                    ("code_churn", self.file_analyzer.get_code_churn_analysis),
+                    ("documentation_coverage", self.file_analyzer.get_documentation_coverage_analysis),
+                ]
+            )
 
             # Use new modular advanced metrics system
             from gitdecomposer.analyzers.advanced_metrics import create_metric_analyzer
@@ -143,7 +252,7 @@ class DataAggregator:
             # Get basic repository stats
             logger.info("Starting repository summary generation...")
             try:
-                repo_stats = self.git_repo.get_repository_stats()
+                repo_stats = self._cached("repository_stats", self.git_repo.get_repository_stats)
                 logger.info(f"Repository stats retrieved: {type(repo_stats)}")
             except Exception as e:
                 logger.warning(f"Error getting repository stats: {e}")
@@ -161,32 +270,36 @@ class DataAggregator:
 
             # Get analysis data from each analyzer
             try:
-                commit_data = self.commit_analyzer.get_commit_frequency_by_date()
-                commit_stats = self.commit_analyzer.get_commit_stats()
+                commit_data = self._cached(
+                    "commit_frequency_by_date", self.commit_analyzer.get_commit_frequency_by_date
+                )
+                commit_stats = self._cached("commit_stats", self.commit_analyzer.get_commit_stats)
             except Exception as e:
                 logger.warning(f"Error getting commit data: {e}")
                 commit_data = {}
                 commit_stats = {}
 
             try:
-                contributor_data = self.contributor_analyzer.get_contributor_statistics()
-                top_contributors = self.contributor_analyzer.get_top_contributors(top_n=10)
+                contributor_data = self._cached(
+                    "contributor_statistics", self.contributor_analyzer.get_contributor_statistics
+                )
+                top_contributors = self._cached("top_contributors", self.contributor_analyzer.get_top_contributors, 10)
             except Exception as e:
                 logger.warning(f"Error getting contributor data: {e}")
                 contributor_data = {}
                 top_contributors = []
 
             try:
-                file_data = self.file_analyzer.get_most_changed_files()
-                hotspots = self.file_analyzer.get_file_hotspots_analysis()
+                file_data = self._cached("most_changed_files", self.file_analyzer.get_most_changed_files)
+                hotspots = self._cached("file_hotspots", self.file_analyzer.get_file_hotspots_analysis)
             except Exception as e:
                 logger.warning(f"Error getting file data: {e}")
                 file_data = {}
                 hotspots = []
 
             try:
-                branch_data = self.branch_analyzer.get_branch_statistics()
-                active_branches = self.branch_analyzer.get_branch_statistics()
+                branch_data = self._cached("branch_statistics", self.branch_analyzer.get_branch_statistics)
+                active_branches = branch_data
             except Exception as e:
                 logger.warning(f"Error getting branch data: {e}")
                 branch_data = {}
@@ -256,7 +369,7 @@ class DataAggregator:
             RepositoryInfo: Basic repository information
         """
         try:
-            repo_stats = self.git_repo.get_repository_stats()
+            repo_stats = self._cached("repository_stats", self.git_repo.get_repository_stats)
 
             return RepositoryInfo(
                 name=getattr(self.git_repo.repo, "name", "Unknown"),
@@ -324,13 +437,19 @@ class DataAggregator:
 
             # Run analyses based on configuration
             if config.analysis_type in [AnalysisType.COMPREHENSIVE, AnalysisType.ADVANCED]:
-                results["commit_analysis"] = self.commit_analyzer.get_commit_stats()
-                results["contributor_analysis"] = self.contributor_analyzer.get_contributor_statistics()
-                results["file_analysis"] = self.file_analyzer.get_most_changed_files()
-                results["branch_analysis"] = self.branch_analyzer.get_branch_statistics()
+                results["commit_analysis"] = self._cached("commit_stats", self.commit_analyzer.get_commit_stats)
+                results["contributor_analysis"] = self._cached(
+                    "contributor_statistics", self.contributor_analyzer.get_contributor_statistics
+                )
+                results["file_analysis"] = self._cached("most_changed_files", self.file_analyzer.get_most_changed_files)
+                results["branch_analysis"] = self._cached(
+                    "branch_statistics", self.branch_analyzer.get_branch_statistics
+                )
             elif config.analysis_type == AnalysisType.BASIC:
-                results["commit_analysis"] = self.commit_analyzer.get_commit_stats()
-                results["contributor_analysis"] = self.contributor_analyzer.get_contributor_statistics()
+                results["commit_analysis"] = self._cached("commit_stats", self.commit_analyzer.get_commit_stats)
+                results["contributor_analysis"] = self._cached(
+                    "contributor_statistics", self.contributor_analyzer.get_contributor_statistics
+                )
             # For CUSTOM, handle via custom_metrics if needed
 
             return {
@@ -7,6 +7,7 @@ to various formats like CSV files.
 
 import logging
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict
 
@@ -35,21 +36,44 @@ class ExportService:
 
     def __init__(self, git_repo: GitRepository):
         """
-        Initialize ExportService with analyzer instances.
+        Initialize ExportService.
+
+        Analyzers are created on first access, so an export that only needs
+        some of them does not pay for the rest.
 
         Args:
             git_repo (GitRepository): GitRepository instance
         """
         self.git_repo = git_repo
-        self.commit_analyzer = CommitAnalyzer(git_repo)
-        self.file_analyzer = FileAnalyzer(git_repo)
-        self.contributor_analyzer = ContributorAnalyzer(git_repo)
-        self.branch_analyzer = BranchAnalyzer(git_repo)
         # Advanced metrics module for creating metric analyzers
         self.advanced_metrics = advanced_metrics
-        self.legacy_advanced_metrics = legacy_advanced_metrics.AdvancedMetrics(git_repo)
 
-        logger.info("ExportService initialized with all analyzers")
+        logger.info("ExportService initialized")
+
+    @cached_property
+    def commit_analyzer(self) -> CommitAnalyzer:
+        """Commit analyzer, created on first use."""
+        return CommitAnalyzer(self.git_repo)
+
+    @cached_property
+    def file_analyzer(self) -> FileAnalyzer:
+        """File analyzer, created on first use."""
+        return FileAnalyzer(self.git_repo)
+
+    @cached_property
+    def contributor_analyzer(self) -> ContributorAnalyzer:
+        """Contributor analyzer, created on first use."""
+        return ContributorAnalyzer(self.git_repo)
+
+    @cached_property
+    def branch_analyzer(self) -> BranchAnalyzer:
+        """Branch analyzer, created on first use."""
+        return BranchAnalyzer(self.git_repo)
+
+    @cached_property
+    def legacy_advanced_metrics(self) -> legacy_advanced_metrics.AdvancedMetrics:
+        """Legacy advanced metrics calculator, created on first use."""
+        return legacy_advanced_metrics.AdvancedMetrics(self.git_repo)
 
     def export_metrics_to_csv(self, output_dir: str) -> Dict[str, str]:
         """
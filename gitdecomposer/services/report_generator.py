@@ -5,10 +5,14 @@ This service handles generating HTML reports and comprehensive
 analysis documentation.
 """
 
+import io
 import logging
 import os
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from string import Template
+from typing import Dict, Optional, TextIO
 
 import plotly.graph_objects as go
 
@@ -22,9 +26,232 @@ from ..analyzers import (
 from ..core import GitRepository
 from ..viz import VisualizationEngine
 from .advanced_report_generator import AdvancedReportGenerator
+from .dashboard_generator import DashboardGenerator
 
 logger = logging.getLogger(__name__)
 
+# Distinct error messages whose figures each generator keeps for reuse
+_MAX_ERROR_FIGURES = 16
+
+
+def _minify_css(css: str) -> str:
+    """Collapse whitespace in a static stylesheet so it is shipped compactly in every page."""
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,])\s*", r"\1", css).strip()
+
+
+# Stylesheets are minified once at import rather than re-emitted verbatim per report
+_INDEX_CSS = _minify_css("""
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 10px 30px rgba(0,0,0,0.3); }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px; border-radius: 15px 15px 0 0; text-align: center; }
+        .header h1 { margin: 0; font-size: 2.5em; font-weight: 300; }
+        .header p { margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }
+        .content { padding: 40px; }
+        .reports-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin-top: 30px; }
+        .report-card { background: #f8f9fa; border-radius: 10px; padding: 25px; border-left: 4px solid #667eea; transition: transform 0.3s ease; }
+        .report-card:hover { transform: translateY(-5px); box-shadow: 0 5px 20px rgba(0,0,0,0.1); }
+        .report-card h3 { margin: 0 0 10px 0; color: #333; }
+        .report-card p { color: #666; margin: 0 0 15px 0; }
+        .report-card a { background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; transition: background 0.3s ease; }
+        .report-card a:hover { background: #5a6fd8; }
+        .footer { text-align: center; padding: 20px; color: #666; border-top: 1px solid #eee; }
+""")
+
+_EXECUTIVE_SUMMARY_CSS = _minify_css("""
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px 10px 0 0; text-align: center; }
+        .header h1 { margin: 0; font-size: 2em; }
+        .health-score { font-size: 3em; font-weight: bold; margin: 10px 0; }
+        .content { padding: 30px; }
+        .metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+        .metric { background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; }
+        .metric-value { font-size: 2em; font-weight: bold; color: #667eea; }
+        .metric-label { color: #666; margin-top: 5px; }
+""")
+
+_CSV_DATA_CSS = _minify_css("""
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 10px 30px rgba(0,0,0,0.3); }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px; border-radius: 15px 15px 0 0; text-align: center; }
+        .header h1 { margin: 0; font-size: 2.5em; font-weight: 300; }
+        .header p { margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }
+        .content { padding: 40px; }
+        .nav-links { margin-bottom: 30px; padding: 15px; background: #f8f9fa; border-radius: 10px; text-align: center; }
+        .nav-links a { background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; margin: 0 10px; display: inline-block; transition: background 0.3s ease; }
+        .nav-links a:hover { background: #5a6fd8; }
+        .csv-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); gap: 20px; margin-top: 30px; }
+        .csv-card { background: #f8f9fa; border-radius: 10px; padding: 25px; border-left: 4px solid #28a745; transition: transform 0.3s ease; }
+        .csv-card:hover { transform: translateY(-5px); box-shadow: 0 5px 20px rgba(0,0,0,0.1); }
+        .csv-card h3 { margin: 0 0 10px 0; color: #333; }
+        .csv-card p { color: #666; margin: 0 0 15px 0; }
+        .csv-card .file-info { font-size: 0.9em; color: #888; margin-bottom: 15px; }
+        .csv-card a { background: #28a745; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; transition: background 0.3s ease; }
+        .csv-card a:hover { background: #218838; }
+        .footer { text-align: center; padding: 20px; color: #666; border-top: 1px solid #eee; }
+        .summary { background: #e8f4f8; padding: 20px; border-radius: 10px; margin-bottom: 30px; }
+        .summary h3 { margin-top: 0; color: #0056b3; }
+""")
+
+# Static page shell compiled once; only the summary values and chart vary per report.
+# It is split around the chart fragment so the fragment can be written straight to the output file.
+_EXECUTIVE_SUMMARY_HEAD = Template(
+    """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Executive Summary</title>
+    <style>"""
+    + _EXECUTIVE_SUMMARY_CSS
+    + """</style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Executive Summary</h1>
+            <div class="health-score">$health_score/100</div>
+            <div>Repository Health: $health_category</div>
+        </div>
+        
+        <div class="content">
+            <div class="metrics-grid">
+                <div class="metric">
+                    <div class="metric-value">$total_commits</div>
+                    <div class="metric-label">Total Commits</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$total_contributors</div>
+                    <div class="metric-label">Contributors</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$total_files</div>
+                    <div class="metric-label">Total Files</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$total_branches</div>
+                    <div class="metric-label">Branches</div>
+                </div>
+            </div>
+            
+            """
+)
+
+_EXECUTIVE_SUMMARY_TAIL = """
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+# Index and CSV data page shells compiled once; each available file adds one card.
+_INDEX_HEAD = Template(
+    """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitDecomposer Analysis - $repo_name</title>
+    <style>"""
+    + _INDEX_CSS
+    + """</style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>GitDecomposer Analysis</h1>
+            <p>Repository: $repo_name</p>
+            <p>Path: $repo_path</p>
+        </div>
+        
+        <div class="content">
+            <h2>Available Reports</h2>
+            <div class="reports-grid">
+"""
+)
+
+_INDEX_CARD = Template("""                <div class="report-card">
+                    <h3>$title</h3>
+                    <p>$description</p>
+                    <a href="HTML/$filename">View Report</a>
+                </div>
+""")
+
+_INDEX_TAIL = """            </div>
+            
+            <div style="margin-top: 40px; padding: 20px; background: #e8f4f8; border-radius: 10px;">
+                <h3 style="margin-top: 0; color: #0056b3;">Raw Data Export</h3>
+                <p style="margin-bottom: 15px;">Access detailed CSV data files for custom analysis and reporting.</p>
+                <a href="csv_data.html" style="background: #28a745; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block; transition: background 0.3s ease;">View CSV Data Files</a>
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p>Generated by GitDecomposer - Repository Analysis Tool</p>
+        </div>
+    </div>
+</body>
+</html>"""
+
+_CSV_DATA_HEAD = Template(
+    """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitDecomposer CSV Data - Repository Analysis</title>
+    <style>"""
+    + _CSV_DATA_CSS
+    + """</style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>CSV Data Export</h1>
+            <p>GitDecomposer Repository Analysis - Raw Data</p>
+        </div>
+        
+        <div class="content">
+            <div class="nav-links">
+                <a href="index.html">← Back to Main Dashboard</a>
+                <a href="HTML/" target="_blank">View HTML Reports</a>
+            </div>
+            
+            <div class="summary">
+                <h3>Data Export Summary</h3>
+                <p>This page provides access to all the raw data generated during the repository analysis. 
+                Each CSV file contains detailed metrics that can be imported into spreadsheet applications, 
+                data analysis tools, or custom dashboards for further analysis.</p>
+                <p><strong>Total Files Available:</strong> $total_files CSV files</p>
+            </div>
+
+            <h2>Available CSV Data Files</h2>
+            <div class="csv-grid">
+"""
+)
+
+_CSV_DATA_CARD = Template("""                <div class="csv-card">
+                    <h3>$title</h3>
+                    <p>$description</p>
+                    <div class="file-info">
+                        📄 $filename • $file_size_kb KB
+                    </div>
+                    <a href="CSV/$filename" download>Download CSV</a>
+                </div>
+""")
+
+_CSV_DATA_TAIL = """            </div>
+        </div>
+        
+        <div class="footer">
+            <p>Generated by GitDecomposer - Repository Analysis Tool</p>
+            <p>Tip: Right-click on download links and select "Save As" to save files to your computer</p>
+        </div>
+    </div>
+</body>
+</html>"""
+
 
 class ReportGenerator:
     """
@@ -34,24 +261,64 @@ class ReportGenerator:
     by GitMetrics, providing clean separation of concerns.
     """
 
-    def __init__(self, git_repo: GitRepository):
+    def __init__(self, git_repo: GitRepository, cache_dir: Optional[str] = None):
         """
-        Initialize ReportGenerator with analyzer instances.
+        Initialize ReportGenerator.
+
+        Analyzers, generators and the visualization engine are created on first
+        access, so a caller that builds a single report only pays for what it uses.
 
         Args:
             git_repo (GitRepository): GitRepository instance
+            cache_dir (Optional[str]): Directory for reusing saved advanced reports
+                across runs while no ref has moved; disabled when None
         """
         self.git_repo = git_repo
-        self.commit_analyzer = CommitAnalyzer(git_repo)
-        self.file_analyzer = FileAnalyzer(git_repo)
-        self.contributor_analyzer = ContributorAnalyzer(git_repo)
-        self.branch_analyzer = BranchAnalyzer(git_repo)
-        self.advanced_report_generator = AdvancedReportGenerator(git_repo, advanced_metrics)
-        # Advanced metrics can be accessed via advanced_metrics.create_metric_analyzer()
-        # Initialize visualization engine with self as metrics coordinator
-        self.visualization = VisualizationEngine(git_repo, self)
-
-        logger.info("ReportGenerator initialized with all analyzers and visualization engine")
+        self.cache_dir = cache_dir
+        # Error figures built by this generator, keyed by message
+        self._error_figures = lru_cache(maxsize=_MAX_ERROR_FIGURES)(self._build_error_figure)
+
+        logger.info("ReportGenerator initialized")
+
+    @cached_property
+    def commit_analyzer(self) -> CommitAnalyzer:
+        """Commit analyzer, created on first use."""
+        return CommitAnalyzer(self.git_repo)
+
+    @cached_property
+    def file_analyzer(self) -> FileAnalyzer:
+        """File analyzer, created on first use."""
+        return FileAnalyzer(self.git_repo)
+
+    @cached_property
+    def contributor_analyzer(self) -> ContributorAnalyzer:
+        """Contributor analyzer, created on first use."""
+        return ContributorAnalyzer(self.git_repo)
+
+    @cached_property
+    def branch_analyzer(self) -> BranchAnalyzer:
+        """Branch analyzer, created on first use."""
+        return BranchAnalyzer(self.git_repo)
+
+    @cached_property
+    def advanced_report_generator(self) -> AdvancedReportGenerator:
+        """Advanced metric report generator, created on first use."""
+        return AdvancedReportGenerator(self.git_repo, advanced_metrics, cache_dir=self.cache_dir)
+
+    def close(self) -> None:
+        """Wait for queued advanced report writes and stop their I/O thread, if one was started."""
+        if "advanced_report_generator" in self.__dict__:
+            self.advanced_report_generator.close()
+
+    @cached_property
+    def dashboard_generator(self) -> DashboardGenerator:
+        """One dashboard generator for all reports, so analyzer results are computed once per run."""
+        return DashboardGenerator(self.git_repo)
+
+    @cached_property
+    def visualization(self) -> VisualizationEngine:
+        """Visualization engine using this generator as its metrics coordinator."""
+        return VisualizationEngine(self.git_repo, self)
 
     def generate_all_visualizations(self, output_dir: str) -> Dict[str, str]:
         """
@@ -105,6 +372,16 @@ class ReportGenerator:
 
                     traceback.print_exc()  # Print full traceback
 
+            # Advanced reports are written in the background, so only count the files that landed
+            try:
+                self.advanced_report_generator.flush()
+            except Exception as e:
+                logger.error(f"Error writing advanced reports: {e}")
+            for report_name, _, generator_func in reports:
+                queued = getattr(generator_func, "__self__", None) is self.advanced_report_generator
+                if queued and report_name in generated_files and not os.path.exists(generated_files[report_name]):
+                    del generated_files[report_name]
+
             # Generate index page
             index_path = os.path.join(output_dir, "index.html")
             self.create_index_page_only(output_dir)
@@ -125,6 +402,12 @@ class ReportGenerator:
             output_dir (str): Directory containing the reports
         """
         try:
+            # Make sure queued advanced report writes have landed before linking them
+            try:
+                self.advanced_report_generator.flush()
+            except Exception as e:
+                logger.error(f"Error writing advanced reports: {e}")
+
             # Define the expected report files
             report_files = [
                 ("commit_activity.html", "Commit Activity Analysis", "Analysis of commit patterns over time"),
@@ -228,154 +511,15 @@ class ReportGenerator:
                 file_size_kb = round(file_size / 1024, 1)
                 existing_files.append((filename, title, description, file_size_kb))
 
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitDecomposer CSV Data - Repository Analysis</title>
-    <style>
-        body {{ 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            margin: 0; 
-            padding: 20px; 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-        }}
-        .container {{ 
-            max-width: 1200px; 
-            margin: 0 auto; 
-            background: white; 
-            border-radius: 15px; 
-            box-shadow: 0 10px 30px rgba(0,0,0,0.3); 
-        }}
-        .header {{ 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-            color: white; 
-            padding: 40px; 
-            border-radius: 15px 15px 0 0; 
-            text-align: center; 
-        }}
-        .header h1 {{ margin: 0; font-size: 2.5em; font-weight: 300; }}
-        .header p {{ margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }}
-        .content {{ padding: 40px; }}
-        .nav-links {{ 
-            margin-bottom: 30px; 
-            padding: 15px; 
-            background: #f8f9fa; 
-            border-radius: 10px; 
-            text-align: center; 
-        }}
-        .nav-links a {{ 
-            background: #667eea; 
-            color: white; 
-            padding: 10px 20px; 
-            text-decoration: none; 
-            border-radius: 5px; 
-            margin: 0 10px; 
-            display: inline-block; 
-            transition: background 0.3s ease; 
-        }}
-        .nav-links a:hover {{ background: #5a6fd8; }}
-        .csv-grid {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); 
-            gap: 20px; 
-            margin-top: 30px; 
-        }}
-        .csv-card {{ 
-            background: #f8f9fa; 
-            border-radius: 10px; 
-            padding: 25px; 
-            border-left: 4px solid #28a745; 
-            transition: transform 0.3s ease; 
-        }}
-        .csv-card:hover {{ 
-            transform: translateY(-5px); 
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1); 
-        }}
-        .csv-card h3 {{ margin: 0 0 10px 0; color: #333; }}
-        .csv-card p {{ color: #666; margin: 0 0 15px 0; }}
-        .csv-card .file-info {{ 
-            font-size: 0.9em; 
-            color: #888; 
-            margin-bottom: 15px; 
-        }}
-        .csv-card a {{ 
-            background: #28a745; 
-            color: white; 
-            padding: 10px 20px; 
-            text-decoration: none; 
-            border-radius: 5px; 
-            display: inline-block; 
-            transition: background 0.3s ease; 
-        }}
-        .csv-card a:hover {{ background: #218838; }}
-        .footer {{ 
-            text-align: center; 
-            padding: 20px; 
-            color: #666; 
-            border-top: 1px solid #eee; 
-        }}
-        .summary {{ 
-            background: #e8f4f8; 
-            padding: 20px; 
-            border-radius: 10px; 
-            margin-bottom: 30px; 
-        }}
-        .summary h3 {{ margin-top: 0; color: #0056b3; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>CSV Data Export</h1>
-            <p>GitDecomposer Repository Analysis - Raw Data</p>
-        </div>
-        
-        <div class="content">
-            <div class="nav-links">
-                <a href="index.html">← Back to Main Dashboard</a>
-                <a href="HTML/" target="_blank">View HTML Reports</a>
-            </div>
-            
-            <div class="summary">
-                <h3>Data Export Summary</h3>
-                <p>This page provides access to all the raw data generated during the repository analysis. 
-                Each CSV file contains detailed metrics that can be imported into spreadsheet applications, 
-                data analysis tools, or custom dashboards for further analysis.</p>
-                <p><strong>Total Files Available:</strong> {len(existing_files)} CSV files</p>
-            </div>
-
-            <h2>Available CSV Data Files</h2>
-            <div class="csv-grid">
-"""
-
-        # Add CSV file cards
+        html_parts = [_CSV_DATA_HEAD.substitute(total_files=len(existing_files))]
         for filename, title, description, file_size_kb in existing_files:
-            html_content += f"""
-                <div class="csv-card">
-                    <h3>{title}</h3>
-                    <p>{description}</p>
-                    <div class="file-info">
-                        📄 {filename} • {file_size_kb} KB
-                    </div>
-                    <a href="CSV/{filename}" download>Download CSV</a>
-                </div>
-"""
-
-        html_content += """
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>Generated by GitDecomposer - Repository Analysis Tool</p>
-            <p>Tip: Right-click on download links and select "Save As" to save files to your computer</p>
-        </div>
-    </div>
-</body>
-</html>"""
-
-        return html_content
+            html_parts.append(
+                _CSV_DATA_CARD.substitute(
+                    title=title, description=description, filename=filename, file_size_kb=file_size_kb
+                )
+            )
+        html_parts.append(_CSV_DATA_TAIL)
+        return "".join(html_parts)
 
     def create_executive_summary_report(self, save_path: Optional[str] = None) -> go.Figure:
         """
@@ -399,10 +543,9 @@ class ReportGenerator:
             fig = self._create_executive_summary_figure(enhanced_summary, basic_summary)
 
             if save_path:
-                # Generate full HTML report
-                html_content = self._generate_executive_summary_html(enhanced_summary, basic_summary, fig)
-                with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
+                # Stream the full HTML report to disk instead of assembling it in memory first
+                with open(save_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    self._write_executive_summary_html(f, enhanced_summary, basic_summary, fig)
                 logger.info(f"Executive summary report saved to {save_path}")
 
             return fig
@@ -430,13 +573,10 @@ class ReportGenerator:
             enhanced_summary = aggregator.get_enhanced_repository_summary()
             basic_summary = aggregator.generate_repository_summary()
 
-            # Create comprehensive HTML content
-            html_content = self._generate_comprehensive_html(enhanced_summary, basic_summary)
-
-            # Save the report
+            # Stream the report to disk instead of building the whole page in memory first
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                self._write_comprehensive_html(f, enhanced_summary, basic_summary)
 
             logger.info(f"Comprehensive report created: {output_path}")
             return True
@@ -447,31 +587,19 @@ class ReportGenerator:
 
     def _create_commit_activity_dashboard(self, save_path: str) -> None:
         """Create commit activity dashboard."""
-        from .dashboard_generator import DashboardGenerator
-
-        dashboard = DashboardGenerator(self.git_repo)
-        dashboard.create_commit_activity_dashboard(save_path)
+        self.dashboard_generator.create_commit_activity_dashboard(save_path)
 
     def _create_contributor_analysis_charts(self, save_path: str) -> None:
         """Create contributor analysis charts."""
-        from .dashboard_generator import DashboardGenerator
-
-        dashboard = DashboardGenerator(self.git_repo)
-        dashboard.create_contributor_analysis_charts(save_path)
+        self.dashboard_generator.create_contributor_analysis_charts(save_path)
 
     def _create_file_analysis_visualization(self, save_path: str) -> None:
         """Create file analysis visualization."""
-        from .dashboard_generator import DashboardGenerator
-
-        dashboard = DashboardGenerator(self.git_repo)
-        dashboard.create_file_analysis_visualization(save_path)
+        self.dashboard_generator.create_file_analysis_visualization(save_path)
 
     def _create_enhanced_file_analysis_dashboard(self, save_path: str) -> None:
         """Create enhanced file analysis dashboard."""
-        from .dashboard_generator import DashboardGenerator
-
-        dashboard = DashboardGenerator(self.git_repo)
-        dashboard.create_enhanced_file_analysis_dashboard(save_path)
+        self.dashboard_generator.create_enhanced_file_analysis_dashboard(save_path)
 
     def _create_executive_summary_report(self, save_path: str) -> None:
         """Create executive summary report."""
@@ -483,72 +611,13 @@ class ReportGenerator:
         repo_name = getattr(self.git_repo.repo, "name", "Repository")
         repo_path = str(self.git_repo.repo_path)
 
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitDecomposer Analysis - {repo_name}</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 15px; box-shadow: 0 10px 30px rgba(0,0,0,0.3); }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 40px; border-radius: 15px 15px 0 0; text-align: center; }}
-        .header h1 {{ margin: 0; font-size: 2.5em; font-weight: 300; }}
-        .header p {{ margin: 10px 0 0 0; opacity: 0.9; font-size: 1.1em; }}
-        .content {{ padding: 40px; }}
-        .reports-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin-top: 30px; }}
-        .report-card {{ background: #f8f9fa; border-radius: 10px; padding: 25px; border-left: 4px solid #667eea; transition: transform 0.3s ease; }}
-        .report-card:hover {{ transform: translateY(-5px); box-shadow: 0 5px 20px rgba(0,0,0,0.1); }}
-        .report-card h3 {{ margin: 0 0 10px 0; color: #333; }}
-        .report-card p {{ color: #666; margin: 0 0 15px 0; }}
-        .report-card a {{ background: #667eea; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block; transition: background 0.3s ease; }}
-        .report-card a:hover {{ background: #5a6fd8; }}
-        .footer {{ text-align: center; padding: 20px; color: #666; border-top: 1px solid #eee; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>GitDecomposer Analysis</h1>
-            <p>Repository: {repo_name}</p>
-            <p>Path: {repo_path}</p>
-        </div>
-        
-        <div class="content">
-            <h2>Available Reports</h2>
-            <div class="reports-grid">
-"""
-
-        # Add report cards
+        html_parts = [_INDEX_HEAD.substitute(repo_name=repo_name, repo_path=repo_path)]
         for filename, title, description in report_files:
             file_path = os.path.join(output_dir, "HTML", filename)
             if os.path.exists(file_path):
-                html_content += f"""
-                <div class="report-card">
-                    <h3>{title}</h3>
-                    <p>{description}</p>
-                    <a href="HTML/{filename}">View Report</a>
-                </div>
-"""
-
-        html_content += """
-            </div>
-            
-            <div style="margin-top: 40px; padding: 20px; background: #e8f4f8; border-radius: 10px;">
-                <h3 style="margin-top: 0; color: #0056b3;">Raw Data Export</h3>
-                <p style="margin-bottom: 15px;">Access detailed CSV data files for custom analysis and reporting.</p>
-                <a href="csv_data.html" style="background: #28a745; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block; transition: background 0.3s ease;">View CSV Data Files</a>
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>Generated by GitDecomposer - Repository Analysis Tool</p>
-        </div>
-    </div>
-</body>
-</html>"""
-
-        return html_content
+                html_parts.append(_INDEX_CARD.substitute(title=title, description=description, filename=filename))
+        html_parts.append(_INDEX_TAIL)
+        return "".join(html_parts)
 
     def _create_executive_summary_figure(self, enhanced_summary: dict, basic_summary: dict) -> go.Figure:
         """Create executive summary figure."""
@@ -581,80 +650,56 @@ class ReportGenerator:
 
     def _generate_executive_summary_html(self, enhanced_summary: dict, basic_summary: dict, fig: go.Figure) -> str:
         """Generate executive summary HTML content."""
+        buffer = io.StringIO()
+        self._write_executive_summary_html(buffer, enhanced_summary, basic_summary, fig)
+        return buffer.getvalue()
+
+    def _write_executive_summary_html(
+        self, out: TextIO, enhanced_summary: dict, basic_summary: dict, fig: go.Figure
+    ) -> None:
+        """Write executive summary HTML to a text stream piece by piece."""
         health_score = enhanced_summary.get("repository_health_score", 0)
         health_category = enhanced_summary.get("repository_health_category", "Unknown")
 
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Executive Summary</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px 10px 0 0; text-align: center; }}
-        .header h1 {{ margin: 0; font-size: 2em; }}
-        .health-score {{ font-size: 3em; font-weight: bold; margin: 10px 0; }}
-        .content {{ padding: 30px; }}
-        .metrics-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .metric {{ background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; }}
-        .metric-value {{ font-size: 2em; font-weight: bold; color: #667eea; }}
-        .metric-label {{ color: #666; margin-top: 5px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Executive Summary</h1>
-            <div class="health-score">{health_score:.1f}/100</div>
-            <div>Repository Health: {health_category}</div>
-        </div>
-        
-        <div class="content">
-            <div class="metrics-grid">
-                <div class="metric">
-                    <div class="metric-value">{basic_summary.get('commits', {}).get('total_commits', 0):,}</div>
-                    <div class="metric-label">Total Commits</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{basic_summary.get('contributors', {}).get('total_contributors', 0)}</div>
-                    <div class="metric-label">Contributors</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{basic_summary.get('files', {}).get('total_files', 0):,}</div>
-                    <div class="metric-label">Total Files</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{basic_summary.get('branches', {}).get('total_branches', 0)}</div>
-                    <div class="metric-label">Branches</div>
-                </div>
-            </div>
-            
-            <div id="chart"></div>
-        </div>
-    </div>
-    
-    <script>
-        var chartData = {fig.to_json()};
-        Plotly.newPlot('chart', chartData.data, chartData.layout);
-    </script>
-</body>
-</html>"""
-
-        return html_content
+        out.write(
+            _EXECUTIVE_SUMMARY_HEAD.substitute(
+                health_score=f"{health_score:.1f}",
+                health_category=health_category,
+                total_commits=f"{basic_summary.get('commits', {}).get('total_commits', 0):,}",
+                total_contributors=basic_summary.get("contributors", {}).get("total_contributors", 0),
+                total_files=f"{basic_summary.get('files', {}).get('total_files', 0):,}",
+                total_branches=basic_summary.get("branches", {}).get("total_branches", 0),
+            )
+        )
+        # The fragment carries its own pinned plotly.js <script> tag from the CDN
+        out.write(fig.to_html(include_plotlyjs="cdn", full_html=False, div_id="chart", config={"responsive": True}))
+        out.write(_EXECUTIVE_SUMMARY_TAIL)
 
     def _generate_comprehensive_html(self, enhanced_summary: dict, basic_summary: dict) -> str:
         """Generate comprehensive report HTML content."""
+        buffer = io.StringIO()
+        self._write_comprehensive_html(buffer, enhanced_summary, basic_summary)
+        return buffer.getvalue()
+
+    def _write_comprehensive_html(self, out: TextIO, enhanced_summary: dict, basic_summary: dict) -> None:
+        """Write comprehensive report HTML to a text stream piece by piece."""
         # This would be a much more detailed HTML report
-        # For now, return a simplified version
-        return self._generate_executive_summary_html(
-            enhanced_summary, basic_summary, self._create_executive_summary_figure(enhanced_summary, basic_summary)
+        # For now, write a simplified version
+        self._write_executive_summary_html(
+            out, enhanced_summary, basic_summary, self._create_executive_summary_figure(enhanced_summary, basic_summary)
         )
 
     def _create_error_figure(self, error_message: str) -> go.Figure:
-        """Create a simple error figure when visualization fails."""
+        """Create a simple error figure when visualization fails.
+
+        Figures for the most recent messages are kept and copied on later calls, so callers
+        may still modify the returned figure freely.
+        """
+        return go.Figure(self._error_figures(error_message))
+
+    @staticmethod
+    def _build_error_figure(error_message: str) -> go.Figure:
+        """Build the annotated error figure for a message."""
         fig = go.Figure()
         fig.add_annotation(
             text=error_message,
@@ -3,10 +3,26 @@ Base class for all plotting modules in GitDecomposer.
 """
 
 from abc import ABC, abstractmethod
+from string import Template
 from typing import Optional
 
 import plotly.graph_objects as go
 
+# Page pieces written around the chart by BasePlotter.save_html, parsed once at import
+_PAGE_HEAD = '<html>\n<head><meta charset="utf-8" /></head>\n<body>\n'
+_PAGE_TAIL = "\n</body>\n</html>"
+_EXPLANATIONS_HEAD = """
+            <div style="font-family: sans-serif; padding: 20px; margin: 20px; border: 1px solid #ddd; border-radius: 5px;">
+                <h2 style="border-bottom: 1px solid #ddd; padding-bottom: 10px;">Chart Explanations</h2>
+            """
+_EXPLANATION_ITEM = Template("""
+                <div style="margin-bottom: 15px;">
+                    <h3 style="color: #333;">$title</h3>
+                    <p style="color: #555;">$description</p>
+                </div>
+                """)
+_EXPLANATIONS_TAIL = "</div>"
+
 
 class BasePlotter(ABC):
     """
@@ -46,32 +62,19 @@ class BasePlotter(ABC):
             save_path (str): Path to save the HTML file
             visualization_type (str): The type of visualization to get descriptions for.
         """
-        html = fig.to_html(full_html=True, include_plotlyjs="cdn")
-
-        # Create the explanation HTML
         descriptions = self.get_subplot_descriptions(visualization_type)
-        if descriptions:
-            explanation_html = """
-            <div style="font-family: sans-serif; padding: 20px; margin: 20px; border: 1px solid #ddd; border-radius: 5px;">
-                <h2 style="border-bottom: 1px solid #ddd; padding-bottom: 10px;">Chart Explanations</h2>
-            """
-            for title, desc in descriptions.items():
-                explanation_html += f"""
-                <div style="margin-bottom: 15px;">
-                    <h3 style="color: #333;">{title}</h3>
-                    <p style="color: #555;">{desc}</p>
-                </div>
-                """
-            explanation_html += "</div>"
-
-            # Inject the explanation before the closing body tag
-            if "</body>" in html:
-                html = html.replace("</body>", explanation_html + "</body>")
-            else:
-                html += explanation_html
 
-        with open(save_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        # Write the page piece by piece (the same shell plotly uses for full_html=True) so the
+        # explanation section never has to be spliced into one large in-memory HTML string
+        with open(save_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(_PAGE_HEAD)
+            f.write(fig.to_html(full_html=False, include_plotlyjs="cdn"))
+            if descriptions:
+                f.write(_EXPLANATIONS_HEAD)
+                for title, desc in descriptions.items():
+                    f.write(_EXPLANATION_ITEM.substitute(title=title, description=desc))
+                f.write(_EXPLANATIONS_TAIL)
+            f.write(_PAGE_TAIL)
 
     @property
     @abstractmethod
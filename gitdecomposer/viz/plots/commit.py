@@ -67,7 +67,7 @@ class CommitPlotter(BasePlotter):
         # Commits over time
         if not commits_by_date.empty:
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=commits_by_date["date"],
                     y=commits_by_date["commit_count"],
                     mode="lines+markers",
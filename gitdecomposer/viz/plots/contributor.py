@@ -63,17 +63,18 @@ class ContributorPlotter(BasePlotter):
 
         if not contributors.empty:
             top_10_commits = contributors.head(10)
+            top_authors = top_10_commits["author"].to_numpy()
 
             fig.add_trace(
-                go.Bar(x=top_10_commits["author"], y=top_10_commits["total_commits"], name="Commits"),
+                go.Bar(x=top_authors, y=top_10_commits["total_commits"].to_numpy(), name="Commits"),
                 row=1,
                 col=1,
             )
 
             fig.add_trace(
                 go.Bar(
-                    x=top_10_commits["author"],
-                    y=top_10_commits["total_insertions"],
+                    x=top_authors,
+                    y=top_10_commits["total_insertions"].to_numpy(),
                     name="Lines Added",
                     marker=dict(color="lightgreen"),
                 ),
@@ -82,7 +83,7 @@ class ContributorPlotter(BasePlotter):
             )
 
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=contributors["total_commits"],
                     y=contributors["total_insertions"],
                     mode="markers",
@@ -10,6 +10,33 @@ from plotly.subplots import make_subplots
 
 from .base import BasePlotter
 
+# Scatters with more points than this are drawn as per-bin averages instead of raw points
+_MAX_SCATTER_POINTS = 500
+_SCATTER_BINS = 50
+
+
+def _bucket_for_plot(df: pd.DataFrame, x_col: str, y_col: str, n_bins: int = _SCATTER_BINS) -> pd.DataFrame:
+    """
+    Average points over quantile bins of ``x_col``.
+
+    Bins are taken over the rank of ``x_col`` so they stay evenly filled even when
+    many points share a value.
+
+    Args:
+        df (pd.DataFrame): Points to bucket
+        x_col (str): Column to bin on
+        y_col (str): Column to average within each bin
+        n_bins (int): Number of bins
+
+    Returns:
+        pd.DataFrame: One row per bin with the mean ``x_col`` and ``y_col`` and the point ``count``
+    """
+    bins = pd.qcut(df[x_col].rank(method="first"), n_bins, labels=False)
+    grouped = df.groupby(bins)
+    return pd.DataFrame(
+        {x_col: grouped[x_col].mean(), y_col: grouped[y_col].mean(), "count": grouped.size()}
+    ).reset_index(drop=True)
+
 
 class TechnicalDebtPlotter(BasePlotter):
     """Plotter for technical debt visualizations."""
@@ -71,7 +98,7 @@ class TechnicalDebtPlotter(BasePlotter):
                 debt_df = pd.DataFrame(debt_analysis["debt_over_time"])
                 if not debt_df.empty:
                     fig.add_trace(
-                        go.Scatter(
+                        go.Scattergl(
                             x=debt_df["date"],
                             y=debt_df["cumulative_debt"],
                             mode="lines",
@@ -100,9 +127,22 @@ class TechnicalDebtPlotter(BasePlotter):
                     debt_hotspots_df = pd.DataFrame(debt_analysis["debt_hotspots"])
                     if not debt_hotspots_df.empty:
                         merged_df = pd.merge(mi_df, debt_hotspots_df, on="file")
-                        if not merged_df.empty:
+                        if len(merged_df) > _MAX_SCATTER_POINTS:
+                            buckets = _bucket_for_plot(merged_df, "maintainability_index", "debt_score")
+                            fig.add_trace(
+                                go.Scattergl(
+                                    x=buckets["maintainability_index"].to_numpy(),
+                                    y=buckets["debt_score"].to_numpy(),
+                                    mode="markers",
+                                    text=[f"{count} files" for count in buckets["count"]],
+                                    name="MI vs Debt (binned)",
+                                ),
+                                row=2,
+                                col=1,
+                            )
+                        elif not merged_df.empty:
                             fig.add_trace(
-                                go.Scatter(
+                                go.Scattergl(
                                     x=merged_df["maintainability_index"],
                                     y=merged_df["debt_score"],
                                     mode="markers",
@@ -113,10 +153,11 @@ class TechnicalDebtPlotter(BasePlotter):
                                 col=1,
                             )
 
+                        top_hotspots = debt_hotspots_df.head(10)
                         fig.add_trace(
                             go.Bar(
-                                x=debt_hotspots_df["file"][:10],
-                                y=debt_hotspots_df["debt_score"][:10],
+                                x=top_hotspots["file"].to_numpy(),
+                                y=top_hotspots["debt_score"].to_numpy(),
                                 name="Debt Hotspots",
                             ),
                             row=2,
@@ -0,0 +1,29 @@
+"""
+Shared pytest fixtures for GitDecomposer tests.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def real_git_repo(tmp_path):
+    """Create a small on-disk Git repository with a few authors, files and commits."""
+    git = pytest.importorskip("git")
+    from gitdecomposer.core import GitRepository
+
+    repo = git.Repo.init(tmp_path)
+    authors = [git.Actor("Alice", "alice@example.com"), git.Actor("Bob", "bob@example.com")]
+    files = ["src/app.py", "src/util.py", "README.md", "tests/test_app.py"]
+    for i in range(12):
+        path = tmp_path / files[i % len(files)]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(f"line {i}.{n}\n" for n in range(i + 1)))
+        repo.index.add([str(path)])
+        author = authors[i % len(authors)]
+        repo.index.commit(f"{'fix' if i % 3 == 0 else 'add'}: change {i}", author=author, committer=author)
+    repo.close()
+
+    git_repo = GitRepository(str(tmp_path))
+    yield git_repo
+    git_repo.close()
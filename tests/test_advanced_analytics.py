@@ -0,0 +1,192 @@
+"""
+Unit tests for AdvancedAnalytics service.
+
+Tests the advanced analytics dashboards including:
+- Figure construction from analyzer results
+- Analyzer result reuse across dashboards
+"""
+
+import copy
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from gitdecomposer.core import GitRepository
+from gitdecomposer.services import advanced_analytics
+from gitdecomposer.services.advanced_analytics import AdvancedAnalytics
+
+
+class TestAdvancedAnalytics:
+    """Test cases for AdvancedAnalytics service."""
+
+    @pytest.fixture
+    def analytics(self):
+        """Create an AdvancedAnalytics instance whose analyzers return small canned results."""
+        analytics = AdvancedAnalytics(Mock(spec=GitRepository))
+
+        advanced_metrics = Mock()
+        advanced_metrics.calculate_technical_debt_accumulation.return_value = {
+            "debt_accumulation_rate": 4.0,
+            "current_debt_score": 20.0,
+        }
+        advanced_metrics.calculate_maintainability_index.return_value = {"overall_maintainability_score": 70.0}
+        advanced_metrics.calculate_test_to_code_ratio.return_value = {"test_coverage_percentage": 40.0}
+        analytics.advanced_metrics = advanced_metrics
+
+        file_analyzer = Mock()
+        file_analyzer.get_code_churn_analysis.return_value = {
+            "file_churn_rates": pd.DataFrame({"file_path": ["a.py", "b.py"], "churn_rate": [3.0, 1.5]})
+        }
+        file_analyzer.get_documentation_coverage_analysis.return_value = {"documentation_ratio": 30.0}
+        analytics.file_analyzer = file_analyzer
+
+        commit_analyzer = Mock()
+        commit_analyzer.get_commit_velocity_analysis.return_value = {
+            "weekly_velocity": pd.DataFrame({"week_start": ["2024-01-01", "2024-01-08"], "commit_count": [3, 5]}),
+            "average_velocity": 4.0,
+        }
+        commit_analyzer.get_bug_fix_ratio_analysis.return_value = {"bug_fix_ratio": 12.0}
+        analytics.commit_analyzer = commit_analyzer
+        return analytics
+
+    def test_technical_debt_dashboard(self, analytics):
+        """The technical debt dashboard plots churn rates from the file analyzer."""
+        fig = analytics.create_technical_debt_dashboard()
+
+        assert isinstance(fig, go.Figure)
+        assert fig.layout.title.text == "Technical Debt Dashboard"
+        churn = next(trace for trace in fig.data if trace.name == "Churn Rate")
+        assert list(churn.y) == [3.0, 1.5]
+
+    def test_missing_columns_fall_back_to_positions(self, analytics):
+        """Traces whose columns are missing are drawn against row positions with zero values."""
+        fig = analytics.create_repository_health_dashboard()
+
+        velocity = next(trace for trace in fig.data if trace.name == "Velocity")
+        assert list(velocity.x) == [0, 1]
+        assert list(velocity.y) == [0, 0]
+
+    def test_analyzer_results_shared_between_dashboards(self, analytics):
+        """Metrics used by several dashboards are computed once until the cache is cleared."""
+        analytics.create_technical_debt_dashboard()
+        analytics.create_repository_health_dashboard()
+        analytics.create_predictive_maintenance_report()
+
+        assert analytics.advanced_metrics.calculate_maintainability_index.call_count == 1
+        assert analytics.advanced_metrics.calculate_technical_debt_accumulation.call_count == 1
+        assert analytics.file_analyzer.get_code_churn_analysis.call_count == 1
+        assert analytics.commit_analyzer.get_commit_velocity_analysis.call_count == 1
+
+        analytics.clear_cache()
+        analytics.create_technical_debt_dashboard()
+
+        assert analytics.advanced_metrics.calculate_maintainability_index.call_count == 2
+
+    def test_cache_invalidated_when_head_moves(self, analytics):
+        """Cached metrics are recomputed once the repository HEAD points at a new commit."""
+        analytics.git_repo.repo = Mock()
+        analytics.git_repo.repo.head.commit.hexsha = "a" * 40
+        analytics.create_technical_debt_dashboard()
+        analytics.create_technical_debt_dashboard()
+        assert analytics.advanced_metrics.calculate_maintainability_index.call_count == 1
+
+        analytics.git_repo.repo.head.commit.hexsha = "b" * 40
+        analytics.create_technical_debt_dashboard()
+        assert analytics.advanced_metrics.calculate_maintainability_index.call_count == 2
+
+    def test_generate_all_advanced_reports(self, analytics, tmp_path):
+        """Every advanced dashboard is written once, reusing the shared analyzer results."""
+        generated = analytics.generate_all_advanced_reports(str(tmp_path))
+
+        assert set(generated) == {
+            "technical_debt",
+            "repository_health",
+            "predictive_maintenance",
+            "velocity_forecasting",
+        }
+        for file_path in generated.values():
+            assert (tmp_path / file_path).exists()
+        assert analytics.advanced_metrics.calculate_technical_debt_accumulation.call_count == 1
+
+    def test_parallel_reports_match_serial(self, analytics, tmp_path):
+        """Reports built concurrently are the same set, with each analyzer still run once."""
+        analytics.parallel_reports = True
+
+        generated = analytics.generate_all_advanced_reports(str(tmp_path))
+
+        assert len(generated) == 4
+        assert analytics.advanced_metrics.calculate_technical_debt_accumulation.call_count == 1
+        assert analytics.file_analyzer.get_code_churn_analysis.call_count == 1
+
+    def test_subplot_spec_constants_not_modified(self, analytics, tmp_path):
+        """Building the dashboards leaves the module's spec constants untouched."""
+        specs = (
+            advanced_analytics._TECHNICAL_DEBT_SPECS,
+            advanced_analytics._REPOSITORY_HEALTH_SPECS,
+            advanced_analytics._VELOCITY_FORECASTING_SPECS,
+        )
+        expected = copy.deepcopy(specs)
+
+        analytics.generate_all_advanced_reports(str(tmp_path))
+
+        assert specs == expected
+
+    def test_stale_report_not_listed_as_generated(self, analytics, tmp_path):
+        """A report left by an earlier run is not listed when this run fails to write it."""
+        (tmp_path / "technical_debt.html").write_text("stale", encoding="utf-8")
+        analytics.advanced_metrics.calculate_technical_debt_accumulation.side_effect = RuntimeError("boom")
+
+        generated = analytics.generate_all_advanced_reports(str(tmp_path))
+
+        assert "technical_debt" not in generated
+        assert "repository_health" in generated
+
+    def test_parallel_reports_on_real_repository(self, real_git_repo, tmp_path):
+        """Concurrent reports on an on-disk repository finish and write every report."""
+        generated = AdvancedAnalytics(real_git_repo, parallel_reports=True).generate_all_advanced_reports(str(tmp_path))
+
+        assert len(generated) == 4
+
+    def test_reports_share_plotly_bundle(self, analytics, tmp_path):
+        """The reports reference one plotly.min.js next to them instead of embedding it."""
+        generated = analytics.generate_all_advanced_reports(str(tmp_path))
+
+        assert (tmp_path / "plotly.min.js").exists()
+        for file_path in generated.values():
+            html = (tmp_path / file_path).read_text(encoding="utf-8")
+            assert 'src="plotly.min.js"' in html
+            assert len(html) < 1_000_000
+
+    def test_parallel_reports_write_plotly_bundle_once(self, analytics, tmp_path):
+        """Concurrent reports leave one complete bundle and no temporary files behind."""
+        analytics.parallel_reports = True
+
+        with patch(
+            "gitdecomposer.services.advanced_analytics.get_plotlyjs", wraps=advanced_analytics.get_plotlyjs
+        ) as get_plotlyjs:
+            analytics.generate_all_advanced_reports(str(tmp_path))
+
+        assert get_plotlyjs.call_count == 1
+        assert (tmp_path / "plotly.min.js").read_text(encoding="utf-8") == advanced_analytics.get_plotlyjs()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_error_figure_reused_per_message(self, analytics):
+        """Error figures are built once per message and returned as copies."""
+        first = analytics._create_error_figure("Error creating dashboard")
+        first.update_layout(title="Changed by caller")
+        second = analytics._create_error_figure("Error creating dashboard")
+
+        assert second is not first
+        assert second.layout.title.text == "Advanced Analytics Error"
+        assert second.layout.annotations[0].text == "Error creating dashboard"
+
+    def test_error_figures_bounded_per_instance(self, analytics):
+        """Each instance keeps its own bounded set of error figures."""
+        for i in range(100):
+            analytics._create_error_figure(f"Error {i}")
+        other = AdvancedAnalytics(Mock(spec=GitRepository))
+
+        assert analytics._error_figures.cache_info().currsize <= 16
+        assert other._error_figures.cache_info().currsize == 0
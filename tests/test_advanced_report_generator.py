@@ -0,0 +1,239 @@
+"""
+Unit tests for AdvancedReportGenerator service.
+
+Tests the advanced metric reports including:
+- Figure construction from analyzer results
+- Empty-data placeholders
+- Error handling
+"""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import plotly.graph_objects as go
+import pytest
+
+from gitdecomposer.analyzers.advanced_metrics import BusFactorAnalyzer
+from gitdecomposer.core import GitRepository
+from gitdecomposer.services.advanced_report_generator import AdvancedReportGenerator, _metric_analyzer_class
+
+FACTORY = "gitdecomposer.services.advanced_report_generator._metric_analyzer_class"
+
+
+def _analyzer_returning(data):
+    """Build a mock analyzer class whose instances' calculate() returns the given data."""
+    analyzer = Mock()
+    analyzer.calculate.return_value = data
+    return Mock(return_value=analyzer)
+
+
+class TestAdvancedReportGenerator:
+    """Test cases for AdvancedReportGenerator service."""
+
+    @pytest.fixture
+    def generator(self):
+        """Create an AdvancedReportGenerator with a mocked repository."""
+        return AdvancedReportGenerator(Mock(spec=GitRepository))
+
+    def test_bus_factor_report_sorts_key_contributors(self, generator):
+        """Key contributors are plotted in descending knowledge order."""
+        data = {
+            "bus_factor": 2,
+            "risk_level": "HIGH",
+            "key_contributors": [
+                {"author": "alice", "knowledge_percentage": 20.0},
+                {"author": "bob", "knowledge_percentage": 55.0},
+                {"author": "carol", "knowledge_percentage": 25.0},
+            ],
+        }
+        with patch(FACTORY, return_value=_analyzer_returning(data)):
+            fig = generator.create_bus_factor_report()
+
+        bar = fig.data[1]
+        assert list(bar.x) == ["bob", "carol", "alice"]
+        assert list(bar.y) == [55.0, 25.0, 20.0]
+
+    def test_bus_factor_report_without_contributors(self, generator):
+        """Only the gauge is drawn when there are no key contributors."""
+        data = {"bus_factor": 1, "risk_level": "CRITICAL"}
+        with patch(FACTORY, return_value=_analyzer_returning(data)):
+            fig = generator.create_bus_factor_report()
+
+        assert len(fig.data) == 1
+        assert isinstance(fig.data[0], go.Indicator)
+
+    @pytest.mark.parametrize(
+        "week_starts",
+        [
+            [datetime(2024, 1, 1), datetime(2024, 1, 8)],
+            ["2024-01-01", "2024-01-08"],
+        ],
+    )
+    def test_velocity_trend_report_normalizes_weeks(self, generator, week_starts):
+        """Week starts are rendered as ISO dates whatever their input type."""
+        data = {
+            "weekly_data": [
+                {"week_start": week_starts[0], "commit_count": 3, "total_lines_changed": 120},
+                {"week_start": week_starts[1], "commit_count": 5, "total_lines_changed": 80},
+            ]
+        }
+        with patch(FACTORY, return_value=_analyzer_returning(data)):
+            fig = generator.create_velocity_trend_report()
+
+        commits, lines_changed = fig.data
+        assert list(commits.x) == ["2024-01-01", "2024-01-08"]
+        assert list(commits.y) == [3, 5]
+        assert list(lines_changed.y) == [120, 80]
+
+    def test_critical_files_report_labels(self, generator):
+        """Critical files are plotted by base name with a risk label per bar."""
+        data = {
+            "critical_files": [
+                ("src/core/engine.py", {"criticality_score": 42.0, "change_frequency": 12, "complexity": 3.5}),
+                ("setup.py", {"criticality_score": 7.25, "change_frequency": 4, "complexity": 1.0}),
+            ]
+        }
+        with patch(FACTORY, return_value=_analyzer_returning(data)):
+            fig = generator.create_critical_files_report()
+
+        bar = fig.data[0]
+        assert list(bar.x) == ["engine.py", "setup.py"]
+        assert list(bar.y) == [42.0, 7.25]
+        assert bar.text[0] == "Risk: 42.0<br>Changes: 12<br>Complexity: 3.5"
+
+    def test_single_point_failure_report_top_ten(self, generator):
+        """Only the ten most dominated files are plotted, highest first, even if unsorted."""
+        spof_files = [
+            {"file": f"pkg/module_{i}.py", "dominance_ratio": ratio, "dominant_author": "alice"}
+            for i, ratio in enumerate([0.81, 0.99, 0.85, 0.9, 0.82, 0.97, 0.83, 0.95, 0.84, 0.93, 0.8, 0.91])
+        ]
+        with patch(FACTORY, return_value=_analyzer_returning({"spof_files": spof_files})):
+            fig = generator.create_single_point_failure_report()
+
+        bar = fig.data[0]
+        assert len(bar.x) == 10
+        assert bar.x[0] == "module_1.py"
+        assert list(bar.y) == sorted(bar.y, reverse=True)
+        assert "module_10.py" not in bar.x
+
+    def test_single_point_failure_report_placeholder(self, generator):
+        """An empty SPOF result yields an annotated placeholder figure."""
+        with patch(FACTORY, return_value=_analyzer_returning({"spof_files": []})):
+            fig = generator.create_single_point_failure_report()
+
+        assert len(fig.data) == 0
+        assert fig.layout.title.text == "Single Point of Failure Analysis"
+        assert fig.layout.annotations[0].font.color == "green"
+
+    def test_save_path_written_by_flush(self, generator, tmp_path):
+        """Reports are written in the background and are on disk once flush() returns."""
+        save_path = tmp_path / "bus_factor.html"
+        with patch(FACTORY, return_value=_analyzer_returning({"bus_factor": 3, "risk_level": "MEDIUM"})):
+            generator.create_bus_factor_report(str(save_path))
+        generator.flush()
+
+        assert "Bus Factor" in save_path.read_text(encoding="utf-8")
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_figure_changes_after_return_not_written(self, generator, tmp_path):
+        """The saved page is rendered before returning, so later changes by the caller are not written."""
+        save_path = tmp_path / "bus_factor.html"
+        with patch(FACTORY, return_value=_analyzer_returning({"bus_factor": 3, "risk_level": "MEDIUM"})):
+            fig = generator.create_bus_factor_report(str(save_path))
+        fig.update_layout(title="Changed by caller")
+        generator.flush()
+
+        assert "Changed by caller" not in save_path.read_text(encoding="utf-8")
+
+    def test_stale_report_removed_before_write(self, generator, tmp_path):
+        """A file left by an earlier run does not survive a failed write."""
+        save_path = tmp_path / "bus_factor.html"
+        save_path.write_text("stale", encoding="utf-8")
+        with patch(FACTORY, return_value=_analyzer_returning({"bus_factor": 3, "risk_level": "MEDIUM"})):
+            with patch.object(AdvancedReportGenerator, "_write_report", side_effect=OSError("disk full")):
+                generator.create_bus_factor_report(str(save_path))
+                with pytest.raises(OSError):
+                    generator.flush()
+
+        assert not save_path.exists()
+
+    def test_close_stops_io_thread(self, generator, tmp_path):
+        """close() waits for queued writes and then refuses new ones."""
+        save_path = tmp_path / "bus_factor.html"
+        with patch(FACTORY, return_value=_analyzer_returning({"bus_factor": 3, "risk_level": "MEDIUM"})):
+            generator.create_bus_factor_report(str(save_path))
+            generator.close()
+
+            assert save_path.exists()
+            with pytest.raises(RuntimeError):
+                generator.create_bus_factor_report(str(save_path))
+
+    def test_cached_report_reused_for_same_refs(self, tmp_path):
+        """A second run with unchanged refs copies the cached HTML without re-analyzing."""
+        repo = Mock(spec=GitRepository)
+        repo.refs_fingerprint.return_value = "0123456789abcdef\n0123456789abcdef"
+        generator = AdvancedReportGenerator(repo, cache_dir=str(tmp_path / "cache"))
+        analyzer_class = _analyzer_returning({"bus_factor": 4, "risk_level": "LOW"})
+
+        with patch(FACTORY, return_value=analyzer_class):
+            generator.create_bus_factor_report(str(tmp_path / "first.html"))
+            generator.flush()
+            fig = generator.create_bus_factor_report(str(tmp_path / "second.html"))
+            generator.flush()
+
+        assert analyzer_class.call_count == 1
+        assert (tmp_path / "second.html").read_bytes() == (tmp_path / "first.html").read_bytes()
+        assert fig.data[0].value == 4
+
+    def test_cached_report_invalidated_when_any_ref_moves(self, tmp_path):
+        """A new commit on another branch leaves HEAD alone but still invalidates the cache."""
+        repo = Mock(spec=GitRepository)
+        repo.refs_fingerprint.return_value = "aaaa\naaaa\nbbbb"
+        generator = AdvancedReportGenerator(repo, cache_dir=str(tmp_path / "cache"))
+        analyzer_class = _analyzer_returning({"bus_factor": 4, "risk_level": "LOW"})
+
+        with patch(FACTORY, return_value=analyzer_class):
+            generator.create_bus_factor_report(str(tmp_path / "first.html"))
+            generator.flush()
+            repo.refs_fingerprint.return_value = "aaaa\naaaa\ncccc"
+            generator.create_bus_factor_report(str(tmp_path / "second.html"))
+
+        assert analyzer_class.call_count == 2
+
+    def test_instances_have_no_dict(self, generator):
+        """The generator declares its attributes in __slots__."""
+        assert not hasattr(generator, "__dict__")
+        with pytest.raises(AttributeError):
+            generator.unexpected_attribute = True
+
+    def test_analyzer_class_lookup(self):
+        """Metric names resolve to registered analyzer classes; unknown names raise."""
+        assert _metric_analyzer_class("bus_factor") is BusFactorAnalyzer
+        with pytest.raises(ValueError):
+            _metric_analyzer_class("not_a_metric")
+
+    def test_error_figure_on_analyzer_failure(self, generator):
+        """Analyzer failures produce an error figure instead of raising."""
+        with patch(FACTORY, side_effect=RuntimeError("boom")):
+            fig = generator.create_bus_factor_report()
+
+        assert fig.layout.title.text == "Report Generation Error"
+
+    def test_write_error_raised_by_flush(self, generator, tmp_path):
+        """A report that cannot be written makes flush() raise instead of looking saved."""
+        save_path = tmp_path / "missing" / "bus_factor.html"
+        with patch(FACTORY, return_value=_analyzer_returning({"bus_factor": 3, "risk_level": "MEDIUM"})):
+            generator.create_bus_factor_report(str(save_path))
+
+        with pytest.raises(OSError):
+            generator.flush()
+        generator.flush()
+
+    def test_placeholder_report_saved(self, generator, tmp_path):
+        """Placeholder figures for reports without data are saved like any other report."""
+        save_path = tmp_path / "spof.html"
+        with patch(FACTORY, return_value=_analyzer_returning({"spof_files": []})):
+            generator.create_single_point_failure_report(str(save_path))
+        generator.flush()
+
+        assert "Single Point of Failure Analysis" in save_path.read_text(encoding="utf-8")
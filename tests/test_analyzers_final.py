@@ -183,6 +183,50 @@ class TestFileAnalyzer(TestAnalyzersBase):
         self.assertIsInstance(result, pd.DataFrame)
         # Should return a DataFrame even if empty
 
+    def test_get_file_hotspots_analysis_scores(self):
+        """Test hotspot scores and risk levels computed from change frequency."""
+        frequency = pd.DataFrame(
+            {
+                "file_path": ["a.py", "b.py", "c.py"],
+                "commit_count": [10, 5, 0],
+                "total_lines_changed": [200, 100, 0],
+                "unique_authors": [4, 1, 0],
+                "avg_lines_per_commit": [20.0, 20.0, 0.0],
+            }
+        )
+        with patch.object(self.analyzer, "get_file_change_frequency_analysis", return_value=frequency):
+            result = self.analyzer.get_file_hotspots_analysis()
+
+        scores = dict(zip(result["file_path"], result["hotspot_score"]))
+        self.assertAlmostEqual(scores["a.py"], 100.0)
+        self.assertAlmostEqual(scores["b.py"], 45.0)
+        self.assertAlmostEqual(scores["c.py"], 0.0)
+        risks = dict(zip(result["file_path"], result["risk_level"]))
+        self.assertEqual(risks, {"a.py": "Critical", "b.py": "Medium", "c.py": "Minimal"})
+
+    def test_get_file_hotspots_analysis_recommendations(self):
+        """Test that every triggered rule is listed and quiet files are reported as stable."""
+        frequency = pd.DataFrame(
+            {
+                "file_path": ["busy.py", "wide.py", "calm.py"],
+                "commit_count": [60, 2, 1],
+                "total_lines_changed": [5000, 10, 5],
+                "unique_authors": [2, 8, 1],
+                "avg_lines_per_commit": [150.0, 5.0, 5.0],
+            }
+        )
+        with patch.object(self.analyzer, "get_file_change_frequency_analysis", return_value=frequency):
+            result = self.analyzer.get_file_hotspots_analysis()
+
+        recommendations = dict(zip(result["file_path"], result["recommendations"]))
+        self.assertEqual(
+            recommendations["busy.py"],
+            "Consider refactoring - high change frequency; Large cumulative changes - review complexity; "
+            "Large commits - consider smaller changes",
+        )
+        self.assertEqual(recommendations["wide.py"], "Many contributors - ensure good documentation")
+        self.assertEqual(recommendations["calm.py"], "File appears stable")
+
 
 class TestContributorAnalyzer(TestAnalyzersBase):
     """Test cases for ContributorAnalyzer class."""
@@ -303,6 +347,18 @@ class TestAdvancedMetrics(TestAnalyzersBase):
         self.assertIsInstance(result, dict)
         self.assertIn("gini_coefficient", result)
 
+    def test_legacy_maintainability_factor_counts(self):
+        """Test that attention and excellent file counts agree with the per-file scores."""
+        from gitdecomposer.analyzers.legacy_advanced_metrics import AdvancedMetrics
+
+        result = AdvancedMetrics(self.mock_repo).calculate_maintainability_index()
+
+        scores = result["file_maintainability"]["maintainability_score"]
+        factors = result["maintainability_factors"]
+        self.assertEqual(factors["files_needing_attention"], sum(score < 40 for score in scores))
+        self.assertEqual(factors["excellent_files"], sum(score >= 80 for score in scores))
+        self.assertEqual(factors["total_files_analyzed"], len(scores))
+
 
 class TestAnalyzerIntegration(TestAnalyzersBase):
     """Integration tests for analyzers working together."""
@@ -5,15 +5,24 @@ These tests focus on testing the service structure and basic functionality
 without complex data dependencies.
 """
 
+import copy
+import gzip
+import json
 import os
+import subprocess
 import tempfile
 from unittest.mock import Mock, patch
 
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 import pytest
 
 from gitdecomposer.core import GitRepository
+from gitdecomposer.core.git_repository import call_on_new_handle
 from gitdecomposer.services import DashboardGenerator
+from gitdecomposer.services import dashboard_generator as dashboard_module
 
 
 class TestDashboardGenerator:
@@ -29,6 +38,47 @@ class TestDashboardGenerator:
         """Create a DashboardGenerator instance with mocked dependencies."""
         return DashboardGenerator(mock_git_repo)
 
+    @pytest.fixture
+    def populated_file_analyzer(self):
+        """Create a mock FileAnalyzer returning small but realistic results."""
+        file_paths = [f"src/module_{i}.py" for i in range(40)]
+        frequency = pd.DataFrame(
+            {
+                "file_path": file_paths,
+                "commit_count": range(40, 0, -1),
+                "total_lines_changed": range(4000, 0, -100),
+                "change_intensity": [c * 10.0 for c in range(40, 0, -1)],
+            }
+        )
+        hotspots = frequency.assign(hotspot_score=[100.0 - i * 2.5 for i in range(40)])
+        directories = pd.DataFrame(
+            {
+                "directory": [f"dir_{i}" for i in range(30)],
+                "unique_files": range(30, 0, -1),
+                "total_changes": range(300, 0, -10),
+                "avg_changes_per_file": [10.0] * 30,
+            }
+        )
+
+        file_analyzer = Mock()
+        file_analyzer.get_file_extensions_distribution.return_value = pd.DataFrame(
+            {"extension": [".py", ".md"], "count": [30, 10]}
+        )
+        file_analyzer.get_most_changed_files.return_value = pd.DataFrame(
+            {"file_path": file_paths[:15], "change_count": range(15, 0, -1)}
+        )
+        file_analyzer.get_directory_analysis.return_value = directories
+        file_analyzer.get_file_change_frequency_analysis.return_value = frequency
+        file_analyzer.get_file_hotspots_analysis.return_value = hotspots
+        file_analyzer.get_code_churn_analysis.return_value = {
+            "file_churn_rates": pd.DataFrame({"file_path": file_paths, "churn_rate": [12.5] * 40})
+        }
+        file_analyzer.get_commit_size_distribution_analysis.return_value = {
+            "size_distribution": {"Small": 20, "Medium": 8, "Large": 2}
+        }
+        file_analyzer.get_documentation_coverage_analysis.return_value = {"documentation_ratio": 25.0}
+        return file_analyzer
+
     @pytest.fixture
     def temp_output_dir(self):
         """Create a temporary directory for test outputs."""
@@ -185,6 +235,437 @@ class TestDashboardGenerator:
         assert dashboard_generator.visualization is not None
         assert hasattr(dashboard_generator.visualization, "create_commit_activity_dashboard")
 
+    def test_subplot_spec_constants_not_modified(self, dashboard_generator, populated_file_analyzer):
+        """Test that building the dashboard grids leaves the module's spec constants untouched."""
+        specs = (dashboard_module._FILE_ANALYSIS_SPECS, dashboard_module._ENHANCED_FILE_ANALYSIS_SPECS)
+        expected = copy.deepcopy(specs)
+        dashboard_module._empty_subplot_grid.cache_clear()
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        dashboard_generator.create_file_analysis_visualization()
+        dashboard_generator.create_enhanced_file_analysis_dashboard()
+
+        assert specs == expected
+
+    def test_queries_computed_outside_cache_lock(self, dashboard_generator):
+        """Test that a query runs without holding the cache lock and its result is still cached."""
+        lock_held = []
+
+        def query():
+            lock_held.append(dashboard_generator._cache_lock.locked())
+            return 42
+
+        assert dashboard_generator._cached("answer", query) == 42
+        assert dashboard_generator._cached("answer", query) == 42
+        assert lock_held == [False]
+
+    def test_error_figure_reused_per_message(self, dashboard_generator):
+        """Test that error figures are built once per message and returned as copies."""
+        first = dashboard_generator._create_error_figure("Error creating dashboard")
+        first.update_layout(title="Changed by caller")
+        second = dashboard_generator._create_error_figure("Error creating dashboard")
+
+        assert second is not first
+        assert second.layout.title.text == "Visualization Error"
+        assert second.layout.annotations[0].text == "Error creating dashboard"
+
+    def test_error_figures_bounded_per_instance(self, dashboard_generator, mock_git_repo):
+        """Test that each generator keeps its own bounded set of error figures."""
+        for i in range(100):
+            dashboard_generator._create_error_figure(f"Error {i}")
+        other = DashboardGenerator(mock_git_repo)
+
+        assert dashboard_generator._error_figures.cache_info().currsize <= 16
+        assert other._error_figures.cache_info().currsize == 0
+
+    def test_dashboard_failure_returns_error_figure(self, dashboard_generator):
+        """Test that an exception while building a dashboard yields a labelled error figure."""
+        visualization = Mock()
+        visualization.create_commit_activity_dashboard.side_effect = RuntimeError("boom")
+        dashboard_generator.visualization = visualization
+
+        fig = dashboard_generator.create_commit_activity_dashboard(save_path=None)
+
+        assert fig.layout.annotations[0].text == "Error creating commit activity dashboard"
+        assert dashboard_generator.create_commit_activity_dashboard.__name__ == "create_commit_activity_dashboard"
+
+    def test_analyzers_created_on_first_access(self, dashboard_generator):
+        """Test that analyzers are built lazily and then reused."""
+        assert "file_analyzer" not in vars(dashboard_generator)
+        assert "visualization" not in vars(dashboard_generator)
+
+        file_analyzer = dashboard_generator.file_analyzer
+
+        assert dashboard_generator.file_analyzer is file_analyzer
+        assert "commit_analyzer" not in vars(dashboard_generator)
+
+    def test_analyzer_results_shared_between_dashboards(self, dashboard_generator):
+        """Test that file analyzer results are computed once across dashboards."""
+        file_analyzer = Mock()
+        for method in (
+            "get_file_extensions_distribution",
+            "get_most_changed_files",
+            "get_directory_analysis",
+            "get_file_change_frequency_analysis",
+            "get_file_hotspots_analysis",
+        ):
+            getattr(file_analyzer, method).return_value = pd.DataFrame()
+        file_analyzer.get_code_churn_analysis.return_value = {}
+        file_analyzer.get_commit_size_distribution_analysis.return_value = {}
+        file_analyzer.get_documentation_coverage_analysis.return_value = {}
+        dashboard_generator.file_analyzer = file_analyzer
+
+        dashboard_generator.create_file_analysis_visualization()
+        dashboard_generator.create_enhanced_file_analysis_dashboard()
+
+        assert file_analyzer.get_directory_analysis.call_count == 1
+        assert file_analyzer.get_file_change_frequency_analysis.call_count == 1
+
+        dashboard_generator.clear_cache()
+        dashboard_generator.create_file_analysis_visualization()
+        assert file_analyzer.get_directory_analysis.call_count == 2
+
+    def test_cache_invalidated_when_head_moves(self, dashboard_generator):
+        """Test that cached analyzer results are recomputed after a new commit."""
+        dashboard_generator.git_repo.repo = Mock()
+        dashboard_generator.git_repo.repo.head.commit.hexsha = "a" * 40
+        branch_analyzer = Mock()
+        branch_analyzer.get_branch_statistics.return_value = pd.DataFrame()
+        dashboard_generator.branch_analyzer = branch_analyzer
+
+        dashboard_generator.create_branch_analysis_dashboard()
+        dashboard_generator.create_branch_analysis_dashboard()
+        assert branch_analyzer.get_branch_statistics.call_count == 1
+
+        dashboard_generator.git_repo.repo.head.commit.hexsha = "b" * 40
+        dashboard_generator.create_branch_analysis_dashboard()
+        assert branch_analyzer.get_branch_statistics.call_count == 2
+
+    def test_scatter_traces_use_webgl(self, dashboard_generator, populated_file_analyzer):
+        """Test that scatter traces in the file dashboards are rendered with WebGL."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        basic = dashboard_generator.create_file_analysis_visualization()
+        enhanced = dashboard_generator.create_enhanced_file_analysis_dashboard()
+
+        scatter_types = {trace.type for fig in (basic, enhanced) for trace in fig.data if "scatter" in trace.type}
+        assert scatter_types == {"scattergl"}
+        assert enhanced.layout.hovermode == "closest"
+        assert enhanced.layout.spikedistance == 0
+
+    def test_documentation_coverage_gauge(self, dashboard_generator, populated_file_analyzer):
+        """Test that documentation coverage is shown as a percentage gauge."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_enhanced_file_analysis_dashboard()
+
+        (gauge,) = [trace for trace in fig.data if trace.type == "indicator"]
+        assert gauge.value == 25.0
+        assert tuple(gauge.gauge.axis.range) == (0, 100)
+        assert not [trace for trace in fig.data if trace.type == "pie"]
+
+    def test_size_distribution_plots_precomputed_counts(self, dashboard_generator, populated_file_analyzer):
+        """Test that the commit size panel draws the analyzer's bucket counts as bars."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_enhanced_file_analysis_dashboard()
+        sizes = next(trace for trace in fig.data if trace.name == "Size Distribution")
+
+        assert sizes.type == "bar"
+        assert list(sizes.x) == ["Small", "Medium", "Large"]
+        assert list(sizes.y) == [20, 8, 2]
+
+    def test_trace_lengths_are_consistent(self, dashboard_generator, populated_file_analyzer):
+        """Test that every trace plots equally sized, truncated x and y arrays."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        basic = dashboard_generator.create_file_analysis_visualization()
+        enhanced = dashboard_generator.create_enhanced_file_analysis_dashboard()
+
+        for trace in (*basic.data, *enhanced.data):
+            if trace.type in ("bar", "scattergl"):
+                assert len(trace.x) == len(trace.y)
+                assert len(trace.x) <= 15
+
+    def test_failing_analyzer_only_empties_its_panel(self, dashboard_generator, populated_file_analyzer):
+        """Test that one failing analyzer query leaves the rest of the dashboard intact."""
+        populated_file_analyzer.get_directory_analysis.side_effect = RuntimeError("git walk failed")
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_file_analysis_visualization()
+
+        assert fig.layout.title.text == "File Analysis Dashboard"
+        assert {trace.name for trace in fig.data} == {None, "Changes", "Files Changed"}
+
+    def test_most_changed_files_fold_remainder_into_other(self, dashboard_generator, populated_file_analyzer):
+        """Test that files beyond the ten most changed are summed into one Other bar."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_file_analysis_visualization()
+        bar = next(trace for trace in fig.data if trace.name == "Changes")
+
+        populated_file_analyzer.get_most_changed_files.assert_called_once_with(None)
+        assert len(bar.x) == 11
+        assert bar.x[-1] == "Other (5 files)"
+        assert bar.y[-1] == 5 + 4 + 3 + 2 + 1
+
+    def test_most_changed_files_strip_common_directory(self, dashboard_generator, populated_file_analyzer):
+        """Test that the directory shared by all plotted files moves into the panel title."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_file_analysis_visualization()
+        bar = next(trace for trace in fig.data if trace.name == "Changes")
+
+        assert list(bar.x[:2]) == ["module_0.py", "module_1.py"]
+        assert fig.layout.annotations[1].text == "Most Changed Files (under src/)"
+
+    def test_subplot_grid_copies_are_independent(self, dashboard_generator, populated_file_analyzer):
+        """Test that changes to one dashboard's grid do not leak into the next dashboard."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+        first = dashboard_generator.create_file_analysis_visualization()
+
+        populated_file_analyzer.get_most_changed_files.return_value = pd.DataFrame(
+            {"file_path": ["a.py", "docs/b.md"], "change_count": [3, 2]}
+        )
+        dashboard_generator.clear_cache()
+        second = dashboard_generator.create_file_analysis_visualization()
+
+        assert first.layout.annotations[1].text == "Most Changed Files (under src/)"
+        assert second.layout.annotations[1].text == "Most Changed Files"
+
+    def test_extension_pie_groups_rare_extensions(self, dashboard_generator, populated_file_analyzer):
+        """Test that extensions beyond the largest fifteen are folded into an Other slice."""
+        populated_file_analyzer.get_file_extensions_distribution.return_value = pd.DataFrame(
+            {"extension": [f".e{i}" for i in range(20)], "count": range(20, 0, -1)}
+        )
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_file_analysis_visualization()
+        pie = next(trace for trace in fig.data if trace.type == "pie")
+
+        assert len(pie.labels) == 16
+        assert pie.labels[-1] == "Other"
+        assert pie.values[-1] == 5 + 4 + 3 + 2 + 1
+        assert sum(pie.values) == sum(range(1, 21))
+
+    def test_branch_dashboard_plots_top_branches(self, dashboard_generator):
+        """Test that the branch dashboard plots the ten busiest branches."""
+        branch_analyzer = Mock()
+        branch_analyzer.get_branch_statistics.return_value = pd.DataFrame(
+            {"branch_name": [f"feature-{i}" for i in range(12)], "total_commits": range(120, 0, -10)}
+        )
+        dashboard_generator.branch_analyzer = branch_analyzer
+
+        fig = dashboard_generator.create_branch_analysis_dashboard()
+
+        bar = fig.data[0]
+        assert list(bar.x) == [f"feature-{i}" for i in range(10)]
+        assert list(bar.y) == list(range(120, 20, -10))
+
+    def test_gzip_output_for_gz_paths(self, dashboard_generator, populated_file_analyzer, temp_output_dir):
+        """Test that dashboards saved to a .html.gz path are gzip-compressed HTML."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+        save_path = os.path.join(temp_output_dir, "file_analysis.html.gz")
+
+        dashboard_generator.create_file_analysis_visualization(save_path)
+
+        with gzip.open(save_path, "rt", encoding="utf-8") as f:
+            content = f.read()
+        assert content.startswith("<html>")
+        assert "File Analysis Dashboard" in content
+
+    def test_saved_dashboard_loads_plotly_from_cdn(self, dashboard_generator, populated_file_analyzer, temp_output_dir):
+        """Test that saved dashboards reference plotly.js instead of embedding the bundle."""
+        dashboard_generator.file_analyzer = populated_file_analyzer
+        save_path = os.path.join(temp_output_dir, "file_analysis.html")
+
+        dashboard_generator.create_file_analysis_visualization(save_path)
+
+        with open(save_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        assert "cdn.plot.ly/plotly-" in content
+        assert len(content) < 1_000_000
+
+    def test_static_images_embed_png_snapshot(self, mock_git_repo, populated_file_analyzer, temp_output_dir):
+        """Test that static dashboards are saved as an embedded PNG instead of plotly.js."""
+        dashboard_generator = DashboardGenerator(mock_git_repo, static_images=True)
+        dashboard_generator.file_analyzer = populated_file_analyzer
+        save_path = os.path.join(temp_output_dir, "file_analysis.html")
+
+        with patch.object(go.Figure, "to_image", return_value=b"png-bytes") as to_image:
+            dashboard_generator.create_file_analysis_visualization(save_path)
+
+        with open(save_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        assert to_image.call_args.kwargs["format"] == "png"
+        assert '<img src="data:image/png;base64,cG5nLWJ5dGVz"' in content
+        assert "<title>File Analysis Dashboard</title>" in content
+        assert "plotly" not in content
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ValueError("kaleido is not installed"),
+            RuntimeError("Kaleido subprocess failed to start"),
+            subprocess.CalledProcessError(1, "kaleido"),
+        ],
+    )
+    def test_static_images_fall_back_without_kaleido(
+        self, mock_git_repo, populated_file_analyzer, temp_output_dir, error
+    ):
+        """Test that an interactive page is still written when PNG export is unavailable or fails."""
+        dashboard_generator = DashboardGenerator(mock_git_repo, static_images=True)
+        dashboard_generator.file_analyzer = populated_file_analyzer
+        save_path = os.path.join(temp_output_dir, "file_analysis.html")
+
+        with patch.object(go.Figure, "to_image", side_effect=error):
+            dashboard_generator.create_file_analysis_visualization(save_path)
+
+        with open(save_path, "r", encoding="utf-8") as f:
+            assert "cdn.plot.ly/plotly-" in f.read()
+
+    def test_lazy_charts_defer_plotting_until_visible(self, mock_git_repo, temp_output_dir):
+        """Test that lazy dashboards keep the figure as inert JSON rendered on scroll into view."""
+        dashboard_generator = DashboardGenerator(mock_git_repo, lazy_charts=True)
+        branch_analyzer = Mock()
+        branch_analyzer.get_branch_statistics.return_value = pd.DataFrame(
+            {"branch_name": ["main", "fix</script>"], "total_commits": [12, 3]}
+        )
+        dashboard_generator.branch_analyzer = branch_analyzer
+        save_path = os.path.join(temp_output_dir, "branch_analysis.html")
+
+        dashboard_generator.create_branch_analysis_dashboard(save_path)
+
+        with open(save_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        assert "<title>Branch Analysis Dashboard</title>" in content
+        assert "IntersectionObserver" in content
+        assert "cdn.plot.ly/plotly-" in content
+        data = content.split('<script type="application/json" id="chart-data">')[1].split("</script>")[0]
+        assert json.loads(data)["data"][0]["x"] == ["main", "fix</script>"]
+
+    def test_empty_file_data_skips_dashboard(self, dashboard_generator, temp_output_dir):
+        """Test that no file is written when every file analysis result is empty."""
+        file_analyzer = Mock()
+        file_analyzer.get_file_extensions_distribution.return_value = pd.DataFrame()
+        file_analyzer.get_most_changed_files.return_value = pd.DataFrame()
+        file_analyzer.get_directory_analysis.return_value = pd.DataFrame()
+        file_analyzer.get_file_change_frequency_analysis.return_value = pd.DataFrame()
+        dashboard_generator.file_analyzer = file_analyzer
+        save_path = os.path.join(temp_output_dir, "file_analysis.html")
+
+        fig = dashboard_generator.create_file_analysis_visualization(save_path)
+
+        assert not os.path.exists(save_path)
+        assert len(fig.data) == 0
+        assert fig.layout.annotations[0].text == "No file data available for file analysis"
+
+    def test_empty_branch_data_skips_dashboard(self, dashboard_generator, temp_output_dir):
+        """Test that the branch dashboard is not built or saved without branch data."""
+        branch_analyzer = Mock()
+        branch_analyzer.get_branch_statistics.return_value = pd.DataFrame()
+        dashboard_generator.branch_analyzer = branch_analyzer
+        save_path = os.path.join(temp_output_dir, "branch_analysis.html")
+
+        fig = dashboard_generator.create_branch_analysis_dashboard(save_path)
+
+        assert not os.path.exists(save_path)
+        assert fig.layout.annotations[0].text == "No branch data available for branch analysis"
+
+    def test_failing_branch_analyzer_treated_as_empty(self, dashboard_generator):
+        """Test that a branch analyzer failure falls back to empty data instead of an error dashboard."""
+        branch_analyzer = Mock()
+        branch_analyzer.get_branch_statistics.side_effect = RuntimeError("detached HEAD")
+        dashboard_generator.branch_analyzer = branch_analyzer
+
+        fig = dashboard_generator.create_branch_analysis_dashboard()
+
+        assert fig.layout.annotations[0].text == "No branch data available for branch analysis"
+
+    def test_trace_values_are_rounded(self, dashboard_generator, populated_file_analyzer):
+        """Test that plotted metrics are rounded and serialize without widened float digits."""
+        populated_file_analyzer.get_code_churn_analysis.return_value = {
+            "file_churn_rates": pd.DataFrame({"file_path": ["a.py", "b.py"], "churn_rate": [1.23456, 2.5]})
+        }
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_enhanced_file_analysis_dashboard()
+        traces = {trace.name: trace for trace in fig.data}
+        # The stdlib engine is what plotly uses when the optional orjson package is missing
+        churn_json = pio.to_json(go.Figure(traces["Churn Rate"]), engine="json")
+
+        assert traces["Churn Rate"].y.tolist() == [2.5, 1.235]
+        assert '"y":[2.5,1.235]' in churn_json
+        assert traces["Hotspots"].x.dtype == np.int64
+
+    def test_missing_counts_plotted_as_zero(self, dashboard_generator, populated_file_analyzer):
+        """Test that missing or oversized counts are plotted instead of failing the dashboard."""
+        populated_file_analyzer.get_file_hotspots_analysis.return_value = pd.DataFrame(
+            {
+                "file_path": ["a.py", "b.py", "c.py"],
+                "commit_count": [3, 2, 1],
+                "total_lines_changed": [None, 3_000_000_000, np.nan],
+                "hotspot_score": [90.0, 80.0, 70.0],
+            }
+        )
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_enhanced_file_analysis_dashboard()
+        traces = {trace.name: trace for trace in fig.data}
+
+        assert sorted(traces["Hotspots"].x.tolist()) == [0, 0, 3_000_000_000]
+
+    def test_churn_panel_shows_highest_churn_files(self, dashboard_generator, populated_file_analyzer):
+        """Test that the churn panel plots the ten highest churn rates, not the first ten rows."""
+        file_paths = [f"src/file_{i}.py" for i in range(12)]
+        populated_file_analyzer.get_code_churn_analysis.return_value = {
+            "file_churn_rates": pd.DataFrame({"file_path": file_paths, "churn_rate": [1.0] * 10 + [9.0, 8.0]})
+        }
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_enhanced_file_analysis_dashboard()
+        churn = next(trace for trace in fig.data if trace.name == "Churn Rate")
+
+        assert list(churn.x[:2]) == ["src/file_10.py", "src/file_11.py"]
+        assert len(churn.x) == 10
+
+    def test_hotspot_marker_sizes_are_bounded(self, dashboard_generator, populated_file_analyzer):
+        """Test that hotspot marker sizes scale with commit count within a fixed range."""
+        hotspots = populated_file_analyzer.get_file_hotspots_analysis.return_value
+        hotspots["commit_count"] = [5000, 153] + [3] * 38
+        dashboard_generator.file_analyzer = populated_file_analyzer
+
+        fig = dashboard_generator.create_enhanced_file_analysis_dashboard()
+        hotspot_trace = next(trace for trace in fig.data if trace.name == "Hotspots")
+        sizes = hotspot_trace.marker.size
+
+        assert list(sizes[:3]) == [30, 15.3, 8]
+        assert "15.3," in pio.to_json(go.Figure(hotspot_trace), engine="json")
+
+    def test_parallel_analysis_matches_serial(self, mock_git_repo, populated_file_analyzer):
+        """Test that concurrent analyzer queries build the same dashboard."""
+        figures = []
+        for parallel in (False, True):
+            generator = DashboardGenerator(mock_git_repo, parallel_analysis=parallel)
+            generator.file_analyzer = populated_file_analyzer
+            figures.append(generator.create_enhanced_file_analysis_dashboard())
+
+        assert figures[0].to_json() == figures[1].to_json()
+
+    def test_parallel_analysis_on_real_repository(self, real_git_repo):
+        """Test that concurrent queries on an on-disk repository finish and match the serial dashboard."""
+        serial = DashboardGenerator(real_git_repo).create_enhanced_file_analysis_dashboard()
+        with patch(
+            "gitdecomposer.services.dashboard_generator.call_on_new_handle", wraps=call_on_new_handle
+        ) as on_new_handle:
+            parallel = DashboardGenerator(
+                real_git_repo, parallel_analysis=True
+            ).create_enhanced_file_analysis_dashboard()
+
+        assert on_new_handle.call_count == 6
+        assert serial.layout.title.text == "Enhanced File Analysis Dashboard"
+        assert serial.to_json() == parallel.to_json()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -18,7 +18,7 @@ import shutil
 import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pandas as pd
 import pytest
@@ -26,7 +26,7 @@ import pytest
 # Add the package to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from gitdecomposer.core.git_repository import GitRepository
+from gitdecomposer.core.git_repository import GitRepository, call_on_new_handle
 from gitdecomposer.services.data_aggregator import DataAggregator
 
 
@@ -148,6 +148,62 @@ class TestDataAggregator:
         # The summary may contain error or advanced_metrics depending on mock behavior
         assert "repository" in summary or "advanced_metrics" in summary
 
+    def test_summaries_share_analyzer_results(self, data_aggregator):
+        """Test that building the enhanced and basic summaries walks each analyzer once."""
+        data_aggregator.get_enhanced_repository_summary()
+        data_aggregator.generate_repository_summary()
+
+        assert data_aggregator.commit_analyzer.get_commit_stats.call_count == 1
+        assert data_aggregator.file_analyzer.get_most_changed_files.call_count == 1
+        assert data_aggregator.git_repo.get_repository_stats.call_count == 1
+
+        data_aggregator.clear_cache()
+        data_aggregator.generate_repository_summary()
+
+        assert data_aggregator.commit_analyzer.get_commit_stats.call_count == 2
+
+    def test_queries_computed_outside_cache_lock(self, data_aggregator):
+        """Test that a query runs without holding the cache lock and its result is still cached."""
+        lock_held = []
+
+        def query():
+            lock_held.append(data_aggregator._cache_lock.locked())
+            return 42
+
+        assert data_aggregator._cached("answer", query) == 42
+        assert data_aggregator._cached("answer", query) == 42
+        assert lock_held == [False]
+
+    def test_parallel_analysis_matches_serial(self, mock_git_repo, mock_analyzers):
+        """Test that concurrent analyzer queries produce the same enhanced summary."""
+        mock_git_repo.repo = Mock()
+        mock_git_repo.repo.head.commit.hexsha = "a" * 40
+        mock_analyzers["commit_analyzer"].get_commit_velocity_analysis.return_value = {"avg_commits_per_week": 4.0}
+        mock_analyzers["commit_analyzer"].get_bug_fix_ratio_analysis.return_value = {"bug_fix_ratio": 10.0}
+        mock_analyzers["file_analyzer"].get_code_churn_analysis.return_value = {"overall_churn_rate": 2.0}
+        mock_analyzers["file_analyzer"].get_documentation_coverage_analysis.return_value = {"documentation_ratio": 30.0}
+        summaries = []
+        for parallel in (False, True):
+            aggregator = DataAggregator(mock_git_repo, parallel_analysis=parallel)
+            for name, analyzer in mock_analyzers.items():
+                setattr(aggregator, name, analyzer)
+            summaries.append(aggregator.get_enhanced_repository_summary())
+
+        assert summaries[1]["advanced_metrics"]["coverage_metrics"]["documentation_ratio"] == 30.0
+        assert summaries[0] == summaries[1]
+
+    def test_parallel_analysis_on_real_repository(self, real_git_repo):
+        """Test that concurrent queries on an on-disk repository finish and match the serial summary."""
+        serial = DataAggregator(real_git_repo).get_enhanced_repository_summary()
+        with patch(
+            "gitdecomposer.services.data_aggregator.call_on_new_handle", wraps=call_on_new_handle
+        ) as on_new_handle:
+            parallel = DataAggregator(real_git_repo, parallel_analysis=True).get_enhanced_repository_summary()
+
+        assert on_new_handle.call_count == 4
+        assert "error" not in serial
+        assert parallel["advanced_metrics"] == serial["advanced_metrics"]
+
     def test_get_repository_summary_basic(self, data_aggregator):
         """Test basic repository summary generation."""
         summary = data_aggregator.get_repository_summary()
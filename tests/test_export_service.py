@@ -46,6 +46,16 @@ class TestExportService:
         assert hasattr(service, "branch_analyzer")
         # Advanced metrics can be accessed via advanced_metrics module
 
+    def test_analyzers_created_on_first_access(self, export_service):
+        """Test that analyzers are built lazily and then reused."""
+        assert "file_analyzer" not in vars(export_service)
+        assert "legacy_advanced_metrics" not in vars(export_service)
+
+        file_analyzer = export_service.file_analyzer
+
+        assert export_service.file_analyzer is file_analyzer
+        assert "branch_analyzer" not in vars(export_service)
+
     def test_export_metrics_to_csv(self, export_service, temp_output_dir):
         """Test CSV export functionality."""
         csv_dir = os.path.join(temp_output_dir, "CSV")
@@ -70,6 +70,43 @@ class TestGitRepository(unittest.TestCase):
             for key in expected_keys:
                 self.assertIn(key, stats)
 
+    @patch("gitdecomposer.core.git_repository.Repo")
+    def test_repository_stats_counts_commits_with_rev_list(self, mock_repo):
+        """Test that commits are counted by git instead of being loaded one by one."""
+        mock_git_instance = Mock()
+        mock_git_instance.bare = False
+        mock_git_instance.git.rev_list.return_value = "42"
+        mock_repo.return_value = mock_git_instance
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stats = GitRepository(temp_dir).get_repository_stats()
+
+        self.assertEqual(stats["total_commits"], 42)
+        mock_git_instance.git.rev_list.assert_called_once_with("--all", "--count")
+        mock_git_instance.iter_commits.assert_not_called()
+
+    @patch("gitdecomposer.core.git_repository.Repo")
+    def test_commits_walked_once_until_refs_move(self, mock_repo):
+        """Test that repeated commit lookups share one history walk while the refs are unchanged."""
+        mock_git_instance = Mock()
+        mock_git_instance.git.rev_parse.return_value = "abc123"
+        mock_git_instance.iter_commits.side_effect = lambda *args, **kwargs: iter(["c2", "c1"])
+        mock_repo.return_value = mock_git_instance
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = GitRepository(temp_dir)
+            first = repo.get_all_commits()
+            first.append("mutated")
+            second = repo.get_all_commits()
+            self.assertEqual(mock_git_instance.iter_commits.call_count, 1)
+
+            mock_git_instance.git.rev_parse.return_value = "def456"
+            third = repo.get_all_commits()
+
+        self.assertEqual(second, ["c2", "c1"])
+        self.assertEqual(third, ["c2", "c1"])
+        self.assertEqual(mock_git_instance.iter_commits.call_count, 2)
+
 
 class TestGitDecomposerIntegration(unittest.TestCase):
     """Integration tests for GitDecomposer."""
@@ -108,6 +145,20 @@ class TestGitDecomposerIntegration(unittest.TestCase):
         for class_name in required_classes:
             self.assertTrue(hasattr(gitdecomposer, class_name), f"Missing class: {class_name}")
 
+    def test_cli_import_is_lazy(self):
+        """Test that importing the CLI does not load pandas or plotly."""
+        import subprocess
+
+        code = "import sys, gitdecomposer.cli; print('pandas' in sys.modules or 'plotly' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=str(Path(__file__).parent.parent),
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
 
 class TestAnalyzerClasses(unittest.TestCase):
     """Test analyzer classes with mocked data."""
@@ -23,6 +23,7 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from gitdecomposer.core.git_repository import GitRepository
+from gitdecomposer.services.advanced_report_generator import AdvancedReportGenerator
 from gitdecomposer.services.report_generator import ReportGenerator
 
 
@@ -104,6 +105,48 @@ class TestReportGenerator:
         # Advanced metrics can be accessed via advanced_metrics module
         assert hasattr(generator, "visualization")
 
+    def test_analyzers_created_on_first_access(self, mock_git_repo):
+        """Test that analyzers and generators are only built when first used."""
+        generator = ReportGenerator(mock_git_repo)
+        assert "file_analyzer" not in vars(generator)
+        assert "dashboard_generator" not in vars(generator)
+
+        dashboard_generator = generator.dashboard_generator
+
+        assert generator.dashboard_generator is dashboard_generator
+        assert "visualization" not in vars(generator)
+
+    def test_cache_dir_passed_to_advanced_reports(self, mock_git_repo, temp_output_dir):
+        """Test that the report cache directory reaches the advanced report generator."""
+        cache_dir = os.path.join(temp_output_dir, "cache")
+
+        assert ReportGenerator(mock_git_repo).advanced_report_generator.cache_dir is None
+        assert ReportGenerator(mock_git_repo, cache_dir=cache_dir).advanced_report_generator.cache_dir == cache_dir
+
+    @pytest.fixture
+    def bus_factor_analyzer(self):
+        """Patch the advanced metric analyzers to return a small bus factor result."""
+        analyzer = Mock()
+        analyzer.calculate.return_value = {"bus_factor": 3, "risk_level": "MEDIUM"}
+        with patch(
+            "gitdecomposer.services.advanced_report_generator._metric_analyzer_class",
+            return_value=Mock(return_value=analyzer),
+        ):
+            yield analyzer
+
+    def test_advanced_reports_written_before_listing(self, report_generator, temp_output_dir, bus_factor_analyzer):
+        """Test that advanced reports written in the background are on disk when listed."""
+        reports_created = report_generator.generate_all_visualizations(temp_output_dir)
+
+        assert os.path.exists(reports_created["bus_factor"])
+
+    def test_failed_advanced_report_not_listed(self, report_generator, temp_output_dir, bus_factor_analyzer):
+        """Test that an advanced report whose background write fails is not listed as generated."""
+        with patch.object(AdvancedReportGenerator, "_write_report", side_effect=OSError("disk full")):
+            reports_created = report_generator.generate_all_visualizations(temp_output_dir)
+
+        assert "bus_factor" not in reports_created
+
     def test_generate_all_reports(self, report_generator, temp_output_dir):
         """Test comprehensive report generation."""
         reports_created = report_generator.generate_all_visualizations(temp_output_dir)
@@ -290,6 +333,62 @@ class TestReportGenerator:
         # Verify navigation links
         assert "href=" in content
 
+    def test_generate_executive_summary_html_content(self, report_generator):
+        """Test that the executive summary page is filled in from the summaries."""
+        enhanced_summary = {"repository_health_score": 72.345, "repository_health_category": "Good"}
+        basic_summary = {
+            "commits": {"total_commits": 12345},
+            "contributors": {"total_contributors": 7},
+            "files": {"total_files": 1500},
+            "branches": {"total_branches": 4},
+        }
+        fig = go.Figure()
+
+        content = report_generator._generate_executive_summary_html(enhanced_summary, basic_summary, fig)
+
+        assert content.startswith("<!DOCTYPE html>")
+        assert "72.3/100" in content
+        assert "Repository Health: Good" in content
+        assert "12,345" in content
+        assert "1,500" in content
+        assert '<div id="chart"' in content
+        assert "cdn.plot.ly/plotly-" in content
+        assert "plotly-latest" not in content
+
+    def test_executive_summary_report_streams_same_html(self, report_generator, temp_output_dir):
+        """Test that the saved executive summary matches the in-memory HTML."""
+        enhanced_summary = {"repository_health_score": 50.0, "repository_health_category": "Fair"}
+        basic_summary = {"commits": {"total_commits": 10}}
+        save_path = os.path.join(temp_output_dir, "executive_summary.html")
+
+        with patch("gitdecomposer.services.data_aggregator.DataAggregator") as aggregator_cls:
+            aggregator_cls.return_value.get_enhanced_repository_summary.return_value = enhanced_summary
+            aggregator_cls.return_value.generate_repository_summary.return_value = basic_summary
+            fig = report_generator.create_executive_summary_report(save_path)
+
+        with open(save_path, "r", encoding="utf-8") as f:
+            saved = f.read()
+        assert saved == report_generator._generate_executive_summary_html(enhanced_summary, basic_summary, fig)
+
+    def test_comprehensive_report_streamed_to_disk(self, report_generator, temp_output_dir):
+        """Test that the comprehensive report is written straight to its output file."""
+        output_path = os.path.join(temp_output_dir, "reports", "comprehensive.html")
+
+        with patch("gitdecomposer.services.data_aggregator.DataAggregator") as aggregator_cls:
+            aggregator_cls.return_value.get_enhanced_repository_summary.return_value = {
+                "repository_health_score": 82.0,
+                "repository_health_category": "Good",
+            }
+            aggregator_cls.return_value.generate_repository_summary.return_value = {"commits": {"total_commits": 7}}
+            with patch.object(report_generator, "_generate_comprehensive_html") as generate_html:
+                assert report_generator.create_comprehensive_report(output_path) is True
+
+        generate_html.assert_not_called()
+        with open(output_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        assert content.rstrip().endswith("</html>")
+        assert "Good" in content
+
     def test_generate_csv_data_html_content(self, report_generator, temp_output_dir):
         """Test that generated CSV data HTML has proper structure."""
         csv_dir = os.path.join(temp_output_dir, "CSV")